@@ -0,0 +1,47 @@
+"""Validated vs trusted bulk decoding of server records.
+
+Usage: python -m benchmarks.bench_decode [records]
+"""
+import gc
+import sys
+import time
+
+from gpm_ssd.domain import Goal, GroupGoal, GroupProject, Topic
+
+
+def records(count: int) -> dict:
+    return {
+        'topics': [{'id': i, 'title': f'Topic {i % 50}'} for i in range(1, count + 1)],
+        'goals': [{'id': i, 'title': f'Goal {i}', 'description': f'Description of goal {i}', 'points': i % 5 + 1}
+                  for i in range(1, count + 1)],
+        'groups': [{'id': i, 'name': f'Group {i}', 'topic': i % 50 + 1, 'link_django': f'https://example.com/{i}',
+                    'link_tui': '', 'link_gui': ''} for i in range(1, count + 1)],
+        'group_goals': [{'id': i, 'group': i % 1000 + 1, 'goal': i % 300 + 1, 'complete': i % 3 == 0}
+                        for i in range(1, count + 1)],
+    }
+
+
+def timed(decode, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        entities = list(decode())
+        best = min(best, time.perf_counter() - start)
+        del entities
+    return best
+
+
+def main(count: int = 100_000):
+    payload = records(count)
+    # keep the collector from rescanning the fixture itself on every collection
+    gc.collect()
+    gc.freeze()
+    for name, cls in (('topics', Topic), ('goals', Goal), ('groups', GroupProject), ('group_goals', GroupGoal)):
+        validated = timed(lambda: cls.from_dicts(payload[name]))
+        trusted = timed(lambda: cls.from_dicts(payload[name], trust=True))
+        print(f'{count} {name}: validated {validated:7.2f} s, trusted {trusted:7.2f} s, '
+              f'speedup {validated / trusted:5.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:2]))
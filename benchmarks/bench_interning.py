@@ -0,0 +1,63 @@
+"""Bulk decoding with and without flyweight interning of repeated value objects.
+
+Titles are drawn from a small pool, points only range over 1-5 and most links
+are empty, as in real course data.
+
+Usage: python -m benchmarks.bench_interning [records] [distinct_titles]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from gpm_ssd.domain import Goal, GroupProject, Topic
+from gpm_ssd.interning import intern_caches, intern_stats
+
+
+def payloads(count: int, distinct: int) -> dict:
+    return {
+        Goal: [{'id': i, 'title': f'Goal {i % distinct}', 'description': '', 'points': i % 5 + 1}
+               for i in range(1, count + 1)],
+        GroupProject: [{'id': i, 'name': f'Group {i % distinct}', 'topic': i % 50 + 1, 'link_django': '',
+                        'link_tui': '', 'link_gui': ''} for i in range(1, count + 1)],
+        Topic: [{'id': i, 'title': f'Topic {i % distinct}'} for i in range(1, count + 1)],
+    }
+
+
+def measure(cls, records: list) -> tuple[float, float]:
+    gc.collect()
+    start = time.perf_counter()
+    entities = list(cls.from_dicts(records))
+    elapsed = time.perf_counter() - start
+    del entities
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = list(cls.from_dicts(records))
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del entities
+    return elapsed, retained / len(records)
+
+
+def run(data: dict, maxsize: int) -> dict:
+    for cache in intern_caches():
+        cache.clear()
+        cache.maxsize = maxsize
+    return {cls: measure(cls, records) for cls, records in data.items()}
+
+
+def main(count: int = 100_000, distinct: int = 500):
+    data = payloads(count, distinct)
+    without = run(data, maxsize=0)
+    with_interning = run(data, maxsize=4096)
+    print(f'{count} records, {distinct} distinct titles; without -> with interning')
+    for cls in data:
+        (t0, m0), (t1, m1) = without[cls], with_interning[cls]
+        print(f'{cls.__name__:>12}: {t0:5.2f} s -> {t1:5.2f} s, {m0:6.1f} -> {m1:6.1f} bytes/entity')
+    for name, stats in intern_stats().items():
+        print(f'{name:>12}: hit rate {stats.hit_rate:6.1%} ({stats.hits} hits, {stats.misses} misses)')
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:3]))
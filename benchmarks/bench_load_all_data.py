@@ -0,0 +1,36 @@
+"""Serial vs concurrent DataLoader.load_all_data against a local fake server.
+
+Usage: python -m benchmarks.bench_load_all_data [latency_seconds] [rounds]
+"""
+import sys
+import time
+
+import requests
+
+from benchmarks.fake_server import FakeServer, sample_payloads
+from gpm_ssd.domain import GPM
+from gpm_ssd.managers import DataLoader
+
+
+def time_load(base_url: str, max_workers: int, rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        loader = DataLoader(base_url, GPM(), max_workers=max_workers)
+        with requests.Session() as session:
+            start = time.perf_counter()
+            loader.load_all_data(session, {})
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(latency: float = 0.1, rounds: int = 3):
+    with FakeServer(sample_payloads(), latency=latency) as server:
+        serial = time_load(server.base_url, 1, rounds)
+        concurrent = time_load(server.base_url, 4, rounds)
+    print(f'latency per request: {latency * 1000:.0f} ms')
+    print(f'serial:     {serial * 1000:8.1f} ms')
+    print(f'concurrent: {concurrent * 1000:8.1f} ms  ({serial / concurrent:.1f}x)')
+
+
+if __name__ == '__main__':
+    main(*(float(a) for a in sys.argv[1:2]), *(int(a) for a in sys.argv[2:3]))
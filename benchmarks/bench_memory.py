@@ -0,0 +1,103 @@
+"""Bytes retained per decoded entity, for each GPM collection, before and after slots.
+
+The "before" column decodes into equivalent dict-backed dataclasses defined below,
+one value-object instance per field as the domain did before slots and interning;
+the "after" column uses the current domain classes. The payload is built before
+measuring, so only the domain objects (and the wrappers around their strings) are
+counted, not the decoded JSON itself.
+
+Usage: python -m benchmarks.bench_memory [records]
+"""
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+from benchmarks.fake_server import sample_payloads
+from gpm_ssd.domain import Goal, GroupGoal, GroupProject, Topic
+
+
+@dataclass(frozen=True)
+class _Value:
+    value: object
+
+
+@dataclass(frozen=True)
+class _Topic:
+    title: _Value
+    id: int | None
+
+
+@dataclass(frozen=True)
+class _Goal:
+    title: _Value
+    description: _Value
+    points: _Value
+    id: int | None
+
+
+@dataclass(frozen=True)
+class _GroupProject:
+    name: _Value
+    topic_id: int
+    link_django: _Value
+    link_tui: _Value
+    link_gui: _Value
+    id: int | None
+
+
+@dataclass(frozen=True)
+class _GroupGoal:
+    group_id: int
+    goal_id: int
+    complete: bool
+    id: int | None
+
+
+def _baseline_topic(data: dict) -> _Topic:
+    return _Topic(_Value(data['title']), data.get('id'))
+
+
+def _baseline_goal(data: dict) -> _Goal:
+    return _Goal(_Value(data['title']), _Value(data['description']), _Value(data['points']), data.get('id'))
+
+
+def _baseline_group(data: dict) -> _GroupProject:
+    return _GroupProject(_Value(data['name']), data['topic'], _Value(data.get('link_django', '')),
+                         _Value(data.get('link_tui', '')), _Value(data.get('link_gui', '')), data.get('id'))
+
+
+def _baseline_group_goal(data: dict) -> _GroupGoal:
+    return _GroupGoal(data['group'], data['goal'], data.get('complete', False), data.get('id'))
+
+
+COLLECTIONS = (
+    ('groups/', GroupProject, _baseline_group),
+    ('goals/', Goal, _baseline_goal),
+    ('topics/', Topic, _baseline_topic),
+    ('group-goals/', GroupGoal, _baseline_group_goal),
+)
+
+
+def retained(decode, records: list) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = list(decode(records))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / len(records)
+
+
+def main(records: int = 50_000):
+    payloads = sample_payloads(groups=records, goals=records, topics=records)
+    print(f"{'':>12}  {'before':>8}  {'after':>8}  (bytes/entity)")
+    for path, cls, baseline in COLLECTIONS:
+        before = retained(lambda rs: map(baseline, rs), payloads[path])
+        after = retained(cls.from_dicts, payloads[path])
+        print(f'{cls.__name__:>12}: {before:8.1f}  {after:8.1f}')
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:2]))
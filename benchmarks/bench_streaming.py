@@ -0,0 +1,48 @@
+"""Peak RSS of buffered vs streamed decoding of a large goals/ response.
+
+Each mode runs in its own interpreter so ru_maxrss is not shared between them.
+Usage: python -m benchmarks.bench_streaming [records]
+"""
+import resource
+import subprocess
+import sys
+import time
+
+import requests
+
+from benchmarks.fake_server import FakeServer
+from gpm_ssd.domain import GPM
+from gpm_ssd.managers import DataLoader
+
+
+def goals_payload(records: int) -> list[dict]:
+    return [
+        {'id': i, 'title': f'Goal {i}', 'description': f'Description of goal number {i}', 'points': i % 5 + 1}
+        for i in range(1, records + 1)
+    ]
+
+
+def child(base_url: str, mode: str):
+    loader = DataLoader(base_url, GPM())
+    loader.stream_threshold = 0 if mode == 'streamed' else float('inf')
+    start = time.perf_counter()
+    with requests.Session() as session:
+        loader._load_goals(session, {})
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f'{mode:9} goals={loader.gpm.number_of_goals} time={elapsed:6.1f}s '
+          f'peak RSS={peak / 1024:7.1f} MiB')
+
+
+def main(records: int = 200_000):
+    with FakeServer({'goals/': goals_payload(records)}) as server:
+        for mode in ('buffered', 'streamed'):
+            subprocess.run([sys.executable, '-m', 'benchmarks.bench_streaming', '--child', server.base_url, mode],
+                           check=True)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(*sys.argv[2:4])
+    else:
+        main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,36 @@
+"""Cold vs warm (snapshot) login latency against a local fake server.
+
+Usage: python -m benchmarks.bench_warm_start [latency_seconds] [records]
+"""
+import sys
+import tempfile
+
+import requests
+
+from benchmarks.fake_server import FakeServer, sample_payloads
+from gpm_ssd.domain import GPM
+from gpm_ssd.managers import DataLoader, SnapshotStore
+
+
+def login(base_url: str, store: SnapshotStore) -> DataLoader:
+    loader = DataLoader(base_url, GPM(), snapshot_store=store)
+    with requests.Session() as session:
+        loader.load_for_user(session, {}, 'bench')
+        loader.wait_for_refresh()
+    return loader
+
+
+def main(latency: float = 0.1, records: int = 2000):
+    payloads = sample_payloads(groups=records, goals=records, topics=records // 10)
+    with FakeServer(payloads, latency=latency) as server, tempfile.TemporaryDirectory() as directory:
+        store = SnapshotStore(directory)
+        cold = login(server.base_url, store).last_load
+        warm = login(server.base_url, store).last_load
+    print(f'latency per request: {latency * 1000:.0f} ms, {records} groups/goals')
+    print(f'cold start: usable after {cold.ready_after * 1000:8.1f} ms')
+    print(f'warm start: usable after {warm.ready_after * 1000:8.1f} ms, '
+          f'refreshed after {warm.refreshed_after * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*(float(a) for a in sys.argv[1:2]), *(int(a) for a in sys.argv[2:3]))
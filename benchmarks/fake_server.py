@@ -0,0 +1,81 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def sample_payloads(groups: int = 50, goals: int = 50, topics: int = 10) -> dict:
+    return {
+        'auth/user/': {'pk': 1},
+        'group-users/': [{'id': 1, 'user': 1, 'group': 1}],
+        'groups/': [
+            {'id': i, 'name': f'Group {i}', 'topic': i % topics + 1, 'link_django': '', 'link_tui': '', 'link_gui': ''}
+            for i in range(1, groups + 1)
+        ],
+        'goals/': [
+            {'id': i, 'title': f'Goal {i}', 'description': f'Description {i}', 'points': i % 5 + 1}
+            for i in range(1, goals + 1)
+        ],
+        'topics/': [{'id': i, 'title': f'Topic {i}'} for i in range(1, topics + 1)],
+        'group-goals/': [
+            {'id': i, 'group': i % groups + 1, 'goal': i % goals + 1, 'complete': i % 2 == 0}
+            for i in range(1, groups + 1)
+        ],
+    }
+
+
+class FakeServer:
+    """Serves canned JSON payloads under /api/v1/ with an artificial per-request latency."""
+
+    def __init__(self, payloads: dict, latency: float = 0.0):
+        self.payloads = payloads
+        self.latency = latency
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.requests += 1
+                time.sleep(server.latency)
+                path = self.path.split('?', 1)[0].removeprefix('/api/v1/')
+                if path not in server.payloads:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = json.dumps(server.payloads[path]).encode()
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.__httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.__thread = threading.Thread(target=self.__httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.__httpd.server_address[:2]
+        return f'http://{host}:{port}/api/v1/'
+
+    def __enter__(self) -> 'FakeServer':
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
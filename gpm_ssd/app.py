@@ -1,15 +1,23 @@
 import sys
 import traceback
+from typing import Callable
+
+import requests
 
 from gpm_ssd.domain import GPM
 from gpm_ssd.menu import Menu, Entry, Description
+from gpm_ssd.progress import ProgressTracker
+from gpm_ssd.views import GroupGoalRows
 from gpm_ssd.managers import (
+    ApiClient,
     AuthHandler,
     DataLoader,
     GroupsManager,
     GoalsManager,
     TopicsManager,
-    GroupGoalsManager
+    GroupGoalsManager,
+    Pager,
+    SnapshotStore
 )
 
 
@@ -18,12 +26,16 @@ class App:
 
     def __init__(self):
         self.__gpm = GPM()
-        self.__auth = AuthHandler(self.__base_url)
-        self.__data_loader = DataLoader(self.__base_url, self.__gpm)
-        self.__groups_mgr = GroupsManager(self.__base_url, self.__gpm, self.__data_loader)
-        self.__goals_mgr = GoalsManager(self.__base_url, self.__gpm, self.__data_loader)
-        self.__topics_mgr = TopicsManager(self.__base_url, self.__gpm, self.__data_loader)
-        self.__group_goals_mgr = GroupGoalsManager(self.__base_url, self.__gpm, self.__data_loader)
+        self.__api = ApiClient(self.__base_url)
+        self.__auth = AuthHandler(self.__api)
+        self.__data_loader = DataLoader(self.__base_url, self.__gpm, snapshot_store=SnapshotStore(), api=self.__api)
+        self.__groups_mgr = GroupsManager(self.__api, self.__gpm, self.__data_loader)
+        self.__goals_mgr = GoalsManager(self.__api, self.__gpm, self.__data_loader)
+        self.__topics_mgr = TopicsManager(self.__api, self.__gpm, self.__data_loader)
+        self.__progress = ProgressTracker(self.__gpm)
+        self.__group_goal_rows = GroupGoalRows(self.__gpm)
+        self.__group_goals_mgr = GroupGoalsManager(self.__api, self.__gpm, self.__data_loader,
+                                                   self.__progress, self.__group_goal_rows)
 
         self.__menu = Menu.Builder(Description('Group Project Manager'), auto_select=lambda: self.__print_main_view()) \
             .with_entry(Entry.create('1', 'Login', on_selected=lambda: self.__login())) \
@@ -32,6 +44,7 @@ class App:
             .with_entry(Entry.create('4', 'Manage Topics', on_selected=lambda: self.__manage_topics())) \
             .with_entry(Entry.create('5', 'Manage Group Goals', on_selected=lambda: self.__manage_group_goals())) \
             .with_entry(Entry.create('6', 'Logout', on_selected=lambda: self.__logout())) \
+            .with_entry(Entry.create('7', 'Sync', on_selected=lambda: self.__sync())) \
             .with_entry(Entry.create('0', 'Exit', on_selected=lambda: print('Bye!'), is_exit=True)) \
             .build()
 
@@ -39,15 +52,60 @@ class App:
         self.__auth.login(self.__load_data)
 
     def __logout(self) -> None:
-        self.__auth.logout(self.__data_loader.clear_all)
+        try:
+            self.__auth.logout(self.__data_loader.clear_all)
+        except requests.RequestException as e:
+            print(f"Network error: {e}")
 
     def __load_data(self) -> None:
-        self.__auth.user_id = self.__data_loader.load_all_data(
+        self.__auth.user_id = self.__data_loader.load_for_user(
             self.__auth.session, 
-            self.__auth.get_headers()
+            self.__auth.get_headers(),
+            self.__auth.username
         )
+        report = self.__data_loader.last_load
+        print(f"Data ready in {report.ready_after * 1000:.0f} ms ({report.mode} start)")
+
+    def __sync(self) -> None:
+        if not self.__auth.is_authenticated():
+            print("You must login first")
+            return
+
+        try:
+            report = self.__data_loader.sync(self.__auth.session, self.__auth.get_headers())
+        except requests.RequestException as e:
+            print(f"Network error: {e}")
+            return
+        print(f"Sync complete: {report.inserted} added, {report.updated} updated, {report.deleted} removed")
+
+    def __apply_background_refresh(self) -> None:
+        if self.__data_loader.apply_pending_refresh():
+            self.__auth.user_id = self.__data_loader.user_id
+            report = self.__data_loader.last_load
+            print(f"Data refreshed from server in {report.refreshed_after * 1000:.0f} ms")
+
+    def __backend(self, action: Callable[[requests.Session, dict], None]) -> Callable[[], None]:
+        def on_selected() -> None:
+            try:
+                action(self.__auth.session, self.__auth.get_headers())
+            except requests.RequestException as e:
+                print(f"Network error: {e}")
+        return on_selected
+
+    def __view(self, render: Callable[[], None]) -> Callable[[], None]:
+        def auto_select() -> None:
+            self.__apply_background_refresh()
+            render()
+        return auto_select
+
+    @staticmethod
+    def __with_paging(builder: Menu.Builder, pager: Pager) -> Menu.Builder:
+        builder = builder.with_entry(Entry.create('n', 'Next Page', on_selected=pager.next_page))
+        builder = builder.with_entry(Entry.create('p', 'Previous Page', on_selected=pager.prev_page))
+        return builder.with_entry(Entry.create('j', 'Jump to Page', on_selected=pager.jump))
 
     def __print_main_view(self) -> None:
+        self.__apply_background_refresh()
         if self.__auth.is_authenticated():
             print(f"\n{'='*80}")
             print(f"Groups: {self.__gpm.number_of_groups} | Goals: {self.__gpm.number_of_goals} | Topics: {self.__gpm.number_of_topics} ")
@@ -61,15 +119,16 @@ class App:
             print("You must login first")
             return
         
-        builder = Menu.Builder(Description('Manage Groups'), auto_select=lambda: self.__groups_mgr.print_groups())
-        builder = builder.with_entry(Entry.create('1', 'Add Group', on_selected=lambda: self.__groups_mgr.add_group(self.__auth.session, self.__auth.get_headers())))
-        builder = builder.with_entry(Entry.create('2', 'Join Group', on_selected=lambda: self.__groups_mgr.join_group(self.__auth.session, self.__auth.get_headers())))
-        builder = builder.with_entry(Entry.create('3', 'Leave Group', on_selected=lambda: self.__groups_mgr.leave_group(self.__auth.session, self.__auth.get_headers())))
+        builder = Menu.Builder(Description('Manage Groups'), auto_select=self.__view(self.__groups_mgr.print_groups))
+        builder = builder.with_entry(Entry.create('1', 'Add Group', on_selected=self.__backend(self.__groups_mgr.add_group)))
+        builder = builder.with_entry(Entry.create('2', 'Join Group', on_selected=self.__backend(self.__groups_mgr.join_group)))
+        builder = builder.with_entry(Entry.create('3', 'Leave Group', on_selected=self.__backend(self.__groups_mgr.leave_group)))
         
-        if self.__auth.is_staff():
-            builder = builder.with_entry(Entry.create('4', 'Remove Group', on_selected=lambda: self.__groups_mgr.remove_group(self.__auth.session, self.__auth.get_headers())))
+        if self.__auth.permissions.is_staff:
+            builder = builder.with_entry(Entry.create('4', 'Remove Group', on_selected=self.__backend(self.__groups_mgr.remove_group)))
             builder = builder.with_entry(Entry.create('5', 'Sort by Name', on_selected=lambda: self.__groups_mgr.sort_groups()))
         
+        builder = self.__with_paging(builder, self.__groups_mgr.pager)
         builder = builder.with_entry(Entry.create('0', 'Back', on_selected=lambda: None, is_exit=True))
         builder.build().run()
 
@@ -78,15 +137,16 @@ class App:
             print("You must login first")
             return
         
-        builder = Menu.Builder(Description('Manage Goals'), auto_select=lambda: self.__goals_mgr.print_goals())
+        builder = Menu.Builder(Description('Manage Goals'), auto_select=self.__view(self.__goals_mgr.print_goals))
         
-        if self.__auth.is_staff():
-            builder = builder.with_entry(Entry.create('1', 'Add Goal', on_selected=lambda: self.__goals_mgr.add_goal(self.__auth.session, self.__auth.get_headers())))
-            builder = builder.with_entry(Entry.create('2', 'Remove Goal', on_selected=lambda: self.__goals_mgr.remove_goal(self.__auth.session, self.__auth.get_headers())))
+        if self.__auth.permissions.is_staff:
+            builder = builder.with_entry(Entry.create('1', 'Add Goal', on_selected=self.__backend(self.__goals_mgr.add_goal)))
+            builder = builder.with_entry(Entry.create('2', 'Remove Goal', on_selected=self.__backend(self.__goals_mgr.remove_goal)))
             builder = builder.with_entry(Entry.create('3', 'Sort by Points', on_selected=lambda: self.__goals_mgr.sort_goals()))
         else:
             builder = builder.with_entry(Entry.create('1', 'Sort by Points', on_selected=lambda: self.__goals_mgr.sort_goals()))
         
+        builder = self.__with_paging(builder, self.__goals_mgr.pager)
         builder = builder.with_entry(Entry.create('0', 'Back', on_selected=lambda: None, is_exit=True))
         builder.build().run()
 
@@ -95,15 +155,16 @@ class App:
             print("You must login first")
             return
         
-        builder = Menu.Builder(Description('Manage Topics'), auto_select=lambda: self.__topics_mgr.print_topics())
+        builder = Menu.Builder(Description('Manage Topics'), auto_select=self.__view(self.__topics_mgr.print_topics))
         
-        if self.__auth.is_staff():
-            builder = builder.with_entry(Entry.create('1', 'Add Topic', on_selected=lambda: self.__topics_mgr.add_topic(self.__auth.session, self.__auth.get_headers())))
-            builder = builder.with_entry(Entry.create('2', 'Remove Topic', on_selected=lambda: self.__topics_mgr.remove_topic(self.__auth.session, self.__auth.get_headers())))
+        if self.__auth.permissions.is_staff:
+            builder = builder.with_entry(Entry.create('1', 'Add Topic', on_selected=self.__backend(self.__topics_mgr.add_topic)))
+            builder = builder.with_entry(Entry.create('2', 'Remove Topic', on_selected=self.__backend(self.__topics_mgr.remove_topic)))
             builder = builder.with_entry(Entry.create('3', 'Sort by Title', on_selected=lambda: self.__topics_mgr.sort_topics()))
         else:
             builder = builder.with_entry(Entry.create('1', 'Sort by Title', on_selected=lambda: self.__topics_mgr.sort_topics()))
         
+        builder = self.__with_paging(builder, self.__topics_mgr.pager)
         builder = builder.with_entry(Entry.create('0', 'Back', on_selected=lambda: None, is_exit=True))
         builder.build().run()
 
@@ -112,13 +173,15 @@ class App:
             print("You must login first")
             return
         
-        builder = Menu.Builder(Description('Manage Group Goals'), auto_select=lambda: self.__group_goals_mgr.print_group_goals())
+        builder = Menu.Builder(Description('Manage Group Goals'), auto_select=self.__view(self.__group_goals_mgr.print_group_goals))
         
-        if self.__auth.is_staff():
-            builder = builder.with_entry(Entry.create('1', 'Assign Goal to Group', on_selected=lambda: self.__group_goals_mgr.add_group_goal(self.__auth.session, self.__auth.get_headers())))
-            builder = builder.with_entry(Entry.create('2', 'Remove Goal from Group', on_selected=lambda: self.__group_goals_mgr.remove_group_goal(self.__auth.session, self.__auth.get_headers())))
-            builder = builder.with_entry(Entry.create('3', 'Toggle Goal Completion', on_selected=lambda: self.__group_goals_mgr.toggle_group_goal(self.__auth.session, self.__auth.get_headers())))
+        if self.__auth.permissions.is_staff:
+            builder = builder.with_entry(Entry.create('1', 'Assign Goal to Group', on_selected=self.__backend(self.__group_goals_mgr.add_group_goal)))
+            builder = builder.with_entry(Entry.create('2', 'Remove Goal from Group', on_selected=self.__backend(self.__group_goals_mgr.remove_group_goal)))
+            builder = builder.with_entry(Entry.create('3', 'Toggle Goal Completion', on_selected=self.__backend(self.__group_goals_mgr.toggle_group_goal)))
         
+        builder = builder.with_entry(Entry.create('4', 'Leaderboard', on_selected=lambda: self.__group_goals_mgr.print_leaderboard()))
+        builder = self.__with_paging(builder, self.__group_goals_mgr.pager)
         builder = builder.with_entry(Entry.create('0', 'Back', on_selected=lambda: None, is_exit=True))
         builder.build().run()
 
@@ -1,13 +1,21 @@
+import gc
 import re
 import json
 import base64
+from itertools import islice
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass, InitVar, field
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
 
 from valid8 import validate
 
+from gpm_ssd.events import (
+    GROUPS, GOALS, TOPICS, GROUP_GOALS, EventBus, Inserted, Removed, Replaced, Reordered, Cleared
+)
+from gpm_ssd.interning import InternCache
+from gpm_ssd.registry import OrderedRegistry, RegistryView
+from validation.constraints import constraint
 from validation.dataclasses import validate_dataclass
-from validation.regex import pattern
 
 
 def decode_base64url(part: str) -> bytes:
@@ -24,22 +32,104 @@ def decode_jwt_payload(token: str) -> dict:
     return json.loads(payload_bytes)
 
 
-@dataclass(frozen=True)
+T = TypeVar('T')
+
+_PRINTABLE_ASCII = r'^[\x20-\x7E]*$'
+_TITLE = constraint('value', min_len=1, max_len=100, regex=_PRINTABLE_ASCII)
+_DESCRIPTION = constraint('value', min_len=0, max_len=400)
+_LINK = constraint('value', min_len=0, max_len=200)
+_POINTS = constraint('value', min_value=1, max_value=5)
+_POINTS_TEXT = constraint('value', regex=r'[1-5]')
+_ID = constraint('id', min_value=1)
+_TOPIC_ID = constraint('topic_id', min_value=1)
+_GROUP_ID = constraint('group_id', min_value=1)
+_GOAL_ID = constraint('goal_id', min_value=1)
+_USER_ID = constraint('user_id', min_value=1)
+
+_GROUP_NAMES: InternCache['GroupName'] = InternCache('GroupName', str)
+_TOPIC_TITLES: InternCache['TopicTitle'] = InternCache('TopicTitle', str)
+_GOAL_TITLES: InternCache['GoalTitle'] = InternCache('GoalTitle', str)
+_POINTS_VALUES: InternCache['Points'] = InternCache('Points', int)
+_LINKS: InternCache['Link'] = InternCache('Link', str)
+
+
+def _decode_all(from_dict: Callable[[dict], T], iterable: Iterable[dict],
+                on_error: Callable[[dict, Exception], None] | None) -> Iterator[T]:
+    for data in iterable:
+        try:
+            entity = from_dict(data)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(data, e)
+            continue
+        yield entity
+
+
+_TRUSTED_BATCH = 4096
+
+
+def _decode_trusted(build: Callable[[list[dict], dict], list[T] | None], from_dict: Callable[[dict], T],
+                    iterable: Iterable[dict], on_error: Callable[[dict, Exception], None] | None) -> Iterator[T]:
+    # ``build`` checks the schema of a whole batch while constructing it and returns None if any
+    # record is off-schema; such a batch is decoded again with full validation, record by record.
+    records = iter(iterable)
+    interned: dict[type, dict] = {}
+    while batch := list(islice(records, _TRUSTED_BATCH)):
+        collecting = gc.isenabled()
+        gc.disable()  # a batch allocates only acyclic objects, so collections during it find nothing
+        try:
+            entities = build(batch, interned)
+        finally:
+            if collecting:
+                gc.enable()
+        if entities is None:
+            yield from _decode_all(from_dict, batch, on_error)
+        else:
+            yield from entities
+
+
+def _setters(cls: type, *names: str) -> tuple[Callable[[Any, Any], None], ...]:
+    # slot member descriptors: assigning through them skips __init__, __post_init__ and frozen __setattr__
+    return tuple(getattr(cls, name).__set__ for name in names)
+
+
+@dataclass(frozen=True, slots=True)
+class TokenClaims:
+    token_type: str
+    exp: int
+    is_staff: bool = False
+    user_id: int | None = None
+
+    @staticmethod
+    def from_payload(payload: dict) -> 'TokenClaims':
+        user_id = payload.get('user_id')
+        return TokenClaims(
+            token_type=payload['token_type'],
+            exp=payload['exp'],
+            is_staff=payload.get('is_staff') is True,
+            user_id=user_id if type(user_id) is int else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class Token:
     access: str
     refresh: str
     create_key: InitVar[Any] = field(default=None)
+    claims: TokenClaims | None = field(default=None, init=False, repr=False, compare=False)
     
     __create_key = object()
     
     def __post_init__(self, create_key: Any):
         validate("create_key", create_key, equals=Token.__create_key)
         validate_dataclass(self)
-        Token.__validate_token("access token", self.access)
+        payload = Token.__validate_token("access token", self.access)
         Token.__validate_token("refresh token", self.refresh)
+        object.__setattr__(self, 'claims', TokenClaims.from_payload(payload))
     
     @staticmethod
-    def __validate_token(name: str, token: str):
+    def __validate_token(name: str, token: str) -> dict:
         validate(name, token, instance_of=str)
         token_parts = token.split(".")
         validate(name + " parts", token_parts, length=3)
@@ -67,17 +157,11 @@ class Token:
         validate(name + " payload.exp", payload.get("exp"), instance_of=int)
 
         validate(name + " signature length", signature_b64, min_len=1)
-        decode_base64url(signature_b64)  
-    
+        decode_base64url(signature_b64)
+        return payload
+
     def is_staff(self) -> bool:
-        try:
-            payload_b64 = self.access.split(".")[1]
-            padding = "=" * (-len(payload_b64) % 4)
-            payload_bytes = base64.urlsafe_b64decode(payload_b64 + padding)
-            payload = json.loads(payload_bytes)
-            return payload.get("is_staff", False)
-        except Exception:
-            return False
+        return self.claims.is_staff
     
     @staticmethod
     def from_response(response_json: dict) -> 'Token':
@@ -85,56 +169,77 @@ class Token:
         refresh = response_json.get('refresh')
         return Token(access, refresh, Token.__create_key)
 
+    def refreshed(self, response_json: dict) -> 'Token':
+        access = response_json.get('access')
+        refresh = response_json.get('refresh', self.refresh)
+        return Token(access, refresh, Token.__create_key)
+
+    @property
+    def access_expires_at(self) -> int:
+        return self.claims.exp
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True, weakref_slot=True)
 class GroupName:
     value: str
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=1, max_len=100, custom=pattern(r'^[\x20-\x7E]*$'))
+        _TITLE(self.value)
 
     def __str__(self):
         return self.value
 
+    @staticmethod
+    def of(value: str) -> 'GroupName':
+        return _GROUP_NAMES.get(value, GroupName)
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True, weakref_slot=True)
 class TopicTitle:
     value: str
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=1, max_len=100, custom=pattern(r'^[\x20-\x7E]*$'))
+        _TITLE(self.value)
 
     def __str__(self):
         return self.value
 
+    @staticmethod
+    def of(value: str) -> 'TopicTitle':
+        return _TOPIC_TITLES.get(value, TopicTitle)
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True, weakref_slot=True)
 class GoalTitle:
     value: str
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=1, max_len=100, custom=pattern(r'^[\x20-\x7E]*$'))
+        _TITLE(self.value)
 
     def __str__(self):
         return self.value
 
+    @staticmethod
+    def of(value: str) -> 'GoalTitle':
+        return _GOAL_TITLES.get(value, GoalTitle)
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class GoalDescription:
     value: str
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=0, max_len=400)
+        _DESCRIPTION(self.value)
 
     def __str__(self):
         return self.value
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True, weakref_slot=True)
 class Points:
     value: int
     create_key: InitVar[Any] = field(default=None)
@@ -144,34 +249,42 @@ class Points:
     def __post_init__(self, create_key):
         validate('create_key', create_key, equals=self.__create_key)
         validate_dataclass(self)
-        validate('value', self.value, min_value=1, max_value=5)
+        _POINTS(self.value)
 
     def __str__(self):
         return str(self.value)
 
     @staticmethod
     def create(points: int) -> 'Points':
+        return _POINTS_VALUES.get(points, Points.__build)
+
+    @staticmethod
+    def __build(points: int) -> 'Points':
         return Points(points, Points.__create_key)
 
     @staticmethod
     def parse(value: str) -> 'Points':
-        validate('value', value, custom=pattern(r'[1-5]'))
+        _POINTS_TEXT(value)
         return Points.create(int(value))
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True, weakref_slot=True)
 class Link:
     value: str
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=0, max_len=200)
+        _LINK(self.value)
 
     def __str__(self):
         return self.value
 
+    @staticmethod
+    def of(value: str) -> 'Link':
+        return _LINKS.get(value, Link)
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Topic:
     title: TopicTitle
     id: int | None = None
@@ -179,7 +292,7 @@ class Topic:
     def __post_init__(self):
         validate_dataclass(self)
         if self.id is not None:
-            validate('id', self.id, min_value=1)
+            _ID(self.id)
 
     def to_dict(self):
         return {
@@ -189,12 +302,19 @@ class Topic:
     @staticmethod
     def from_dict(data: dict) -> 'Topic':
         return Topic(
-            title=TopicTitle(data['title']),
+            title=TopicTitle.of(data['title']),
             id=data.get('id')
         )
 
+    @staticmethod
+    def from_dicts(iterable: Iterable[dict], trust: bool = False,
+                   on_error: Callable[[dict, Exception], None] | None = None) -> Iterator['Topic']:
+        if trust:
+            return _decode_trusted(_build_topics, Topic.from_dict, iterable, on_error)
+        return _decode_all(Topic.from_dict, iterable, on_error)
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Goal:
     title: GoalTitle
     description: GoalDescription
@@ -204,7 +324,7 @@ class Goal:
     def __post_init__(self):
         validate_dataclass(self)
         if self.id is not None:
-            validate('id', self.id, min_value=1)
+            _ID(self.id)
 
     def to_dict(self):
         return {
@@ -216,27 +336,34 @@ class Goal:
     @staticmethod
     def from_dict(data: dict) -> 'Goal':
         return Goal(
-            title=GoalTitle(data['title']),
+            title=GoalTitle.of(data['title']),
             description=GoalDescription(data['description']),
             points=Points.create(data['points']),
             id=data.get('id')
         )
 
+    @staticmethod
+    def from_dicts(iterable: Iterable[dict], trust: bool = False,
+                   on_error: Callable[[dict, Exception], None] | None = None) -> Iterator['Goal']:
+        if trust:
+            return _decode_trusted(_build_goals, Goal.from_dict, iterable, on_error)
+        return _decode_all(Goal.from_dict, iterable, on_error)
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class GroupProject:
     name: GroupName
     topic_id: int
-    link_django: Link = field(default_factory=lambda: Link(""))
-    link_tui: Link = field(default_factory=lambda: Link(""))
-    link_gui: Link = field(default_factory=lambda: Link(""))
+    link_django: Link = field(default_factory=lambda: Link.of(""))
+    link_tui: Link = field(default_factory=lambda: Link.of(""))
+    link_gui: Link = field(default_factory=lambda: Link.of(""))
     id: int | None = None
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('topic_id', self.topic_id, min_value=1)
+        _TOPIC_ID(self.topic_id)
         if self.id is not None:
-            validate('id', self.id, min_value=1)
+            _ID(self.id)
 
     def to_dict(self):
         return {
@@ -250,16 +377,23 @@ class GroupProject:
     @staticmethod
     def from_dict(data: dict) -> 'GroupProject':
         return GroupProject(
-            name=GroupName(data['name']),
+            name=GroupName.of(data['name']),
             topic_id=data['topic'],
-            link_django=Link(data.get('link_django', '')),
-            link_tui=Link(data.get('link_tui', '')),
-            link_gui=Link(data.get('link_gui', '')),
+            link_django=Link.of(data.get('link_django', '')),
+            link_tui=Link.of(data.get('link_tui', '')),
+            link_gui=Link.of(data.get('link_gui', '')),
             id=data.get('id')
         )
 
+    @staticmethod
+    def from_dicts(iterable: Iterable[dict], trust: bool = False,
+                   on_error: Callable[[dict, Exception], None] | None = None) -> Iterator['GroupProject']:
+        if trust:
+            return _decode_trusted(_build_groups, GroupProject.from_dict, iterable, on_error)
+        return _decode_all(GroupProject.from_dict, iterable, on_error)
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class GroupGoal:
     group_id: int
     goal_id: int
@@ -268,10 +402,10 @@ class GroupGoal:
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('group_id', self.group_id, min_value=1)
-        validate('goal_id', self.goal_id, min_value=1)
+        _GROUP_ID(self.group_id)
+        _GOAL_ID(self.goal_id)
         if self.id is not None:
-            validate('id', self.id, min_value=1)
+            _ID(self.id)
 
     def to_dict(self):
         return {
@@ -289,8 +423,131 @@ class GroupGoal:
             id=data.get('id')
         )
 
-
-@dataclass(frozen=True, order=True)
+    @staticmethod
+    def from_dicts(iterable: Iterable[dict], trust: bool = False,
+                   on_error: Callable[[dict, Exception], None] | None = None) -> Iterator['GroupGoal']:
+        if trust:
+            return _decode_trusted(_build_group_goals, GroupGoal.from_dict, iterable, on_error)
+        return _decode_all(GroupGoal.from_dict, iterable, on_error)
+
+
+_NEW = object.__new__
+_TOPIC_SETTERS = _setters(Topic, 'title', 'id')
+_GOAL_SETTERS = _setters(Goal, 'title', 'description', 'points', 'id')
+_GROUP_SETTERS = _setters(GroupProject, 'name', 'topic_id', 'link_django', 'link_tui', 'link_gui', 'id')
+_GROUP_GOAL_SETTERS = _setters(GroupGoal, 'group_id', 'goal_id', 'complete', 'id')
+_POINTS_BY_VALUE = {points: Points.create(points) for points in range(1, 6)}
+
+# The builders below mirror the _TITLE, _DESCRIPTION, _LINK, _POINTS and id constraints inline;
+# a title is printable ASCII, which is what str.isascii() and str.isprintable() accept together.
+# Value objects are shared within one decode call, as interning would share them.
+
+
+def _build_topics(batch: list[dict], interned: dict) -> list[Topic] | None:
+    titles = interned.setdefault(TopicTitle, {})
+    set_title, set_id = _TOPIC_SETTERS
+    set_value = TopicTitle.value.__set__
+    topics = []
+    for data in batch:
+        if type(data) is not dict:
+            return None
+        title, id = data.get('title'), data.get('id')
+        if not (type(title) is str and 0 < len(title) <= 100 and title.isascii() and title.isprintable()
+                and (id is None or type(id) is int and id > 0)):
+            return None
+        value = titles.get(title)
+        if value is None:
+            value = titles[title] = _NEW(TopicTitle)
+            set_value(value, title)
+        topic = _NEW(Topic)
+        set_title(topic, value)
+        set_id(topic, id)
+        topics.append(topic)
+    return topics
+
+
+def _build_goals(batch: list[dict], interned: dict) -> list[Goal] | None:
+    titles = interned.setdefault(GoalTitle, {})
+    set_title, set_description, set_points, set_id = _GOAL_SETTERS
+    set_title_value, set_description_value = GoalTitle.value.__set__, GoalDescription.value.__set__
+    points_by_value = _POINTS_BY_VALUE
+    goals = []
+    for data in batch:
+        if type(data) is not dict:
+            return None
+        title, description, points, id = data.get('title'), data.get('description'), data.get('points'), data.get('id')
+        if not (type(title) is str and 0 < len(title) <= 100 and title.isascii() and title.isprintable()
+                and type(description) is str and len(description) <= 400
+                and type(points) is int and points in points_by_value and (id is None or type(id) is int and id > 0)):
+            return None
+        value = titles.get(title)
+        if value is None:
+            value = titles[title] = _NEW(GoalTitle)
+            set_title_value(value, title)
+        goal = _NEW(Goal)
+        set_title(goal, value)
+        value = _NEW(GoalDescription)
+        set_description_value(value, description)
+        set_description(goal, value)
+        set_points(goal, points_by_value[points])
+        set_id(goal, id)
+        goals.append(goal)
+    return goals
+
+
+def _build_groups(batch: list[dict], interned: dict) -> list[GroupProject] | None:
+    names, links = interned.setdefault(GroupName, {}), interned.setdefault(Link, {})
+    set_name, set_topic_id, set_django, set_tui, set_gui, set_id = _GROUP_SETTERS
+    set_name_value, set_link_value = GroupName.value.__set__, Link.value.__set__
+    groups = []
+    for data in batch:
+        if type(data) is not dict:
+            return None
+        name, topic_id, id = data.get('name'), data.get('topic'), data.get('id')
+        django, tui, gui = data.get('link_django', ''), data.get('link_tui', ''), data.get('link_gui', '')
+        if not (type(name) is str and 0 < len(name) <= 100 and name.isascii() and name.isprintable()
+                and type(topic_id) is int and topic_id > 0 and (id is None or type(id) is int and id > 0)
+                and type(django) is str and len(django) <= 200 and type(tui) is str and len(tui) <= 200
+                and type(gui) is str and len(gui) <= 200):
+            return None
+        value = names.get(name)
+        if value is None:
+            value = names[name] = _NEW(GroupName)
+            set_name_value(value, name)
+        group = _NEW(GroupProject)
+        set_name(group, value)
+        set_topic_id(group, topic_id)
+        for set_link, link in ((set_django, django), (set_tui, tui), (set_gui, gui)):
+            value = links.get(link)
+            if value is None:
+                value = links[link] = _NEW(Link)
+                set_link_value(value, link)
+            set_link(group, value)
+        set_id(group, id)
+        groups.append(group)
+    return groups
+
+
+def _build_group_goals(batch: list[dict], interned: dict) -> list[GroupGoal] | None:
+    set_group_id, set_goal_id, set_complete, set_id = _GROUP_GOAL_SETTERS
+    group_goals = []
+    for data in batch:
+        if type(data) is not dict:
+            return None
+        group_id, goal_id, complete, id = data.get('group'), data.get('goal'), data.get('complete', False), data.get('id')
+        if not (type(group_id) is int and group_id > 0 and type(goal_id) is int and goal_id > 0
+                and type(complete) is bool and (id is None or type(id) is int and id > 0)):
+            return None
+        group_goal = _NEW(GroupGoal)
+        set_group_id(group_goal, group_id)
+        set_goal_id(group_goal, goal_id)
+        set_complete(group_goal, complete)
+        set_id(group_goal, id)
+        group_goals.append(group_goal)
+    return group_goals
+
+
+@dataclass(frozen=True, order=True, slots=True)
 class UserGroup:
     user_id: int
     group_id: int
@@ -298,10 +555,10 @@ class UserGroup:
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('user_id', self.user_id, min_value=1)
-        validate('group_id', self.group_id, min_value=1)
+        _USER_ID(self.user_id)
+        _GROUP_ID(self.group_id)
         if self.id is not None:
-            validate('id', self.id, min_value=1)
+            _ID(self.id)
 
     def to_dict(self):
         return {
@@ -318,12 +575,122 @@ class UserGroup:
         )
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, slots=True)
+class RemovalImpact:
+    groups: tuple[GroupProject, ...] = ()
+    group_goals: tuple[GroupGoal, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.groups or self.group_goals)
+
+    def describe(self) -> str:
+        parts = []
+        if self.groups:
+            parts.append(f"{len(self.groups)} group{'s' if len(self.groups) != 1 else ''}")
+        if self.group_goals:
+            parts.append(f"{len(self.group_goals)} assignment{'s' if len(self.group_goals) != 1 else ''}")
+        return f"This removes {' and '.join(parts)}" if parts else "Nothing else is removed"
+
+
+GROUP_ORDERS: dict[str, Callable[[GroupProject], Any]] = {
+    'name': lambda group: group.name.value,
+    'topic': lambda group: (group.topic_id, group.name.value),
+}
+GOAL_ORDERS: dict[str, Callable[[Goal], Any]] = {
+    'points': lambda goal: (-goal.points.value, goal.title.value),
+    'title': lambda goal: goal.title.value,
+}
+TOPIC_ORDERS: dict[str, Callable[[Topic], Any]] = {
+    'title': lambda topic: topic.title.value,
+}
+
+
+@dataclass(frozen=True, order=True, slots=True)
 class GPM:
-    __groups: list[GroupProject] = field(default_factory=list, init=False)
-    __goals: list[Goal] = field(default_factory=list, init=False)
-    __topics: list[Topic] = field(default_factory=list, init=False)
-    __group_goals: list[GroupGoal] = field(default_factory=list, init=False)
+    __groups: OrderedRegistry[GroupProject] = field(default_factory=OrderedRegistry, init=False)
+    __goals: OrderedRegistry[Goal] = field(default_factory=OrderedRegistry, init=False)
+    __topics: OrderedRegistry[Topic] = field(default_factory=OrderedRegistry, init=False)
+    __group_goals: OrderedRegistry[GroupGoal] = field(default_factory=OrderedRegistry, init=False)
+    __groups_by_topic: dict[int, dict[int, GroupProject]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    __group_goals_by_group: dict[int, dict[int, GroupGoal]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    __group_goals_by_goal: dict[int, dict[int, GroupGoal]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    __events: EventBus = field(default_factory=EventBus, init=False, repr=False, compare=False)
+    __orders: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def events(self) -> EventBus:
+        return self.__events
+
+    def __inserted(self, collection: str, positions: Sequence[int], entities: Iterable) -> None:
+        events = self.__events
+        with events.batch():
+            for position, entity in sorted(zip(positions, entities), key=itemgetter(0)):
+                events.publish(Inserted(collection, position, entity))
+
+    def __sort(self, collection: str, registry: OrderedRegistry, orders: dict, order: str | None) -> None:
+        if order is not None:
+            validate('order', order, is_in=set(orders))
+        if self.__orders.get(collection) == order:
+            return
+        registry.order_by(None if order is None else orders[order])
+        if order is None:
+            del self.__orders[collection]
+            return
+        self.__orders[collection] = order
+        if self.__events.active:
+            self.__events.publish(Reordered(collection))
+
+    def __cascade(self, impact: RemovalImpact) -> None:
+        # dependents go first, so every event describes a model without dangling references
+        for group_goal in impact.group_goals:
+            self.remove_group_goal(self.__group_goals.index(group_goal))
+        for group in impact.groups:
+            self.remove_group(self.__groups.index(group))
+
+    # replace_*_by_id swaps in place, keeping the position, unless a kept sort order would put the
+    # new entity elsewhere; only then is it a remove plus a re-insert (Removed and Inserted events)
+    @staticmethod
+    def __moves(registry: OrderedRegistry, previous, entity) -> bool:
+        key = registry.order
+        return key is not None and key(previous) != key(entity)
+
+    # multimap buckets are keyed by object identity, so equal entities without an id stay distinct
+    @staticmethod
+    def __link(multimap: dict, key: int, entity) -> None:
+        multimap.setdefault(key, {})[id(entity)] = entity
+
+    @staticmethod
+    def __link_all(multimap: dict, key: Callable[[Any], int], entities: Iterable) -> None:
+        for entity in entities:
+            bucket = multimap.get(key(entity))
+            if bucket is None:
+                bucket = multimap[key(entity)] = {}
+            bucket[id(entity)] = entity
+
+    @staticmethod
+    def __unlink(multimap: dict, key: int, entity) -> None:
+        bucket = multimap.get(key)
+        if bucket is not None and bucket.pop(id(entity), None) is not None and not bucket:
+            del multimap[key]
+
+    @staticmethod
+    def __linked(multimap: dict, key: int) -> tuple:
+        bucket = multimap.get(key)
+        return tuple(bucket.values()) if bucket else ()
+
+    def __link_group(self, group: GroupProject) -> None:
+        GPM.__link(self.__groups_by_topic, group.topic_id, group)
+
+    def __unlink_group(self, group: GroupProject) -> None:
+        GPM.__unlink(self.__groups_by_topic, group.topic_id, group)
+
+    def __link_group_goal(self, group_goal: GroupGoal) -> None:
+        GPM.__link(self.__group_goals_by_group, group_goal.group_id, group_goal)
+        GPM.__link(self.__group_goals_by_goal, group_goal.goal_id, group_goal)
+
+    def __unlink_group_goal(self, group_goal: GroupGoal) -> None:
+        GPM.__unlink(self.__group_goals_by_group, group_goal.group_id, group_goal)
+        GPM.__unlink(self.__group_goals_by_goal, group_goal.goal_id, group_goal)
     
     @property
     def number_of_groups(self) -> int:
@@ -333,18 +700,78 @@ class GPM:
         validate('index', index, min_value=0, max_value=len(self.__groups) - 1)
         return self.__groups[index]
 
-    def add_group(self, group: GroupProject) -> None:
-        self.__groups.append(group)
+    def iter_groups(self) -> Iterator[GroupProject]:
+        return iter(self.__groups)
+
+    def groups_slice(self, start: int = 0, stop: int | None = None) -> RegistryView[GroupProject]:
+        return self.__groups.view(start, stop)
 
-    def remove_group(self, index: int) -> None:
+    def group_by_id(self, group_id: int) -> GroupProject | None:
+        return self.__groups.by_id(group_id)
+
+    def index_of_group(self, group_id: int) -> int | None:
+        return self.__groups.position_of(group_id)
+
+    def groups_of_topic(self, topic_id: int) -> tuple[GroupProject, ...]:
+        return GPM.__linked(self.__groups_by_topic, topic_id)
+
+    def add_group(self, group: GroupProject) -> None:
+        position = self.__groups.append(group)
+        self.__link_group(group)
+        if self.__events.active:
+            self.__events.publish(Inserted(GROUPS, position, group))
+
+    def add_groups(self, groups: Iterable[GroupProject]) -> Sequence[int]:
+        added = list(groups)
+        positions = self.__groups.extend(added)
+        GPM.__link_all(self.__groups_by_topic, attrgetter('topic_id'), added)
+        if self.__events.active:
+            self.__inserted(GROUPS, positions, added)
+        return positions
+
+    def replace_group_by_id(self, group_id: int, group: GroupProject) -> None:
+        previous = self.__groups.by_id(group_id)
+        if previous is not None and GPM.__moves(self.__groups, previous, group):
+            self.remove_group(self.__groups.position_of(group_id))
+            self.add_group(group)
+            return
+        position = self.__groups.position_of(group_id) if self.__events.active else None
+        previous = self.__groups.replace(group_id, group)
+        self.__unlink_group(previous)
+        self.__link_group(group)
+        if position is not None:
+            self.__events.publish(Replaced(GROUPS, position, group, previous))
+
+    def group_removal_impact(self, group_id: int) -> RemovalImpact:
+        return RemovalImpact(group_goals=self.group_goals_of_group(group_id))
+
+    def remove_group(self, index: int, cascade: bool = False) -> None:
         validate('index', index, min_value=0, max_value=self.number_of_groups - 1)
-        self.__groups.pop(index)
+        if cascade:
+            with self.__events.batch():
+                self.__cascade(self.group_removal_impact(self.__groups[index].id))
+                self.remove_group(index)
+            return
+        removed = self.__groups.pop(index)
+        self.__unlink_group(removed)
+        if self.__events.active:
+            self.__events.publish(Removed(GROUPS, index, removed))
 
     def clear_groups(self) -> None:
         self.__groups.clear()
+        self.__groups_by_topic.clear()
+        if self.__events.active:
+            self.__events.publish(Cleared(GROUPS))
+
+    @property
+    def group_order(self) -> str | None:
+        return self.__orders.get(GROUPS)
+
+    def sort_groups(self, order: str | None) -> None:
+        self.__sort(GROUPS, self.__groups, GROUP_ORDERS, order)
 
     def sort_groups_by_name(self) -> None:
-        self.__groups.sort(key=lambda g: g.name)
+        self.sort_groups('name')
     
     @property
     def number_of_goals(self) -> int:
@@ -354,18 +781,69 @@ class GPM:
         validate('index', index, min_value=0, max_value=len(self.__goals) - 1)
         return self.__goals[index]
 
-    def add_goal(self, goal: Goal) -> None:
-        self.__goals.append(goal)
+    def iter_goals(self) -> Iterator[Goal]:
+        return iter(self.__goals)
+
+    def goals_slice(self, start: int = 0, stop: int | None = None) -> RegistryView[Goal]:
+        return self.__goals.view(start, stop)
 
-    def remove_goal(self, index: int) -> None:
+    def goal_by_id(self, goal_id: int) -> Goal | None:
+        return self.__goals.by_id(goal_id)
+
+    def index_of_goal(self, goal_id: int) -> int | None:
+        return self.__goals.position_of(goal_id)
+
+    def add_goal(self, goal: Goal) -> None:
+        position = self.__goals.append(goal)
+        if self.__events.active:
+            self.__events.publish(Inserted(GOALS, position, goal))
+
+    def add_goals(self, goals: Iterable[Goal]) -> Sequence[int]:
+        added = list(goals)
+        positions = self.__goals.extend(added)
+        if self.__events.active:
+            self.__inserted(GOALS, positions, added)
+        return positions
+
+    def replace_goal_by_id(self, goal_id: int, goal: Goal) -> None:
+        previous = self.__goals.by_id(goal_id)
+        if previous is not None and GPM.__moves(self.__goals, previous, goal):
+            self.remove_goal(self.__goals.position_of(goal_id))
+            self.add_goal(goal)
+            return
+        position = self.__goals.position_of(goal_id) if self.__events.active else None
+        previous = self.__goals.replace(goal_id, goal)
+        if position is not None:
+            self.__events.publish(Replaced(GOALS, position, goal, previous))
+
+    def goal_removal_impact(self, goal_id: int) -> RemovalImpact:
+        return RemovalImpact(group_goals=self.group_goals_of_goal(goal_id))
+
+    def remove_goal(self, index: int, cascade: bool = False) -> None:
         validate('index', index, min_value=0, max_value=self.number_of_goals - 1)
-        self.__goals.pop(index)
+        if cascade:
+            with self.__events.batch():
+                self.__cascade(self.goal_removal_impact(self.__goals[index].id))
+                self.remove_goal(index)
+            return
+        removed = self.__goals.pop(index)
+        if self.__events.active:
+            self.__events.publish(Removed(GOALS, index, removed))
 
     def clear_goals(self) -> None:
         self.__goals.clear()
+        if self.__events.active:
+            self.__events.publish(Cleared(GOALS))
+
+    @property
+    def goal_order(self) -> str | None:
+        return self.__orders.get(GOALS)
+
+    def sort_goals(self, order: str | None) -> None:
+        self.__sort(GOALS, self.__goals, GOAL_ORDERS, order)
 
     def sort_goals_by_points(self) -> None:
-        self.__goals.sort(key=lambda g: g.points, reverse=True)
+        self.sort_goals('points')
     
     @property
     def number_of_topics(self) -> int:
@@ -375,18 +853,70 @@ class GPM:
         validate('index', index, min_value=0, max_value=len(self.__topics) - 1)
         return self.__topics[index]
 
-    def add_topic(self, topic: Topic) -> None:
-        self.__topics.append(topic)
+    def iter_topics(self) -> Iterator[Topic]:
+        return iter(self.__topics)
+
+    def topics_slice(self, start: int = 0, stop: int | None = None) -> RegistryView[Topic]:
+        return self.__topics.view(start, stop)
+
+    def topic_by_id(self, topic_id: int) -> Topic | None:
+        return self.__topics.by_id(topic_id)
 
-    def remove_topic(self, index: int) -> None:
+    def index_of_topic(self, topic_id: int) -> int | None:
+        return self.__topics.position_of(topic_id)
+
+    def add_topic(self, topic: Topic) -> None:
+        position = self.__topics.append(topic)
+        if self.__events.active:
+            self.__events.publish(Inserted(TOPICS, position, topic))
+
+    def add_topics(self, topics: Iterable[Topic]) -> Sequence[int]:
+        added = list(topics)
+        positions = self.__topics.extend(added)
+        if self.__events.active:
+            self.__inserted(TOPICS, positions, added)
+        return positions
+
+    def replace_topic_by_id(self, topic_id: int, topic: Topic) -> None:
+        previous = self.__topics.by_id(topic_id)
+        if previous is not None and GPM.__moves(self.__topics, previous, topic):
+            self.remove_topic(self.__topics.position_of(topic_id))
+            self.add_topic(topic)
+            return
+        position = self.__topics.position_of(topic_id) if self.__events.active else None
+        previous = self.__topics.replace(topic_id, topic)
+        if position is not None:
+            self.__events.publish(Replaced(TOPICS, position, topic, previous))
+
+    def topic_removal_impact(self, topic_id: int) -> RemovalImpact:
+        groups = self.groups_of_topic(topic_id)
+        return RemovalImpact(groups, tuple(gg for group in groups for gg in self.group_goals_of_group(group.id)))
+
+    def remove_topic(self, index: int, cascade: bool = False) -> None:
         validate('index', index, min_value=0, max_value=self.number_of_topics - 1)
-        self.__topics.pop(index)
+        if cascade:
+            with self.__events.batch():
+                self.__cascade(self.topic_removal_impact(self.__topics[index].id))
+                self.remove_topic(index)
+            return
+        removed = self.__topics.pop(index)
+        if self.__events.active:
+            self.__events.publish(Removed(TOPICS, index, removed))
 
     def clear_topics(self) -> None:
         self.__topics.clear()
+        if self.__events.active:
+            self.__events.publish(Cleared(TOPICS))
+
+    @property
+    def topic_order(self) -> str | None:
+        return self.__orders.get(TOPICS)
+
+    def sort_topics(self, order: str | None) -> None:
+        self.__sort(TOPICS, self.__topics, TOPIC_ORDERS, order)
 
     def sort_topics_by_title(self) -> None:
-        self.__topics.sort(key=lambda t: t.title)
+        self.sort_topics('title')
 
     # ==================== GROUP GOALS ====================
     def number_of_group_goals(self) -> int:
@@ -396,18 +926,81 @@ class GPM:
         validate('index', index, min_value=0, max_value=len(self.__group_goals) - 1)
         return self.__group_goals[index]
 
+    def iter_group_goals(self) -> Iterator[GroupGoal]:
+        return iter(self.__group_goals)
+
+    def group_goals_slice(self, start: int = 0, stop: int | None = None) -> RegistryView[GroupGoal]:
+        return self.__group_goals.view(start, stop)
+
+    def group_goal_by_id(self, group_goal_id: int) -> GroupGoal | None:
+        return self.__group_goals.by_id(group_goal_id)
+
+    def index_of_group_goal(self, group_goal_id: int) -> int | None:
+        return self.__group_goals.position_of(group_goal_id)
+
+    def group_goals_of_group(self, group_id: int) -> tuple[GroupGoal, ...]:
+        return GPM.__linked(self.__group_goals_by_group, group_id)
+
+    def group_goals_of_goal(self, goal_id: int) -> tuple[GroupGoal, ...]:
+        return GPM.__linked(self.__group_goals_by_goal, goal_id)
+
     def add_group_goal(self, group_goal: GroupGoal) -> None:
-        self.__group_goals.append(group_goal)
+        position = self.__group_goals.append(group_goal)
+        self.__link_group_goal(group_goal)
+        if self.__events.active:
+            self.__events.publish(Inserted(GROUP_GOALS, position, group_goal))
+
+    def add_group_goals(self, group_goals: Iterable[GroupGoal]) -> Sequence[int]:
+        added = list(group_goals)
+        positions = self.__group_goals.extend(added)
+        GPM.__link_all(self.__group_goals_by_group, attrgetter('group_id'), added)
+        GPM.__link_all(self.__group_goals_by_goal, attrgetter('goal_id'), added)
+        if self.__events.active:
+            self.__inserted(GROUP_GOALS, positions, added)
+        return positions
+
+    def replace_group_goal_by_id(self, group_goal_id: int, group_goal: GroupGoal) -> None:
+        position = self.__group_goals.position_of(group_goal_id) if self.__events.active else None
+        previous = self.__group_goals.replace(group_goal_id, group_goal)
+        self.__unlink_group_goal(previous)
+        self.__link_group_goal(group_goal)
+        if position is not None:
+            self.__events.publish(Replaced(GROUP_GOALS, position, group_goal, previous))
 
     def remove_group_goal(self, index: int) -> None:
         validate('index', index, min_value=0, max_value=self.number_of_group_goals() - 1)
-        self.__group_goals.pop(index)
+        removed = self.__group_goals.pop(index)
+        self.__unlink_group_goal(removed)
+        if self.__events.active:
+            self.__events.publish(Removed(GROUP_GOALS, index, removed))
 
     def clear_group_goals(self) -> None:
         self.__group_goals.clear()
+        self.__group_goals_by_group.clear()
+        self.__group_goals_by_goal.clear()
+        if self.__events.active:
+            self.__events.publish(Cleared(GROUP_GOALS))
 
     def clear_all(self) -> None:
-        self.clear_groups()
-        self.clear_goals()
-        self.clear_topics()
-        self.clear_group_goals()
+        with self.__events.batch():
+            self.clear_groups()
+            self.clear_goals()
+            self.clear_topics()
+            self.clear_group_goals()
+
+    def load_from(self, other: 'GPM') -> None:
+        self.__groups.reset(other.__groups)
+        self.__goals.reset(other.__goals)
+        self.__topics.reset(other.__topics)
+        self.__group_goals.reset(other.__group_goals)
+        for mine, theirs in ((self.__groups_by_topic, other.__groups_by_topic),
+                             (self.__group_goals_by_group, other.__group_goals_by_group),
+                             (self.__group_goals_by_goal, other.__group_goals_by_goal)):
+            mine.clear()
+            mine.update((key, dict(bucket)) for key, bucket in theirs.items())
+        if self.__events.active:
+            with self.__events.batch():
+                for collection, registry in ((GROUPS, self.__groups), (GOALS, self.__goals),
+                                             (TOPICS, self.__topics), (GROUP_GOALS, self.__group_goals)):
+                    self.__events.publish(Cleared(collection))
+                    self.__inserted(collection, range(len(registry)), registry)
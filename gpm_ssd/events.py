@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Sequence
+
+GROUPS = 'groups'
+GOALS = 'goals'
+TOPICS = 'topics'
+GROUP_GOALS = 'group_goals'
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    collection: str
+
+
+@dataclass(frozen=True, slots=True)
+class Inserted(ChangeEvent):
+    position: int
+    entity: Any
+
+
+@dataclass(frozen=True, slots=True)
+class Removed(ChangeEvent):
+    position: int
+    entity: Any
+
+
+@dataclass(frozen=True, slots=True)
+class Replaced(ChangeEvent):
+    position: int
+    entity: Any
+    previous: Any
+
+
+@dataclass(frozen=True, slots=True)
+class Reordered(ChangeEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Cleared(ChangeEvent):
+    pass
+
+
+Subscriber = Callable[[Sequence[ChangeEvent]], None]
+
+
+class EventBus:
+    """Delivers GPM change events to subscribers, in order, once the mutation is complete.
+
+    Publishers check ``active`` before building an event, so nothing is allocated while
+    no one is subscribed. Inside ``batch()`` events are held back and delivered together
+    when the outermost scope exits.
+    """
+
+    def __init__(self):
+        self.__subscribers: tuple[Subscriber, ...] = ()
+        self.__depth = 0
+        self.__pending: list[ChangeEvent] = []
+
+    @property
+    def active(self) -> bool:
+        return bool(self.__subscribers)
+
+    def subscribe(self, subscriber: Subscriber) -> Callable[[], None]:
+        self.__subscribers += (subscriber,)
+
+        def unsubscribe() -> None:
+            self.__subscribers = tuple(s for s in self.__subscribers if s is not subscriber)
+        return unsubscribe
+
+    def publish(self, event: ChangeEvent) -> None:
+        if self.__depth:
+            self.__pending.append(event)
+        else:
+            self.__deliver((event,))
+
+    @contextmanager
+    def batch(self) -> Iterator['EventBus']:
+        self.__depth += 1
+        try:
+            yield self
+        finally:
+            self.__depth -= 1
+            if not self.__depth and self.__pending:
+                events, self.__pending = tuple(self.__pending), []
+                self.__deliver(events)
+
+    def __deliver(self, events: Sequence[ChangeEvent]) -> None:
+        for subscriber in self.__subscribers:
+            subscriber(events)
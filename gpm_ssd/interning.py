@@ -0,0 +1,80 @@
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class InternStats:
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class InternCache(Generic[T]):
+    """Weak-valued flyweight cache: equal raw values share one already-built instance.
+
+    Once ``maxsize`` live entries are held, new values are built but not admitted until
+    earlier instances are garbage collected and drop out of the cache. Hit and miss
+    counters are best-effort when several threads decode at once.
+    """
+
+    def __init__(self, name: str, key_type: type, maxsize: int = 4096):
+        self.name = name
+        self.maxsize = maxsize
+        self.__key_type = key_type
+        self.__entries: dict[Any, weakref.KeyedRef] = {}
+        self.__hits = 0
+        self.__misses = 0
+        _caches.append(self)
+
+    def get(self, value, build: Callable[[Any], T]) -> T:
+        if type(value) is not self.__key_type:
+            return build(value)
+        entries = self.__entries
+        ref = entries.get(value)
+        if ref is not None:
+            instance = ref()
+            if instance is not None:
+                self.__hits += 1
+                return instance
+        self.__misses += 1
+        instance = build(value)
+        if len(entries) < self.maxsize or ref is not None:
+            # dict operations are atomic, so racing threads agree on a single instance
+            fresh = weakref.KeyedRef(instance, self.__remove, value)
+            current = entries.setdefault(value, fresh)
+            if current is not fresh:
+                winner = current()
+                if winner is not None:
+                    return winner
+                entries[value] = fresh
+        return instance
+
+    def __remove(self, ref: weakref.KeyedRef) -> None:
+        if self.__entries.get(ref.key) is ref:
+            self.__entries.pop(ref.key, None)
+
+    def stats(self) -> InternStats:
+        return InternStats(self.__hits, self.__misses, len(self.__entries))
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__hits = self.__misses = 0
+
+
+_caches: list[InternCache] = []
+
+
+def intern_caches() -> tuple[InternCache, ...]:
+    return tuple(_caches)
+
+
+def intern_stats() -> dict[str, InternStats]:
+    return {cache.name: cache.stats() for cache in _caches}
@@ -1,17 +1,29 @@
-from .auth_handler import AuthHandler
-from .data_loader import DataLoader
+from .api_client import ApiClient, CallRecord
+from .auth_handler import AuthHandler, PermissionContext
+from .data_loader import DataLoader, LoadReport, SyncReport
 from .groups_manager import GroupsManager
 from .goals_manager import GoalsManager
 from .topics_manager import TopicsManager
 from .group_goals_manager import GroupGoalsManager
-from .ui_helpers import UIHelpers
+from .ui_helpers import Pager, UIHelpers
+from .snapshot_store import SnapshotStore
+from .revalidation_cache import RevalidationCache, RevalidationStats
 
 __all__ = [
+    'ApiClient',
+    'CallRecord',
     'AuthHandler',
+    'PermissionContext',
     'DataLoader',
+    'LoadReport',
+    'SyncReport',
     'GroupsManager',
     'GoalsManager',
     'TopicsManager',
     'GroupGoalsManager',
     'UIHelpers',
+    'Pager',
+    'SnapshotStore',
+    'RevalidationCache',
+    'RevalidationStats',
 ]
@@ -0,0 +1,141 @@
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    method: str
+    path: str
+    status: int | None
+    elapsed: float
+    attempts: int
+    error: str | None = None
+
+
+class ApiClient:
+    """Single entry point for backend calls: pooled sessions, deadlines, retries and call metrics."""
+
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+    def __init__(self, base_url: str, pool_size: int = 10, connect_timeout: float = 3.05,
+                 read_timeout: float = 15.0, deadline: float = 30.0, max_retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 8.0, history: int = 1000,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.__sleep = sleep
+        self.__reauthorize: Callable[[dict], dict | None] | None = None
+        self.__lock = threading.Lock()
+        self.__calls: deque[CallRecord] = deque(maxlen=history)
+
+    def set_reauthorizer(self, reauthorize: Callable[[dict], dict | None] | None) -> None:
+        self.__reauthorize = reauthorize
+
+    def new_session(self) -> requests.Session:
+        session = requests.Session()
+        self.configure(session)
+        return session
+
+    def configure(self, session: requests.Session) -> None:
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    def get(self, session: requests.Session, path: str, **kwargs) -> requests.Response:
+        return self.request(session, 'GET', path, **kwargs)
+
+    def post(self, session: requests.Session, path: str, **kwargs) -> requests.Response:
+        return self.request(session, 'POST', path, **kwargs)
+
+    def patch(self, session: requests.Session, path: str, **kwargs) -> requests.Response:
+        return self.request(session, 'PATCH', path, **kwargs)
+
+    def delete(self, session: requests.Session, path: str, **kwargs) -> requests.Response:
+        return self.request(session, 'DELETE', path, **kwargs)
+
+    def request(self, session: requests.Session, method: str, path: str, reauthorize: bool = True,
+                **kwargs) -> requests.Response:
+        res = self.__request(session, method, path, **kwargs)
+        headers = kwargs.get('headers') or {}
+        if res.status_code == 401 and reauthorize and 'Authorization' in headers and self.__reauthorize is not None:
+            fresh_headers = self.__reauthorize(headers)
+            if fresh_headers is not None:
+                res.close()
+                res = self.__request(session, method, path, **{**kwargs, 'headers': fresh_headers})
+        return res
+
+    def __request(self, session: requests.Session, method: str, path: str, **kwargs) -> requests.Response:
+        send = getattr(session, method.lower())
+        retries = self.max_retries if method in self.IDEMPOTENT_METHODS else 0
+        start = time.monotonic()
+        deadline = start + self.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = deadline - time.monotonic()
+            timeout = (min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+            try:
+                res = send(url=f"{self.base_url}{path}", timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self.__backoff(attempt)
+                if attempt > retries or time.monotonic() + delay >= deadline:
+                    self.__record(method, path, None, start, attempt, repr(e))
+                    raise
+                self.__sleep(delay)
+                continue
+
+            if res.status_code in self.RETRY_STATUSES and attempt <= retries:
+                delay = self.__retry_after(res)
+                if delay is None:
+                    delay = self.__backoff(attempt)
+                if time.monotonic() + delay < deadline:
+                    res.close()
+                    self.__sleep(delay)
+                    continue
+            self.__record(method, path, res.status_code, start, attempt)
+            return res
+
+    def calls(self) -> list[CallRecord]:
+        with self.__lock:
+            return list(self.__calls)
+
+    def __record(self, method: str, path: str, status: int | None, start: float, attempts: int,
+                 error: str | None = None) -> None:
+        record = CallRecord(method, path, status, time.monotonic() - start, attempts, error)
+        with self.__lock:
+            self.__calls.append(record)
+
+    def __backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def __retry_after(res: requests.Response) -> float | None:
+        value = res.headers.get('Retry-After')
+        if not isinstance(value, str):
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -1,16 +1,37 @@
+import threading
+import time
+from dataclasses import dataclass
 from getpass import getpass
 import requests
 from valid8 import ValidationError
 
 from gpm_ssd.domain import Token
+from gpm_ssd.managers.api_client import ApiClient
+
+
+@dataclass(frozen=True)
+class PermissionContext:
+    is_authenticated: bool = False
+    is_staff: bool = False
+    user_id: int | None = None
+
+
+ANONYMOUS = PermissionContext()
 
 
 class AuthHandler:
-    def __init__(self, base_url: str):
-        self.base_url = base_url
-        self.token: Token | None = None
+    refresh_margin = 60
+
+    def __init__(self, api: ApiClient):
+        self.api = api
+        self.__token: Token | None = None
+        self.__permissions: tuple[Token, PermissionContext] | None = None
         self.session: requests.Session | None = None
         self.user_id: int | None = None
+        self.username: str | None = None
+        self.__refresh_lock = threading.Lock()
+        self.__refresh_timer: threading.Timer | None = None
+        self.api.set_reauthorizer(self.__reauthorize)
 
     def login(self, load_data_callback) -> bool:
         if self.token is not None:
@@ -19,9 +40,10 @@ class AuthHandler:
         try:
             username = input('Username: ')
             password = getpass('Password: ')
-            self.session = requests.Session()
-            res = self.session.post(
-                f"{self.base_url}auth/login/",
+            self.session = self.api.new_session()
+            res = self.api.post(
+                self.session,
+                "auth/login/",
                 json={'username': username, 'password': password},
             )
             if res.status_code != 200:
@@ -31,6 +53,8 @@ class AuthHandler:
                 return False
             json_response = res.json()
             self.token = Token.from_response(json_response)
+            self.username = username
+            self.__schedule_refresh()
             load_data_callback()
             print("Login successful!")
             return True
@@ -52,8 +76,10 @@ class AuthHandler:
             print("No active session")
             return False
         
-        res = self.session.post(
-            f"{self.base_url}auth/logout/",
+        res = self.api.post(
+            self.session,
+            "auth/logout/",
+            reauthorize=False,
             headers={"Authorization": f"Bearer {self.token.access}"}
         )
         if res.status_code not in [200]:
@@ -61,17 +87,80 @@ class AuthHandler:
             return False
         else:
             print("Logout successful")
-            self.token = None
-            self.session = None
+            with self.__refresh_lock:
+                self.__cancel_refresh()
+                self.token = None
+                self.session = None
             self.user_id = None
             clear_data_callback()
+            self.username = None
+            return True
+
+    def refresh(self, stale_access: str | None = None) -> bool:
+        with self.__refresh_lock:
+            token, session = self.token, self.session
+            if token is None or session is None:
+                return False
+            if stale_access is not None and token.access != stale_access:
+                return True
+            try:
+                res = self.api.post(session, "auth/token/refresh/", json={'refresh': token.refresh})
+                if res.status_code != 200:
+                    return False
+                refreshed = token.refreshed(res.json())
+            except (requests.RequestException, ValidationError, ValueError, TypeError):
+                return False
+            if self.token is not token or self.session is not session:
+                return False
+            self.token = refreshed
+            self.__schedule_refresh()
             return True
 
+    def __reauthorize(self, headers: dict) -> dict | None:
+        stale_access = headers.get('Authorization', '').removeprefix('Bearer ')
+        if not self.refresh(stale_access):
+            return None
+        return {**headers, **self.get_headers()}
+
+    def __schedule_refresh(self) -> None:
+        self.__cancel_refresh()
+        delay = self.token.access_expires_at - time.time()
+        if delay <= 0:
+            return
+        self.__refresh_timer = threading.Timer(max(delay - self.refresh_margin, 0), self.refresh)
+        self.__refresh_timer.daemon = True
+        self.__refresh_timer.start()
+
+    def __cancel_refresh(self) -> None:
+        if self.__refresh_timer is not None:
+            self.__refresh_timer.cancel()
+            self.__refresh_timer = None
+
+    @property
+    def token(self) -> Token | None:
+        return self.__token
+
+    @token.setter
+    def token(self, token: Token | None) -> None:
+        self.__token = token
+        self.__permissions = None
+
+    @property
+    def permissions(self) -> PermissionContext:
+        token, cached = self.__token, self.__permissions
+        if token is None:
+            return ANONYMOUS
+        if cached is not None and cached[0] is token:
+            return cached[1]
+        permissions = PermissionContext(True, bool(token.is_staff()), token.claims.user_id)
+        self.__permissions = (token, permissions)
+        return permissions
+
     def is_authenticated(self) -> bool:
-        return self.token is not None
+        return self.permissions.is_authenticated
 
     def is_staff(self) -> bool:
-        return self.token is not None and self.token.is_staff()
+        return self.permissions.is_staff
 
     def get_headers(self) -> dict:
         if self.token is None:
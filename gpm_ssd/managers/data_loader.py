@@ -1,18 +1,347 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator
+
 import requests
 from gpm_ssd.domain import GPM, GroupProject, Goal, Topic, GroupGoal
+from gpm_ssd.events import GOALS, GROUPS, GROUP_GOALS, TOPICS, ChangeEvent, Cleared, Reordered
+from gpm_ssd.managers.api_client import ApiClient
+from gpm_ssd.managers.json_stream import iter_json_array
+from gpm_ssd.managers.revalidation_cache import RevalidationCache
+from gpm_ssd.managers.snapshot_store import SnapshotStore
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    mode: str
+    ready_after: float
+    refreshed_after: float | None = None
+
+
+@dataclass(frozen=True)
+class SyncReport:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    def __add__(self, other: 'SyncReport') -> 'SyncReport':
+        return SyncReport(
+            self.inserted + other.inserted,
+            self.updated + other.updated,
+            self.deleted + other.deleted,
+            self.unchanged + other.unchanged
+        )
+
+
+@dataclass(frozen=True)
+class _Collection:
+    path: str
+    name: str
+    kind: str
+    from_dict: Callable[[dict], Any]
+    entities: Callable[[], Iterable[Any]]
+    index_of: Callable[[Any], int | None]
+    add: Callable[[Any], None]
+    replace: Callable[[Any, Any], None]
+    remove: Callable[[int], None]
+
+
+# a 304 already matched to the cached entities it confirmed, so a later eviction cannot empty it
+@dataclass(frozen=True)
+class _NotModified:
+    entities: tuple
+    status_code: int = 304
+
+
+_MISSING = object()
 
 
 class DataLoader:
-    def __init__(self, base_url: str, gpm: GPM):
+    stream_threshold = 1 << 20
+    stream_chunk_size = 1 << 16
+
+    def __init__(self, base_url: str, gpm: GPM, max_workers: int = 4, snapshot_store: SnapshotStore | None = None,
+                 revalidation_cache: RevalidationCache | None = None, updated_since_param: str | None = None,
+                 api: ApiClient | None = None):
         self.base_url = base_url
+        self.api = api if api is not None else ApiClient(base_url)
         self.gpm = gpm
-        self.index_to_id_groups = {}
-        self.index_to_id_goals = {}
-        self.index_to_id_topics = {}
-        self.index_to_id_group_goals = {}
+        self.max_workers = max_workers
+        self.updated_since_param = updated_since_param
+        self.snapshot_store = snapshot_store
+        self.revalidation_cache = revalidation_cache if revalidation_cache is not None else RevalidationCache()
         self.user_groups: set[int] = set()
+        self.user_id: int | None = None
+        self.username: str | None = None
+        self.last_load: LoadReport | None = None
+        self.__synced_at: datetime | None = None
+        self.__refresh_lock = threading.Lock()
+        self.__refresh_thread: threading.Thread | None = None
+        self.__refresh_generation = 0
+        self.__pending_refresh: DataLoader | None = None
+        self.__refresh_error: Exception | None = None
+        self.__refresh_unsubscribe: Callable[[], None] | None = None
+        self.__local_edits: dict[str, set] = {}
+
+    def load_for_user(self, session: requests.Session, headers: dict, username: str) -> int | None:
+        start = time.perf_counter()
+        self.username = username
+        if self.__restore_snapshot():
+            self.last_load = LoadReport('warm', time.perf_counter() - start)
+            self.__start_background_refresh(session, headers, start)
+        else:
+            self.load_all_data(session, headers)
+            self.last_load = LoadReport('cold', time.perf_counter() - start)
+            self.save_snapshot()
+        return self.user_id
 
     def load_all_data(self, session: requests.Session, headers: dict) -> int | None:
+        self.__synced_at = datetime.now(timezone.utc)
+        if self.max_workers <= 1:
+            self.user_id = self._load_all_data_serial(session, headers)
+        else:
+            self.user_id = self._load_all_data_concurrent(session, headers)
+        return self.user_id
+
+    def sync(self, session: requests.Session, headers: dict) -> SyncReport:
+        """Merge the server's current collections into GPM, touching only entities that changed.
+
+        With ``updated_since_param`` set, only records changed since the previous load or sync are
+        requested; such a filtered view cannot reveal deletions, which show up on the next full load.
+        """
+        started = datetime.now(timezone.utc)
+        params = None
+        if self.updated_since_param is not None and self.__synced_at is not None:
+            params = {self.updated_since_param: self.__synced_at.isoformat()}
+        collections = self.__collections()
+        report = SyncReport()
+        with ThreadPoolExecutor(max_workers=max(self.max_workers, 1), thread_name_prefix='gpm-sync') as executor:
+            user_groups = executor.submit(self._fetch, session, headers, 'group-users/')
+            responses = [executor.submit(self._fetch_list, session, headers, c.path, params) for c in collections]
+            self._apply_user_groups(user_groups.result(), self.user_id)
+            for collection, res in zip(collections, responses):
+                report += self.__sync_collection(collection, res.result(), full=params is None)
+        self.__synced_at = started
+        self.save_snapshot()
+        return report
+
+    def __collections(self) -> tuple[_Collection, ...]:
+        gpm = self.gpm
+        return (
+            _Collection('groups/', 'group', GROUPS, GroupProject.from_dict,
+                        gpm.iter_groups, gpm.index_of_group,
+                        gpm.add_group, gpm.replace_group_by_id, gpm.remove_group),
+            _Collection('goals/', 'goal', GOALS, Goal.from_dict,
+                        gpm.iter_goals, gpm.index_of_goal,
+                        gpm.add_goal, gpm.replace_goal_by_id, gpm.remove_goal),
+            _Collection('topics/', 'topic', TOPICS, Topic.from_dict,
+                        gpm.iter_topics, gpm.index_of_topic,
+                        gpm.add_topic, gpm.replace_topic_by_id, gpm.remove_topic),
+            _Collection('group-goals/', 'group goal', GROUP_GOALS, GroupGoal.from_dict,
+                        gpm.iter_group_goals, gpm.index_of_group_goal,
+                        gpm.add_group_goal, gpm.replace_group_goal_by_id, gpm.remove_group_goal),
+        )
+
+    def __sync_collection(self, collection: _Collection, res: requests.Response | _NotModified,
+                          full: bool) -> SyncReport:
+        key = (self.username, collection.path)
+        if isinstance(res, _NotModified):
+            return SyncReport(unchanged=len(res.entities))
+        if res.status_code != 200:
+            return SyncReport()
+        received = [0]
+        report, entities = DataLoader.__merge_records(collection, self.__records(res, received), full)
+        if full:
+            self.revalidation_cache.store(key, res, entities, received[0])
+        return report
+
+    @staticmethod
+    def __merge_records(collection: _Collection, records: Iterable[dict], full: bool,
+                        kept: frozenset | set = frozenset()) -> tuple[SyncReport, list]:
+        # ids in ``kept`` were changed locally, so neither the records nor their absence override them
+        current = {entity.id: entity for entity in collection.entities() if entity.id is not None}
+
+        inserted = updated = unchanged = 0
+        seen = set()
+        entities = []
+        for data in records:
+            entity_id = data.get('id')
+            existing = current.get(entity_id)
+            seen.add(entity_id)
+            if entity_id in kept:
+                continue
+            if existing is not None and DataLoader.__matches(existing, data):
+                unchanged += 1
+                entities.append(existing)
+                continue
+            try:
+                entity = collection.from_dict(data)
+            except Exception as e:
+                print(f"Warning: Failed to load {collection.name}: {e}")
+                continue
+            if existing is None:
+                collection.add(entity)
+                current[entity.id] = entity
+                inserted += 1
+            elif entity != existing:
+                collection.replace(entity_id, entity)
+                current[entity_id] = entity
+                updated += 1
+            else:
+                entity = existing
+                unchanged += 1
+            entities.append(entity)
+
+        deleted = 0
+        if full:
+            # removed by id: kept sort orders may have moved entities since the pass began
+            stale = [entity_id for entity_id in current if entity_id not in seen and entity_id not in kept]
+            for entity_id in stale:
+                collection.remove(collection.index_of(entity_id))
+            deleted = len(stale)
+        return SyncReport(inserted, updated, deleted, unchanged), entities
+
+    @staticmethod
+    def __matches(entity, data: dict) -> bool:
+        if data.get('id') != entity.id:
+            return False
+        for field_name, value in entity.to_dict().items():
+            if data.get(field_name, _MISSING) != value:
+                return False
+        return True
+
+    def apply_pending_refresh(self) -> bool:
+        with self.__refresh_lock:
+            staging, self.__pending_refresh = self.__pending_refresh, None
+            error, self.__refresh_error = self.__refresh_error, None
+        if error is not None:
+            self.__stop_watching()
+            print(f"Warning: Background refresh failed: {error}")
+        if staging is None:
+            return False
+        self.__stop_watching()
+        edits, self.__local_edits = self.__local_edits, {}
+        if edits:
+            self.__rebase(staging, edits)
+        else:
+            self.gpm.load_from(staging.gpm)
+        self.user_groups = staging.user_groups
+        self.user_id = staging.user_id
+        self.save_snapshot()
+        return True
+
+    def __rebase(self, staging: 'DataLoader', edits: dict[str, set]) -> None:
+        # entities edited locally since the refresh started keep their local state; the rest follow the server
+        with self.gpm.events.batch():
+            for collection, staged in zip(self.__collections(), staging.__collections()):
+                records = ({**entity.to_dict(), 'id': entity.id} for entity in staged.entities())
+                DataLoader.__merge_records(collection, records, full=True, kept=edits.get(collection.kind, set()))
+
+    def wait_for_refresh(self, timeout: float | None = None) -> None:
+        thread = self.__refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def __start_background_refresh(self, session: requests.Session, headers: dict, start: float):
+        generation = self.__refresh_generation
+        staging = DataLoader(self.base_url, GPM(), self.max_workers, revalidation_cache=self.revalidation_cache,
+                             api=self.api)
+        staging.username = self.username
+
+        def refresh():
+            try:
+                staging.load_all_data(session, headers)
+            except Exception as e:
+                with self.__refresh_lock:
+                    if generation == self.__refresh_generation:
+                        self.__refresh_error = e
+                return
+            with self.__refresh_lock:
+                if generation == self.__refresh_generation:
+                    self.__pending_refresh = staging
+                    self.last_load = replace(self.last_load, refreshed_after=time.perf_counter() - start)
+
+        # the staged copy predates local changes made meanwhile; those are recorded so applying it keeps them
+        self.__local_edits = {}
+        self.__refresh_unsubscribe = self.gpm.events.subscribe(self.__record_local_edits)
+        self.__refresh_thread = threading.Thread(target=refresh, name='gpm-refresh', daemon=True)
+        self.__refresh_thread.start()
+
+    def __record_local_edits(self, events: Iterable[ChangeEvent]) -> None:
+        for event in events:
+            if isinstance(event, Reordered):
+                continue
+            if isinstance(event, Cleared):
+                self.__discard_refresh()
+                return
+            if event.entity.id is not None:
+                self.__local_edits.setdefault(event.collection, set()).add(event.entity.id)
+
+    def __discard_refresh(self) -> None:
+        with self.__refresh_lock:
+            self.__refresh_generation += 1
+            self.__pending_refresh = None
+            self.__refresh_error = None
+        self.__local_edits = {}
+        self.__stop_watching()
+
+    def __stop_watching(self) -> None:
+        unsubscribe, self.__refresh_unsubscribe = self.__refresh_unsubscribe, None
+        if unsubscribe is not None:
+            unsubscribe()
+
+    def save_snapshot(self) -> None:
+        if self.snapshot_store is None or self.username is None:
+            return
+        try:
+            self.snapshot_store.save(self.base_url, self.username, self.__snapshot_payload())
+        except OSError as e:
+            print(f"Warning: Failed to save snapshot: {e}")
+
+    def __restore_snapshot(self) -> bool:
+        if self.snapshot_store is None:
+            return False
+        payload = self.snapshot_store.load(self.base_url, self.username)
+        if payload is None:
+            return False
+        try:
+            self.__apply_snapshot(payload)
+        except Exception as e:
+            print(f"Warning: Discarding unreadable snapshot: {e}")
+            self.snapshot_store.discard(self.base_url, self.username)
+            return False
+        return True
+
+    def __snapshot_payload(self) -> dict:
+        def entities(iterable: Iterable) -> list[dict]:
+            return [{**entity.to_dict(), 'id': entity.id} for entity in iterable]
+
+        return {
+            'user_id': self.user_id,
+            'user_groups': sorted(self.user_groups),
+            'groups': entities(self.gpm.iter_groups()),
+            'goals': entities(self.gpm.iter_goals()),
+            'topics': entities(self.gpm.iter_topics()),
+            'group_goals': entities(self.gpm.iter_group_goals()),
+        }
+
+    def __apply_snapshot(self, payload: dict):
+        staging = GPM()
+        staging.add_groups(GroupProject.from_dicts(payload['groups'], trust=True))
+        staging.add_goals(Goal.from_dicts(payload['goals'], trust=True))
+        staging.add_topics(Topic.from_dicts(payload['topics'], trust=True))
+        staging.add_group_goals(GroupGoal.from_dicts(payload['group_goals'], trust=True))
+        user_groups = set(payload['user_groups'])
+
+        self.gpm.load_from(staging)
+        self.user_groups = user_groups
+        self.user_id = payload['user_id']
+
+    def _load_all_data_serial(self, session: requests.Session, headers: dict) -> int | None:
         user_id = self._load_user(session, headers)
         self._load_user_groups(session, headers, user_id)
         self._load_groups(session, headers)
@@ -21,15 +350,103 @@ class DataLoader:
         self._load_group_goals(session, headers)
         return user_id
 
+    def _load_all_data_concurrent(self, session: requests.Session, headers: dict) -> int | None:
+        # The GETs are independent, so they run in parallel over the session's
+        # connection pool; responses are applied in the serial order so GPM ends
+        # up exactly as with the serial path.
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='gpm-loader') as executor:
+            user = executor.submit(self._fetch, session, headers, 'auth/user/')
+            user_groups = executor.submit(self._fetch, session, headers, 'group-users/')
+            groups = executor.submit(self._fetch_list, session, headers, 'groups/')
+            goals = executor.submit(self._fetch_list, session, headers, 'goals/')
+            topics = executor.submit(self._fetch_list, session, headers, 'topics/')
+            group_goals = executor.submit(self._fetch_list, session, headers, 'group-goals/')
+
+            user_id = self._apply_user(user.result())
+            self._apply_user_groups(user_groups.result(), user_id)
+            self._apply_groups(groups.result())
+            self._apply_goals(goals.result())
+            self._apply_topics(topics.result())
+            self._apply_group_goals(group_goals.result())
+        return user_id
+
+    def _fetch(self, session: requests.Session, headers: dict, path: str) -> requests.Response:
+        return self.api.get(session, path, headers=headers)
+
+    def _fetch_list(self, session: requests.Session, headers: dict, path: str,
+                    params: dict | None = None) -> requests.Response | _NotModified:
+        if params:
+            res = self.api.get(session, path, headers=headers, params=params, stream=True)
+        else:
+            key = (self.username, path)
+            validators = self.revalidation_cache.conditional_headers(key)
+            res = self.api.get(session, path, headers={**headers, **validators} if validators else headers, stream=True)
+            if res.status_code == 304:
+                res.close()
+                cached = self.revalidation_cache.revalidated(key)
+                if cached is not None:
+                    return _NotModified(cached)
+                # the entry was evicted after its validators were sent, so ask for the full list
+                res = self.api.get(session, path, headers=headers, stream=True)
+        if not self.__is_streamed(res):
+            res.content
+        return res
+
+    def __is_streamed(self, res: requests.Response) -> bool:
+        if res.status_code != 200:
+            return False
+        length = res.headers.get('Content-Length')
+        if isinstance(length, str) and length.isdigit():
+            return int(length) >= self.stream_threshold
+        return res.headers.get('Transfer-Encoding') == 'chunked'
+
+    def __records(self, res: requests.Response, received: list[int]) -> Iterator:
+        if not self.__is_streamed(res):
+            received[0] = len(res.content)
+            yield from res.json()
+            return
+
+        def chunks():
+            for chunk in res.iter_content(chunk_size=self.stream_chunk_size):
+                received[0] += len(chunk)
+                yield chunk
+
+        try:
+            yield from iter_json_array(chunks())
+        finally:
+            res.close()
+
+    def __decode_list(self, res: requests.Response | _NotModified, path: str, from_dicts, name: str) -> Iterator:
+        key = (self.username, path)
+        if isinstance(res, _NotModified):
+            yield from res.entities
+            return
+        if res.status_code != 200:
+            return
+        entities = []
+        received = [0]
+
+        def warn(data: dict, e: Exception):
+            print(f"Warning: Failed to load {name}: {e}")
+
+        for entity in from_dicts(self.__records(res, received), trust=True, on_error=warn):
+            entities.append(entity)
+            yield entity
+        self.revalidation_cache.store(key, res, entities, received[0])
+
     def _load_user(self, session: requests.Session, headers: dict) -> int | None:
-        res = session.get(url=f"{self.base_url}auth/user/", headers=headers)
+        return self._apply_user(self._fetch(session, headers, 'auth/user/'))
+
+    def _apply_user(self, res: requests.Response) -> int | None:
         if res.status_code == 200:
             user_data = res.json()
             return user_data.get('pk')
         return None
 
     def _load_user_groups(self, session: requests.Session, headers: dict, user_id: int | None):
-        res = session.get(url=f"{self.base_url}group-users/", headers=headers)
+        self._apply_user_groups(self._fetch(session, headers, 'group-users/'), user_id)
+
+    def _apply_user_groups(self, res: requests.Response, user_id: int | None):
         if res.status_code == 200:
             user_groups_data = res.json()
             self.user_groups.clear()
@@ -38,57 +455,35 @@ class DataLoader:
                     self.user_groups.add(ug.get('group'))
 
     def _load_groups(self, session: requests.Session, headers: dict):
-        res = session.get(url=f"{self.base_url}groups/", headers=headers)
-        if res.status_code == 200:
-            groups_data = res.json()
-            for g in groups_data:
-                try:
-                    group = GroupProject.from_dict(g)
-                    self.gpm.add_group(group)
-                    self.index_to_id_groups[self.gpm.number_of_groups - 1] = group.id
-                except Exception as e:
-                    print(f"Warning: Failed to load group: {e}")
+        self._apply_groups(self._fetch_list(session, headers, 'groups/'))
+
+    def _apply_groups(self, res: requests.Response):
+        self.gpm.add_groups(self.__decode_list(res, 'groups/', GroupProject.from_dicts, 'group'))
 
     def _load_goals(self, session: requests.Session, headers: dict):
-        res = session.get(url=f"{self.base_url}goals/", headers=headers)
-        if res.status_code == 200:
-            goals_data = res.json()
-            for g in goals_data:
-                try:
-                    goal = Goal.from_dict(g)
-                    self.gpm.add_goal(goal)
-                    self.index_to_id_goals[self.gpm.number_of_goals - 1] = goal.id
-                except Exception as e:
-                    print(f"Warning: Failed to load goal: {e}")
+        self._apply_goals(self._fetch_list(session, headers, 'goals/'))
+
+    def _apply_goals(self, res: requests.Response):
+        self.gpm.add_goals(self.__decode_list(res, 'goals/', Goal.from_dicts, 'goal'))
 
     def _load_topics(self, session: requests.Session, headers: dict):
-        res = session.get(url=f"{self.base_url}topics/", headers=headers)
-        if res.status_code == 200:
-            topics_data = res.json()
-            for t in topics_data:
-                try:
-                    topic = Topic.from_dict(t)
-                    self.gpm.add_topic(topic)
-                    self.index_to_id_topics[self.gpm.number_of_topics - 1] = topic.id
-                except Exception as e:
-                    print(f"Warning: Failed to load topic: {e}")
+        self._apply_topics(self._fetch_list(session, headers, 'topics/'))
+
+    def _apply_topics(self, res: requests.Response):
+        self.gpm.add_topics(self.__decode_list(res, 'topics/', Topic.from_dicts, 'topic'))
 
     def _load_group_goals(self, session: requests.Session, headers: dict):
-        res = session.get(url=f"{self.base_url}group-goals/", headers=headers)
-        if res.status_code == 200:
-            group_goals_data = res.json()
-            for gg in group_goals_data:
-                try:
-                    group_goal = GroupGoal.from_dict(gg)
-                    self.gpm.add_group_goal(group_goal)
-                    self.index_to_id_group_goals[self.gpm.number_of_group_goals - 1] = group_goal.id
-                except Exception as e:
-                    print(f"Warning: Failed to load group goal: {e}")
+        self._apply_group_goals(self._fetch_list(session, headers, 'group-goals/'))
+
+    def _apply_group_goals(self, res: requests.Response):
+        self.gpm.add_group_goals(self.__decode_list(res, 'group-goals/', GroupGoal.from_dicts, 'group goal'))
 
     def clear_all(self):
+        self.save_snapshot()
+        self.__discard_refresh()
+        self.username = None
+        self.user_id = None
+        self.last_load = None
+        self.__synced_at = None
         self.user_groups.clear()
         self.gpm.clear_all()
-        self.index_to_id_groups.clear()
-        self.index_to_id_goals.clear()
-        self.index_to_id_topics.clear()
-        self.index_to_id_group_goals.clear()
@@ -3,31 +3,29 @@ import requests
 from valid8 import ValidationError, validate
 
 from gpm_ssd.domain import GPM, Goal, GoalTitle, GoalDescription, Points
-from gpm_ssd.managers.ui_helpers import UIHelpers
+from gpm_ssd.managers.api_client import ApiClient
+from gpm_ssd.managers.ui_helpers import Pager, UIHelpers
 from gpm_ssd.exceptions import HttpException
 
 
 class GoalsManager:
-    def __init__(self, base_url: str, gpm: GPM, data_loader):
-        self.base_url = base_url
+    def __init__(self, api: ApiClient, gpm: GPM, data_loader):
+        self.api = api
         self.gpm = gpm
         self.data_loader = data_loader
+        self.pager = Pager()
 
     def print_goals(self):
-        UIHelpers.print_separator(100)
-        fmt = '%3s %-30s %-50s %6s'
-        print(fmt % ('Idx', 'TITLE', 'DESCRIPTION', 'POINTS'))
-        UIHelpers.print_separator(100)
+        UIHelpers.print_table('%3s %-30s %-50s %6s', ('TITLE', 'DESCRIPTION', 'POINTS'),
+                              self.pager, self.gpm.number_of_goals, self._goal_rows, 100)
 
-        for index in range(self.gpm.number_of_goals):
-            goal = self.gpm.goal_at_index(index)
-            print(fmt % (
-                index + 1,
+    def _goal_rows(self, start: int, stop: int):
+        for goal in self.gpm.goals_slice(start, stop):
+            yield (
                 goal.title.value[:30],
                 goal.description.value[:50],
                 goal.points.value
-            ))
-        UIHelpers.print_separator(100)
+            )
 
     def add_goal(self, session: requests.Session, headers: dict):
         while True:
@@ -41,8 +39,9 @@ class GoalsManager:
                 print(f"\nHTTP Error: {e}. Please, try again.")
 
     def _add_goal_backend(self, goal: Goal, session: requests.Session, headers: dict):
-        res = session.post(
-            url=f"{self.base_url}goals/",
+        res = self.api.post(
+            session,
+            "goals/",
             json=goal.to_dict(),
             headers=headers
         )
@@ -53,7 +52,6 @@ class GoalsManager:
             response_data = res.json()
             goal_with_id = Goal.from_dict(response_data)
             self.gpm.add_goal(goal_with_id)
-            self.data_loader.index_to_id_goals[self.gpm.number_of_goals - 1] = goal_with_id.id
             print('Goal added!')
 
     def remove_goal(self, session: requests.Session, headers: dict):
@@ -63,24 +61,23 @@ class GoalsManager:
         if index == 0:
             print('Cancelled!')
             return
+        impact = self.gpm.goal_removal_impact(self.gpm.goal_at_index(index - 1).id)
+        if impact and not UIHelpers.confirm(impact.describe()):
+            print('Cancelled!')
+            return
         self._remove_goal_backend(index - 1, session, headers)
 
     def _remove_goal_backend(self, index: int, session: requests.Session, headers: dict):
-        goal_id = self.data_loader.index_to_id_goals[index]
-        res = session.delete(
-            url=f"{self.base_url}goals/{goal_id}/",
+        goal_id = self.gpm.goal_at_index(index).id
+        res = self.api.delete(
+            session,
+            f"goals/{goal_id}/",
             headers=headers
         )
         if res.status_code != 204:
             print("Error removing goal")
         else:
-            self.gpm.remove_goal(index)
-            del self.data_loader.index_to_id_goals[index]
-            new_mapping = {}
-            for i in range(self.gpm.number_of_goals):
-                old_index = i if i < index else i + 1
-                new_mapping[i] = self.data_loader.index_to_id_goals[old_index]
-            self.data_loader.index_to_id_goals = new_mapping
+            self.gpm.remove_goal(index, cascade=True)
             print('Goal removed!')
 
     def sort_goals(self):
@@ -2,46 +2,52 @@ import requests
 from valid8 import ValidationError, validate
 
 from gpm_ssd.domain import GPM, GroupGoal
-from gpm_ssd.managers.ui_helpers import UIHelpers
+from gpm_ssd.progress import ProgressTracker
+from gpm_ssd.views import GroupGoalRows
+from gpm_ssd.managers.api_client import ApiClient
+from gpm_ssd.managers.ui_helpers import Pager, UIHelpers
 from gpm_ssd.exceptions import HttpException
 
 
 class GroupGoalsManager:
-    def __init__(self, base_url: str, gpm: GPM, data_loader):
-        self.base_url = base_url
+    def __init__(self, api: ApiClient, gpm: GPM, data_loader, progress: ProgressTracker, rows: GroupGoalRows):
+        self.api = api
         self.gpm = gpm
         self.data_loader = data_loader
+        self.pager = Pager()
+        self.progress = progress
+        self.rows = rows
 
     def print_group_goals(self):
-        UIHelpers.print_separator(120)
-        fmt = '%3s %-30s %-40s %-10s'
-        print(fmt % ('Idx', 'GROUP', 'GOAL', 'COMPLETE'))
-        UIHelpers.print_separator(120)
+        UIHelpers.print_table('%3s %-30s %-25s %-40s %6s %-10s', ('GROUP', 'TOPIC', 'GOAL', 'POINTS', 'COMPLETE'),
+                              self.pager, len(self.rows), self._group_goal_rows, 120)
 
-        for index in range(self.gpm.number_of_group_goals()):
-            gg = self.gpm.group_goal_at_index(index)
-            group_name = "Unknown"
-            goal_title = "Unknown"
-            
-            for i in range(self.gpm.number_of_groups):
-                g = self.gpm.group_at_index(i)
-                if g.id == gg.group_id:
-                    group_name = g.name.value
-                    break
-            
-            for i in range(self.gpm.number_of_goals):
-                g = self.gpm.goal_at_index(i)
-                if g.id == gg.goal_id:
-                    goal_title = g.title.value
-                    break
-            
+    def _group_goal_rows(self, start: int, stop: int):
+        for row in self.rows.rows(start, stop):
+            yield (
+                row.group_name[:30],
+                row.topic_title[:25],
+                row.goal_title[:40],
+                row.points,
+                "✓" if row.complete else "✗"
+            )
+
+    def print_leaderboard(self, size: int = 10):
+        UIHelpers.print_separator(80)
+        fmt = '%4s %-30s %8s %8s %10s'
+        print(fmt % ('Rank', 'GROUP', 'EARNED', 'TOTAL', 'COMPLETED'))
+        UIHelpers.print_separator(80)
+
+        for rank, progress in enumerate(self.progress.leaderboard(size), 1):
+            group = self.gpm.group_by_id(progress.group_id)
             print(fmt % (
-                index + 1,
-                group_name[:30],
-                goal_title[:40],
-                "✓" if gg.complete else "✗"
+                rank,
+                (group.name.value if group is not None else "Unknown")[:30],
+                progress.earned,
+                progress.total,
+                f"{progress.completed}/{progress.assigned}"
             ))
-        UIHelpers.print_separator(120)
+        UIHelpers.print_separator(80)
 
     def add_group_goal(self, session: requests.Session, headers: dict):
         while True:
@@ -57,8 +63,9 @@ class GroupGoalsManager:
                 print(f"\nHTTP Error: {e}. Please, try again.")
 
     def _add_group_goal_backend(self, group_goal: GroupGoal, session: requests.Session, headers: dict):
-        res = session.post(
-            url=f"{self.base_url}group-goals/",
+        res = self.api.post(
+            session,
+            "group-goals/",
             json=group_goal.to_dict(),
             headers=headers
         )
@@ -73,17 +80,17 @@ class GroupGoalsManager:
             response_data = res.json()
             group_goal_with_id = GroupGoal.from_dict(response_data)
             self.gpm.add_group_goal(group_goal_with_id)
-            self.data_loader.index_to_id_group_goals[self.gpm.number_of_group_goals() - 1] = group_goal_with_id.id
             print('Group Goal added!')
 
     def remove_group_goal(self, session: requests.Session, headers: dict):
         index = int(input('Enter index: '))
         validate("index", index, min_value=1, max_value=self.gpm.number_of_group_goals())
         
-        group_goal_id = self.data_loader.index_to_id_group_goals[index - 1]
+        group_goal_id = self.gpm.group_goal_at_index(index - 1).id
         
-        res = session.delete(
-            url=f"{self.base_url}group-goals/{group_goal_id}/",
+        res = self.api.delete(
+            session,
+            f"group-goals/{group_goal_id}/",
             headers=headers
         )
         
@@ -91,12 +98,6 @@ class GroupGoalsManager:
             print(f"Error removing group goal: {res.status_code}")
         else:
             self.gpm.remove_group_goal(index - 1)
-            del self.data_loader.index_to_id_group_goals[index - 1]
-            new_mapping = {}
-            for i in range(self.gpm.number_of_group_goals()):
-                old_index = i if i < index - 1 else i + 1
-                new_mapping[i] = self.data_loader.index_to_id_group_goals[old_index]
-            self.data_loader.index_to_id_group_goals = new_mapping
             print('Group Goal removed!')
 
     def toggle_group_goal(self, session: requests.Session, headers: dict):
@@ -104,12 +105,13 @@ class GroupGoalsManager:
         validate("index", index, min_value=1, max_value=self.gpm.number_of_group_goals())
         
         group_goal = self.gpm.group_goal_at_index(index - 1)
-        group_goal_id = self.data_loader.index_to_id_group_goals[index - 1]
+        group_goal_id = group_goal.id
         
         new_complete = not group_goal.complete
         
-        res = session.patch(
-            url=f"{self.base_url}group-goals/{group_goal_id}/",
+        res = self.api.patch(
+            session,
+            f"group-goals/{group_goal_id}/",
             json={"complete": new_complete},
             headers=headers
         )
@@ -119,11 +121,5 @@ class GroupGoalsManager:
         else:
             response_data = res.json()
             updated_group_goal = GroupGoal.from_dict(response_data)
-            self.gpm.remove_group_goal(index - 1)
-            self.gpm.add_group_goal(updated_group_goal)
-            for i in range(self.gpm.number_of_group_goals() - 1, index - 1, -1):
-                temp = self.gpm.group_goal_at_index(i)
-                self.gpm.remove_group_goal(i)
-                if i > index:
-                    self.gpm.add_group_goal(temp)
+            self.gpm.replace_group_goal_by_id(group_goal_id, updated_group_goal)
             print('Group Goal toggled!')
@@ -3,33 +3,32 @@ import requests
 from valid8 import ValidationError, validate
 
 from gpm_ssd.domain import GPM, GroupProject, GroupName, Link
-from gpm_ssd.managers.ui_helpers import UIHelpers
+from gpm_ssd.managers.api_client import ApiClient
+from gpm_ssd.managers.ui_helpers import Pager, UIHelpers
 from gpm_ssd.exceptions import HttpException
 
 
 class GroupsManager:
-    def __init__(self, base_url: str, gpm: GPM, data_loader):
-        self.base_url = base_url
+    def __init__(self, api: ApiClient, gpm: GPM, data_loader):
+        self.api = api
         self.gpm = gpm
         self.data_loader = data_loader
+        self.pager = Pager()
 
     def print_groups(self):
-        UIHelpers.print_separator(120)
-        fmt = '%3s %-30s %-10s %-25s %-25s %-25s'
-        print(fmt % ('Idx', 'NAME', 'TOPIC_ID', 'LINK_DJANGO', 'LINK_TUI', 'LINK_GUI'))
-        UIHelpers.print_separator(120)
-
-        for index in range(self.gpm.number_of_groups):
-            group = self.gpm.group_at_index(index)
-            print(fmt % (
-                index + 1,
+        UIHelpers.print_table('%3s %-30s %-10s %-25s %-25s %-25s',
+                              ('NAME', 'TOPIC_ID', 'LINK_DJANGO', 'LINK_TUI', 'LINK_GUI'),
+                              self.pager, self.gpm.number_of_groups, self._group_rows, 120)
+
+    def _group_rows(self, start: int, stop: int):
+        for group in self.gpm.groups_slice(start, stop):
+            yield (
                 group.name.value[:30],
                 group.topic_id,
                 group.link_django.value[:25],
                 group.link_tui.value[:25],
                 group.link_gui.value[:25]
-            ))
-        UIHelpers.print_separator(120)
+            )
 
     def add_group(self, session: requests.Session, headers: dict):
         while True:
@@ -43,8 +42,9 @@ class GroupsManager:
                 print(f"\nHTTP Error: {e}. Please, try again.")
 
     def _add_group_backend(self, group: GroupProject, session: requests.Session, headers: dict):
-        res = session.post(
-            url=f"{self.base_url}groups/",
+        res = self.api.post(
+            session,
+            "groups/",
             json=group.to_dict(),
             headers=headers
         )
@@ -59,7 +59,6 @@ class GroupsManager:
             response_data = res.json()
             group_with_id = GroupProject.from_dict(response_data)
             self.gpm.add_group(group_with_id)
-            self.data_loader.index_to_id_groups[self.gpm.number_of_groups - 1] = group_with_id.id
             print('Group added!')
 
     def remove_group(self, session: requests.Session, headers: dict):
@@ -69,33 +68,33 @@ class GroupsManager:
         if index == 0:
             print('Cancelled!')
             return
+        impact = self.gpm.group_removal_impact(self.gpm.group_at_index(index - 1).id)
+        if impact and not UIHelpers.confirm(impact.describe()):
+            print('Cancelled!')
+            return
         self._remove_group_backend(index - 1, session, headers)
 
     def _remove_group_backend(self, index: int, session: requests.Session, headers: dict):
-        group_id = self.data_loader.index_to_id_groups[index]
-        res = session.delete(
-            url=f"{self.base_url}groups/{group_id}/",
+        group_id = self.gpm.group_at_index(index).id
+        res = self.api.delete(
+            session,
+            f"groups/{group_id}/",
             headers=headers
         )
         if res.status_code != 204:
             print("Error removing group")
         else:
-            self.gpm.remove_group(index)
-            del self.data_loader.index_to_id_groups[index]
-            new_mapping = {}
-            for i in range(self.gpm.number_of_groups):
-                old_index = i if i < index else i + 1
-                new_mapping[i] = self.data_loader.index_to_id_groups[old_index]
-            self.data_loader.index_to_id_groups = new_mapping
+            self.gpm.remove_group(index, cascade=True)
             print('Group removed!')
 
     def join_group(self, session: requests.Session, headers: dict):
         index = int(input('Enter group index to join: '))
         validate("index", index, min_value=1, max_value=self.gpm.number_of_groups)
 
-        group_id = self.data_loader.index_to_id_groups[index - 1]
-        res = session.post(
-            url=f"{self.base_url}groups/{group_id}/join/",
+        group_id = self.gpm.group_at_index(index - 1).id
+        res = self.api.post(
+            session,
+            f"groups/{group_id}/join/",
             headers=headers
         )
         if res.status_code not in [200, 201]:
@@ -108,9 +107,10 @@ class GroupsManager:
         index = int(input('Enter group index to leave: '))
         validate("index", index, min_value=1, max_value=self.gpm.number_of_groups)
 
-        group_id = self.data_loader.index_to_id_groups[index - 1]
-        res = session.delete(
-            url=f"{self.base_url}groups/{group_id}/leave/",
+        group_id = self.gpm.group_at_index(index - 1).id
+        res = self.api.delete(
+            session,
+            f"groups/{group_id}/leave/",
             headers=headers
         )
         if res.status_code != 204:
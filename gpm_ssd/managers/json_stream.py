@@ -0,0 +1,78 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]'
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Decode a top-level JSON array one element at a time from a stream of byte chunks."""
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buffer = buffer[pos:] + utf8.decode(b'', final=True)
+        else:
+            buffer = buffer[pos:] + utf8.decode(chunk)
+        pos = 0
+        return True
+
+    def skip_whitespace() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                raise ValueError('Unexpected end of JSON array')
+
+    if skip_whitespace() != '[':
+        raise ValueError('Expected a JSON array')
+    pos += 1
+    if skip_whitespace() == ']':
+        pos += 1
+    else:
+        while True:
+            while True:
+                skip_whitespace()
+                try:
+                    value, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if fill():
+                        continue
+                    raise
+                # A number cut by a chunk boundary decodes as a shorter number ("12" of "12.5"),
+                # so it only counts once a delimiter follows it.
+                truncated = end == len(buffer) or (
+                    isinstance(value, (int, float)) and buffer[end] not in _DELIMITERS
+                )
+                if truncated and fill():
+                    continue
+                break
+            pos = end
+            yield value
+            separator = skip_whitespace()
+            pos += 1
+            if separator == ']':
+                break
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {separator!r}")
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos < len(buffer):
+            raise ValueError('Unexpected data after JSON array')
+        if not fill():
+            return
@@ -0,0 +1,74 @@
+import threading
+from dataclasses import dataclass
+
+import requests
+
+
+@dataclass(frozen=True)
+class RevalidationStats:
+    hits: int
+    misses: int
+    bytes_saved: int
+    records_reused: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    etag: str | None
+    last_modified: str | None
+    entities: tuple
+    size: int
+
+
+class RevalidationCache:
+    """Validators (ETag / Last-Modified) and decoded entities of list endpoints, for conditional GETs."""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__entries: dict[tuple, _Entry] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__bytes_saved = 0
+        self.__records_reused = 0
+
+    def conditional_headers(self, key: tuple) -> dict:
+        with self.__lock:
+            entry = self.__entries.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def revalidated(self, key: tuple) -> tuple | None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            self.__hits += 1
+            self.__bytes_saved += entry.size
+            self.__records_reused += len(entry.entities)
+            return entry.entities
+
+    def store(self, key: tuple, res: requests.Response, entities: list, size: int) -> None:
+        etag = res.headers.get('ETag')
+        last_modified = res.headers.get('Last-Modified')
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        with self.__lock:
+            self.__misses += 1
+            if etag is None and last_modified is None:
+                self.__entries.pop(key, None)
+                return
+            self.__entries[key] = _Entry(etag, last_modified, tuple(entities), size)
+
+    def stats(self) -> RevalidationStats:
+        with self.__lock:
+            return RevalidationStats(self.__hits, self.__misses, self.__bytes_saved, self.__records_reused)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
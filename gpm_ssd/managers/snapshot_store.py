@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+class SnapshotStore:
+    """Versioned on-disk copy of a user's GPM data, one file per (base_url, username)."""
+
+    VERSION = 1
+
+    def __init__(self, directory: str | os.PathLike | None = None):
+        if directory is None:
+            directory = os.environ.get('GPM_SNAPSHOT_DIR') or Path.home() / '.cache' / 'gpm-tui' / 'snapshots'
+        self.directory = Path(directory)
+
+    def path_for(self, base_url: str, username: str) -> Path:
+        key = hashlib.sha256(f"{base_url}\0{username}".encode()).hexdigest()[:32]
+        return self.directory / f"{key}.json"
+
+    def save(self, base_url: str, username: str, payload: dict) -> None:
+        body = {
+            'version': self.VERSION,
+            'base_url': base_url,
+            'username': username,
+            'saved_at': time.time(),
+            'checksum': self.__checksum(payload),
+            'payload': payload,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.snapshot-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(body, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path_for(base_url, username))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, base_url: str, username: str) -> dict | None:
+        try:
+            with open(self.path_for(base_url, username), encoding='utf-8') as f:
+                body = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(body, dict) \
+                or body.get('version') != self.VERSION \
+                or body.get('base_url') != base_url \
+                or body.get('username') != username \
+                or body.get('checksum') != self.__checksum(body.get('payload')):
+            return None
+        return body['payload']
+
+    def discard(self, base_url: str, username: str) -> None:
+        try:
+            os.unlink(self.path_for(base_url, username))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __checksum(payload) -> str:
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()
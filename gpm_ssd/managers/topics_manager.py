@@ -2,26 +2,22 @@ import requests
 from valid8 import ValidationError, validate
 
 from gpm_ssd.domain import GPM, Topic, TopicTitle
-from gpm_ssd.managers.ui_helpers import UIHelpers
+from gpm_ssd.managers.api_client import ApiClient
+from gpm_ssd.managers.ui_helpers import Pager, UIHelpers
 from gpm_ssd.exceptions import HttpException
 
 
 class TopicsManager:
-    def __init__(self, base_url: str, gpm: GPM, data_loader):
-        self.base_url = base_url
+    def __init__(self, api: ApiClient, gpm: GPM, data_loader):
+        self.api = api
         self.gpm = gpm
         self.data_loader = data_loader
+        self.pager = Pager()
 
     def print_topics(self):
-        UIHelpers.print_separator(60)
-        fmt = '%3s %-50s'
-        print(fmt % ('Idx', 'TITLE'))
-        UIHelpers.print_separator(60)
-
-        for index in range(self.gpm.number_of_topics):
-            topic = self.gpm.topic_at_index(index)
-            print(fmt % (index + 1, topic.title.value[:50]))
-        UIHelpers.print_separator(60)
+        UIHelpers.print_table('%3s %-50s', ('TITLE',), self.pager, self.gpm.number_of_topics,
+                              lambda start, stop: ((topic.title.value[:50],) for topic in self.gpm.topics_slice(start, stop)),
+                              60)
 
     def add_topic(self, session: requests.Session, headers: dict):
         while True:
@@ -35,8 +31,9 @@ class TopicsManager:
                 print(f"\nHTTP Error: {e}. Please, try again.")
 
     def _add_topic_backend(self, topic: Topic, session: requests.Session, headers: dict):
-        res = session.post(
-            url=f"{self.base_url}topics/",
+        res = self.api.post(
+            session,
+            "topics/",
             json=topic.to_dict(),
             headers=headers
         )
@@ -47,7 +44,6 @@ class TopicsManager:
             response_data = res.json()
             topic_with_id = Topic.from_dict(response_data)
             self.gpm.add_topic(topic_with_id)
-            self.data_loader.index_to_id_topics[self.gpm.number_of_topics - 1] = topic_with_id.id
             print('Topic added!')
 
     def remove_topic(self, session: requests.Session, headers: dict):
@@ -57,24 +53,23 @@ class TopicsManager:
         if index == 0:
             print('Cancelled!')
             return
+        impact = self.gpm.topic_removal_impact(self.gpm.topic_at_index(index - 1).id)
+        if impact and not UIHelpers.confirm(impact.describe()):
+            print('Cancelled!')
+            return
         self._remove_topic_backend(index - 1, session, headers)
 
     def _remove_topic_backend(self, index: int, session: requests.Session, headers: dict):
-        topic_id = self.data_loader.index_to_id_topics[index]
-        res = session.delete(
-            url=f"{self.base_url}topics/{topic_id}/",
+        topic_id = self.gpm.topic_at_index(index).id
+        res = self.api.delete(
+            session,
+            f"topics/{topic_id}/",
             headers=headers
         )
         if res.status_code != 204:
             print("Error removing topic")
         else:
-            self.gpm.remove_topic(index)
-            del self.data_loader.index_to_id_topics[index]
-            new_mapping = {}
-            for i in range(self.gpm.number_of_topics):
-                old_index = i if i < index else i + 1
-                new_mapping[i] = self.data_loader.index_to_id_topics[old_index]
-            self.data_loader.index_to_id_topics = new_mapping
+            self.gpm.remove_topic(index, cascade=True)
             print('Topic removed!')
 
     def sort_topics(self):
@@ -1,5 +1,10 @@
-from typing import Callable, Any
-from valid8 import ValidationError
+import shutil
+from typing import Callable, Any, Iterable, Sequence
+from valid8 import ValidationError, validate
+
+# menu banner, table chrome, page footer, menu entries and prompt around a table
+_RESERVED_LINES = 18
+_MIN_PAGE_SIZE = 5
 
 
 class UIHelpers:
@@ -13,6 +18,23 @@ class UIHelpers:
             except (TypeError, ValueError, ValidationError) as e:
                 print(e)
 
+    @staticmethod
+    def confirm(prompt: str) -> bool:
+        return input(f'{prompt}. Continue? (y/N): ').strip().lower() in ('y', 'yes')
+
+    @staticmethod
+    def print_table(fmt: str, headers: Sequence[str], pager: 'Pager', total: int,
+                    rows: Callable[[int, int], Iterable[Sequence[Any]]], width: int = 80):
+        window = pager.window(total)
+        UIHelpers.print_separator(width)
+        print(fmt % ('Idx', *headers))
+        UIHelpers.print_separator(width)
+        for index, row in enumerate(rows(window.start, window.stop), window.start + 1):
+            print(fmt % (index, *row))
+        UIHelpers.print_separator(width)
+        if pager.pages(total) > 1:
+            print(f'Page {pager.page + 1}/{pager.pages(total)} (rows {window.start + 1}-{window.stop} of {total})')
+
     @staticmethod
     def print_separator(width: int = 80):
         print('-' * width)
@@ -22,3 +44,48 @@ class UIHelpers:
         UIHelpers.print_separator(width)
         print(f"{title:^{width}}")
         UIHelpers.print_separator(width)
+
+
+class Pager:
+    """The visible page of a table; the page size follows the terminal height unless fixed."""
+
+    def __init__(self, page_size: int | None = None):
+        if page_size is not None:
+            validate('page_size', page_size, min_value=1)
+        self.__page_size = page_size
+        self.__page = 0
+        self.__total = 0
+
+    @property
+    def page(self) -> int:
+        return self.__page
+
+    @property
+    def page_size(self) -> int:
+        if self.__page_size is not None:
+            return self.__page_size
+        return max(_MIN_PAGE_SIZE, shutil.get_terminal_size().lines - _RESERVED_LINES)
+
+    def pages(self, total: int) -> int:
+        return max(1, -(-total // self.page_size))
+
+    def window(self, total: int) -> range:
+        self.__total = total
+        self.__page = min(self.__page, self.pages(total) - 1)
+        start = self.__page * self.page_size
+        return range(start, min(start + self.page_size, total))
+
+    def next_page(self) -> None:
+        self.__page = min(self.__page + 1, self.pages(self.__total) - 1)
+
+    def prev_page(self) -> None:
+        self.__page = max(self.__page - 1, 0)
+
+    def jump(self) -> None:
+        pages = self.pages(self.__total)
+
+        def builder(line: str) -> int:
+            page = int(line)
+            validate('page', page, min_value=1, max_value=pages)
+            return page
+        self.__page = UIHelpers.read_input(f'Page (1-{pages})', builder) - 1
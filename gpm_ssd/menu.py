@@ -3,8 +3,12 @@ from typing import Callable, List, Dict, Optional, Any
 
 from valid8 import validate
 
+from validation.constraints import constraint
 from validation.dataclasses import validate_dataclass
-from validation.regex import pattern
+
+
+_DESCRIPTION = constraint('Description.value', min_len=1, max_len=1000, regex=r'[0-9A-Za-z ;.,_-]*')
+_KEY = constraint('Key.value', min_len=1, max_len=10, regex=r'[0-9A-Za-z_-]*')
 
 
 @dataclass(order=True, frozen=True)
@@ -13,7 +17,7 @@ class Description:
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('Description.value', self.value, min_len=1, max_len=1000, custom=pattern(r'[0-9A-Za-z ;.,_-]*'))
+        _DESCRIPTION(self.value)
 
     def __str__(self):
         return self.value
@@ -25,7 +29,7 @@ class Key:
 
     def __post_init__(self):
         validate_dataclass(self)
-        validate('Key.value', self.value, min_len=1, max_len=10, custom=pattern(r'[0-9A-Za-z_-]*'))
+        _KEY(self.value)
 
     def __str__(self):
         return self.value
@@ -0,0 +1,120 @@
+import heapq
+from dataclasses import dataclass
+from typing import Sequence
+
+from gpm_ssd.domain import GPM, GroupGoal
+from gpm_ssd.events import GOALS, GROUP_GOALS, ChangeEvent, Cleared, Inserted, Removed, Replaced
+
+# positions inside a group's running totals
+_EARNED, _TOTAL, _COMPLETED, _ASSIGNED = range(4)
+
+
+@dataclass(frozen=True, slots=True)
+class GroupProgress:
+    group_id: int
+    earned: int = 0
+    total: int = 0
+    completed: int = 0
+    assigned: int = 0
+
+    @property
+    def ratio(self) -> float:
+        return self.earned / self.total if self.total else 0.0
+
+
+class ProgressTracker:
+    """Per-group earned points, assigned points and completed goals, kept current from GPM change events.
+
+    The tracker mirrors goal points and the goal -> group-goal links itself, so a batch of
+    events can be applied in order regardless of the state GPM has reached by delivery time.
+    """
+
+    def __init__(self, gpm: GPM):
+        self.__points: dict[int, int] = {}
+        self.__by_goal: dict[int, dict[int, GroupGoal]] = {}
+        self.__totals: dict[int, list[int]] = {}
+        for goal in gpm.iter_goals():
+            self.__set_points(goal.id, goal.points.value)
+        for group_goal in gpm.iter_group_goals():
+            self.__count(group_goal, 1)
+        self.__unsubscribe = gpm.events.subscribe(self.__on_changes)
+
+    def close(self) -> None:
+        self.__unsubscribe()
+
+    def progress_of(self, group_id: int) -> GroupProgress:
+        totals = self.__totals.get(group_id)
+        return GroupProgress(group_id, *totals) if totals is not None else GroupProgress(group_id)
+
+    def leaderboard(self, k: int = 10) -> list[GroupProgress]:
+        top = heapq.nlargest(k, self.__totals.items(),
+                             key=lambda item: (item[1][_EARNED], item[1][_COMPLETED], -item[0]))
+        return [GroupProgress(group_id, *totals) for group_id, totals in top]
+
+    def __on_changes(self, events: Sequence[ChangeEvent]) -> None:
+        for event in events:
+            if event.collection == GROUP_GOALS:
+                self.__on_group_goal(event)
+            elif event.collection == GOALS:
+                self.__on_goal(event)
+
+    def __on_group_goal(self, event: ChangeEvent) -> None:
+        if isinstance(event, Inserted):
+            self.__count(event.entity, 1)
+        elif isinstance(event, Removed):
+            self.__count(event.entity, -1)
+        elif isinstance(event, Replaced):
+            self.__count(event.previous, -1)
+            self.__count(event.entity, 1)
+        elif isinstance(event, Cleared):
+            self.__by_goal.clear()
+            self.__totals.clear()
+
+    def __on_goal(self, event: ChangeEvent) -> None:
+        if isinstance(event, Inserted):
+            self.__set_points(event.entity.id, event.entity.points.value)
+        elif isinstance(event, Removed):
+            self.__set_points(event.entity.id, 0)
+        elif isinstance(event, Replaced):
+            if event.previous.id != event.entity.id:
+                self.__set_points(event.previous.id, 0)
+            self.__set_points(event.entity.id, event.entity.points.value)
+        elif isinstance(event, Cleared):
+            for goal_id in list(self.__points):
+                self.__set_points(goal_id, 0)
+
+    def __count(self, group_goal: GroupGoal, sign: int) -> None:
+        totals = self.__totals.get(group_goal.group_id)
+        if totals is None:
+            totals = self.__totals[group_goal.group_id] = [0, 0, 0, 0]
+        points = sign * self.__points.get(group_goal.goal_id, 0)
+        totals[_TOTAL] += points
+        totals[_ASSIGNED] += sign
+        if group_goal.complete:
+            totals[_EARNED] += points
+            totals[_COMPLETED] += sign
+        if not totals[_ASSIGNED]:
+            del self.__totals[group_goal.group_id]
+
+        if sign > 0:
+            self.__by_goal.setdefault(group_goal.goal_id, {})[id(group_goal)] = group_goal
+            return
+        linked = self.__by_goal.get(group_goal.goal_id)
+        if linked is not None and linked.pop(id(group_goal), None) is not None and not linked:
+            del self.__by_goal[group_goal.goal_id]
+
+    def __set_points(self, goal_id: int | None, points: int) -> None:
+        if goal_id is None:
+            return
+        delta = points - self.__points.get(goal_id, 0)
+        if points:
+            self.__points[goal_id] = points
+        else:
+            self.__points.pop(goal_id, None)
+        if not delta:
+            return
+        for group_goal in self.__by_goal.get(goal_id, {}).values():
+            totals = self.__totals[group_goal.group_id]
+            totals[_TOTAL] += delta
+            if group_goal.complete:
+                totals[_EARNED] += delta
@@ -0,0 +1,388 @@
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Any, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+class OrderedRegistry(Generic[T]):
+    """Entities in display order, together with an index of their server ids.
+
+    Entities live in chunks of at most ``2 * chunk_size`` items and a Fenwick tree over
+    the chunk lengths maps a position to its chunk, so positional access, insertion and
+    deletion cost O(log n) plus a bounded shift inside one chunk.
+
+    With an order set through ``order_by`` the registry stays sorted by that key: appends
+    are placed by binary search and bulk extends are merged in. Each entity's key is computed
+    once, when it is stored, and kept in chunks parallel to the entities; searches and merges
+    compare those stored keys. Explicit positions
+    (``insert``) and one-off ``sort`` calls drop the order. Replacing an entity with one
+    that sorts elsewhere is left to the caller, which should remove and append it instead.
+    """
+
+    chunk_size = 256
+
+    def __init__(self, entities: Iterable[T] = ()):
+        self.__chunks: list[list[T]] = []
+        self.__keys: list[list[Any]] = []
+        self.__tree: list[int] = [0]
+        self.__len = 0
+        self.__by_id: dict[Any, T] = {}
+        self.__chunk_of: dict[Any, list[T]] = {}
+        self.__chunk_index: dict[int, int] = {}
+        self.__order: Callable[[T], Any] | None = None
+        self.reset(entities)
+
+    @property
+    def order(self) -> Callable[[T], Any] | None:
+        return self.__order
+
+    def order_by(self, key: Callable[[T], Any] | None) -> None:
+        self.__order = key
+        if key is None:
+            self.__keys = []
+        else:
+            self.reset(self)
+
+    def __len__(self) -> int:
+        return self.__len
+
+    def __iter__(self) -> Iterator[T]:
+        for chunk in self.__chunks:
+            yield from chunk
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, OrderedRegistry):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == list(other)
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, OrderedRegistry):
+            return NotImplemented
+        return list(self) < list(other)
+
+    def __repr__(self) -> str:
+        return f'OrderedRegistry({list(self)!r})'
+
+    def __getitem__(self, index: int) -> T:
+        chunk, offset = self.__locate(index)
+        return self.__chunks[chunk][offset]
+
+    def __setitem__(self, index: int, entity: T) -> None:
+        chunk, offset = self.__locate(index)
+        items = self.__chunks[chunk]
+        self.__forget(items[offset])
+        items[offset] = entity
+        if self.__order is not None:
+            self.__keys[chunk][offset] = self.__order(entity)
+        self.__remember(entity, items)
+
+    def iter_range(self, start: int, stop: int) -> Iterator[T]:
+        # positions are trusted here: RegistryView checks them once, when it is created
+        if start >= stop:
+            return
+        chunk, offset = self.__locate(start)
+        remaining = stop - start
+        for items in self.__chunks[chunk:]:
+            taken = items[offset:offset + remaining] if offset or remaining < len(items) else items
+            yield from taken
+            remaining -= len(taken)
+            if not remaining:
+                return
+            offset = 0
+
+    def view(self, start: int = 0, stop: int | None = None) -> 'RegistryView[T]':
+        return RegistryView(self, start, len(self) if stop is None else stop)
+
+    def by_id(self, entity_id) -> T | None:
+        return self.__by_id.get(entity_id)
+
+    def position_of(self, entity_id) -> int | None:
+        entity = self.__by_id.get(entity_id)
+        if entity is None:
+            return None
+        items = self.__chunk_of[entity_id]
+        return self.__prefix(self.__chunk_index[id(items)]) + OrderedRegistry.__offset(items, entity)
+
+    def index(self, entity: T) -> int:
+        entity_id = entity.id
+        if entity_id is not None and self.__by_id.get(entity_id) is entity:
+            return self.position_of(entity_id)
+        for position, candidate in enumerate(self):
+            if candidate is entity:
+                return position
+        raise ValueError('entity is not in the registry')
+
+    def replace(self, entity_id, entity: T) -> T:
+        current = self.__by_id.get(entity_id)
+        if current is None:
+            raise KeyError(entity_id)
+        items = self.__chunk_of[entity_id]
+        offset = OrderedRegistry.__offset(items, current)
+        self.__forget(current)
+        items[offset] = entity
+        if self.__order is not None:
+            self.__keys[self.__chunk_index[id(items)]][offset] = self.__order(entity)
+        self.__remember(entity, items)
+        return current
+
+    def append(self, entity: T) -> int:
+        if self.__order is not None:
+            return self.__insort(entity)
+        if not self.__chunks:
+            self.reset((entity,))
+        else:
+            self.__insert_at(len(self.__chunks) - 1, len(self.__chunks[-1]), entity)
+        return self.__len - 1
+
+    def extend(self, entities: Iterable[T]) -> Sequence[int]:
+        # the input is consumed before anything is stored, so a failing iterable changes nothing
+        items = list(entities)
+        if self.__order is not None and items:
+            return self.__merge(items)
+        start = self.__len
+        size = self.chunk_size
+        chunks = self.__chunks
+        if chunks and len(chunks[-1]) < size:
+            last = chunks[-1]
+            head, items = items[:size - len(last)], items[size - len(last):]
+            last.extend(head)
+            for entity in head:
+                self.__remember(entity, last)
+        for begin in range(0, len(items), size):
+            chunk = items[begin:begin + size]
+            chunks.append(chunk)
+            for entity in chunk:
+                self.__remember(entity, chunk)
+        self.__len = sum(len(chunk) for chunk in chunks)
+        self.__rebuild()
+        return range(start, self.__len)
+
+    def insert(self, index: int, entity: T) -> None:
+        if not 0 <= index <= self.__len:
+            raise IndexError('registry index out of range')
+        self.__order = None
+        self.__keys = []
+        if not self.__chunks:
+            self.reset((entity,))
+            return
+        if index == self.__len:
+            chunk, offset = len(self.__chunks) - 1, len(self.__chunks[-1])
+        else:
+            chunk, offset = self.__locate(index)
+        self.__insert_at(chunk, offset, entity)
+
+    def __insert_at(self, chunk: int, offset: int, entity: T, key: Any = None) -> None:
+        items = self.__chunks[chunk]
+        items.insert(offset, entity)
+        if self.__order is not None:
+            self.__keys[chunk].insert(offset, self.__order(entity) if key is None else key)
+        self.__len += 1
+        self.__remember(entity, items)
+        if len(items) > 2 * self.chunk_size:
+            self.__split(chunk)
+        else:
+            self.__add(chunk, 1)
+
+    def pop(self, index: int = -1) -> T:
+        chunk, offset = self.__locate(index)
+        items = self.__chunks[chunk]
+        entity = items.pop(offset)
+        self.__len -= 1
+        self.__forget(entity)
+        if self.__order is not None:
+            del self.__keys[chunk][offset]
+        if items:
+            self.__add(chunk, -1)
+        else:
+            del self.__chunks[chunk]
+            if self.__order is not None:
+                del self.__keys[chunk]
+            self.__rebuild()
+        return entity
+
+    def clear(self) -> None:
+        self.reset(())
+
+    def sort(self, key: Callable[[T], Any] | None = None, reverse: bool = False) -> None:
+        self.__order = None
+        self.__keys = []
+        self.reset(sorted(self, key=key, reverse=reverse))
+
+    def reset(self, entities: Iterable[T]) -> None:
+        items = list(entities)
+        if self.__order is None:
+            self.__fill(items)
+            return
+        keys = [self.__order(entity) for entity in items]
+        ranked = sorted(range(len(items)), key=keys.__getitem__)
+        self.__fill([items[i] for i in ranked], [keys[i] for i in ranked])
+
+    def __insort(self, entity: T) -> int:
+        # ties go after the entities already in place, as a stable sort would put them
+        keys = self.__keys
+        if not keys:
+            self.reset((entity,))
+            return 0
+        entity_key = self.__order(entity)
+        chunk = bisect_right(keys, entity_key, key=itemgetter(-1))
+        if chunk == len(keys):
+            chunk, offset = chunk - 1, len(keys[-1])
+        else:
+            offset = bisect_right(keys[chunk], entity_key)
+        position = self.__prefix(chunk) + offset
+        self.__insert_at(chunk, offset, entity, entity_key)
+        return position
+
+    def __merge(self, items: list[T]) -> list[int]:
+        # positions are reported in the order the items were given
+        key = self.__order
+        keys = [key(entity) for entity in items]
+        existing = list(self)
+        existing_keys = [k for chunk in self.__keys for k in chunk]
+        merged, merged_keys = [], []
+        positions = [0] * len(items)
+        taken = 0
+        for i in sorted(range(len(items)), key=keys.__getitem__):
+            item_key = keys[i]
+            while taken < len(existing) and existing_keys[taken] <= item_key:
+                merged.append(existing[taken])
+                merged_keys.append(existing_keys[taken])
+                taken += 1
+            positions[i] = len(merged)
+            merged.append(items[i])
+            merged_keys.append(item_key)
+        merged.extend(existing[taken:])
+        merged_keys.extend(existing_keys[taken:])
+        self.__fill(merged, merged_keys)
+        return positions
+
+    def __fill(self, items: list[T], keys: list[Any] | None = None) -> None:
+        size = self.chunk_size
+        self.__chunks = [items[start:start + size] for start in range(0, len(items), size)]
+        self.__keys = [] if keys is None else [keys[start:start + size] for start in range(0, len(keys), size)]
+        self.__len = len(items)
+        self.__by_id.clear()
+        self.__chunk_of.clear()
+        for chunk in self.__chunks:
+            for entity in chunk:
+                self.__remember(entity, chunk)
+        self.__rebuild()
+
+    def __remember(self, entity: T, chunk: list[T]) -> None:
+        entity_id = entity.id
+        if entity_id is not None:
+            self.__by_id[entity_id] = entity
+            self.__chunk_of[entity_id] = chunk
+
+    def __forget(self, entity: T) -> None:
+        entity_id = entity.id
+        if entity_id is not None and self.__by_id.get(entity_id) is entity:
+            del self.__by_id[entity_id]
+            del self.__chunk_of[entity_id]
+
+    @staticmethod
+    def __offset(items: list[T], entity: T) -> int:
+        # by identity: an equal entity earlier in the chunk must not be mistaken for this one
+        for offset, candidate in enumerate(items):
+            if candidate is entity:
+                return offset
+        raise ValueError('entity is not in its chunk')
+
+    def __split(self, chunk: int) -> None:
+        items = self.__chunks[chunk]
+        half = len(items) // 2
+        tail = items[half:]
+        del items[half:]
+        self.__chunks.insert(chunk + 1, tail)
+        if self.__order is not None:
+            keys = self.__keys[chunk]
+            self.__keys.insert(chunk + 1, keys[half:])
+            del keys[half:]
+        for entity in tail:
+            if entity.id is not None and self.__by_id.get(entity.id) is entity:
+                self.__chunk_of[entity.id] = tail
+        self.__rebuild()
+
+    def __rebuild(self) -> None:
+        chunks = self.__chunks
+        tree = [0] * (len(chunks) + 1)
+        for i, items in enumerate(chunks, 1):
+            tree[i] += len(items)
+            parent = i + (i & -i)
+            if parent <= len(chunks):
+                tree[parent] += tree[i]
+        self.__tree = tree
+        self.__chunk_index = {id(items): i for i, items in enumerate(chunks)}
+
+    def __add(self, chunk: int, delta: int) -> None:
+        tree = self.__tree
+        i = chunk + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def __prefix(self, chunk: int) -> int:
+        # number of entities stored in chunks before ``chunk``
+        tree = self.__tree
+        total = 0
+        i = chunk
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def __locate(self, index: int) -> tuple[int, int]:
+        if index < 0:
+            index += self.__len
+        if not 0 <= index < self.__len:
+            raise IndexError('registry index out of range')
+        tree = self.__tree
+        chunk = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            following = chunk + step
+            if following < len(tree) and tree[following] <= index:
+                chunk = following
+                index -= tree[following]
+            step >>= 1
+        return chunk, index
+
+
+class RegistryView(Sequence[T]):
+    """Read-only window over positions ``start:stop`` of a registry, valid until the registry changes."""
+
+    __slots__ = ('__registry', '__start', '__stop')
+
+    def __init__(self, registry: OrderedRegistry[T], start: int, stop: int):
+        if not 0 <= start <= stop <= len(registry):
+            raise IndexError('view bounds out of range')
+        self.__registry = registry
+        self.__start = start
+        self.__stop = stop
+
+    @property
+    def start(self) -> int:
+        return self.__start
+
+    @property
+    def stop(self) -> int:
+        return self.__stop
+
+    def __len__(self) -> int:
+        return self.__stop - self.__start
+
+    def __iter__(self) -> Iterator[T]:
+        return self.__registry.iter_range(self.__start, self.__stop)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('view index out of range')
+        return self.__registry[self.__start + index]
+
+    def __repr__(self) -> str:
+        return f'RegistryView({list(self)!r})'
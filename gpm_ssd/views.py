@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from typing import Iterator, Sequence
+
+from gpm_ssd.domain import GPM, GroupGoal
+from gpm_ssd.events import GOALS, GROUP_GOALS, GROUPS, TOPICS, ChangeEvent, Cleared, Inserted, Removed, Replaced
+
+UNKNOWN = "Unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class GroupGoalRow:
+    group_goal: GroupGoal
+    group_name: str
+    topic_title: str
+    goal_title: str
+    points: int
+    complete: bool
+
+
+class GroupGoalRows:
+    """Group-goal rows with group, topic and goal already resolved, patched from GPM change events.
+
+    Rows are keyed by group-goal identity and walked in GPM's display order, so reordering
+    costs nothing here. A change to a group, goal or topic re-resolves only the rows that
+    reference it.
+    """
+
+    def __init__(self, gpm: GPM):
+        self.__gpm = gpm
+        self.__rows: dict[int, GroupGoalRow] = {}
+        self.__by_group: dict[int, dict[int, GroupGoal]] = {}
+        self.__by_goal: dict[int, dict[int, GroupGoal]] = {}
+        for group_goal in gpm.iter_group_goals():
+            self.__add(group_goal)
+        self.__unsubscribe = gpm.events.subscribe(self.__on_changes)
+
+    def close(self) -> None:
+        self.__unsubscribe()
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def rows(self, start: int = 0, stop: int | None = None) -> Iterator[GroupGoalRow]:
+        rows = self.__rows
+        for group_goal in self.__gpm.group_goals_slice(start, stop):
+            yield rows[id(group_goal)]
+
+    def __on_changes(self, events: Sequence[ChangeEvent]) -> None:
+        for event in events:
+            if event.collection == GROUP_GOALS:
+                self.__on_group_goal(event)
+            elif isinstance(event, Cleared):
+                self.__refresh_all()
+            elif isinstance(event, (Inserted, Removed, Replaced)):
+                self.__on_reference(event)
+
+    def __on_group_goal(self, event: ChangeEvent) -> None:
+        if isinstance(event, Inserted):
+            self.__add(event.entity)
+        elif isinstance(event, Removed):
+            self.__remove(event.entity)
+        elif isinstance(event, Replaced):
+            self.__remove(event.previous)
+            self.__add(event.entity)
+        elif isinstance(event, Cleared):
+            self.__rows.clear()
+            self.__by_group.clear()
+            self.__by_goal.clear()
+
+    def __on_reference(self, event: ChangeEvent) -> None:
+        changed = [event.entity] if not isinstance(event, Replaced) else [event.previous, event.entity]
+        for entity in changed:
+            if event.collection == GROUPS:
+                self.__refresh(self.__by_group.get(entity.id))
+            elif event.collection == GOALS:
+                self.__refresh(self.__by_goal.get(entity.id))
+            elif event.collection == TOPICS:
+                for group in self.__gpm.groups_of_topic(entity.id):
+                    self.__refresh(self.__by_group.get(group.id))
+
+    def __refresh(self, group_goals: dict[int, GroupGoal] | None) -> None:
+        for key, group_goal in (group_goals or {}).items():
+            self.__rows[key] = self.__resolve(group_goal)
+
+    def __refresh_all(self) -> None:
+        for key, row in self.__rows.items():
+            self.__rows[key] = self.__resolve(row.group_goal)
+
+    def __add(self, group_goal: GroupGoal) -> None:
+        key = id(group_goal)
+        self.__rows[key] = self.__resolve(group_goal)
+        self.__by_group.setdefault(group_goal.group_id, {})[key] = group_goal
+        self.__by_goal.setdefault(group_goal.goal_id, {})[key] = group_goal
+
+    def __remove(self, group_goal: GroupGoal) -> None:
+        key = id(group_goal)
+        self.__rows.pop(key, None)
+        for multimap, linked_id in ((self.__by_group, group_goal.group_id), (self.__by_goal, group_goal.goal_id)):
+            bucket = multimap.get(linked_id)
+            if bucket is not None and bucket.pop(key, None) is not None and not bucket:
+                del multimap[linked_id]
+
+    def __resolve(self, group_goal: GroupGoal) -> GroupGoalRow:
+        gpm = self.__gpm
+        group = gpm.group_by_id(group_goal.group_id)
+        goal = gpm.goal_by_id(group_goal.goal_id)
+        topic = gpm.topic_by_id(group.topic_id) if group is not None else None
+        return GroupGoalRow(
+            group_goal,
+            group.name.value if group is not None else UNKNOWN,
+            topic.title.value if topic is not None else UNKNOWN,
+            goal.title.value if goal is not None else UNKNOWN,
+            goal.points.value if goal is not None else 0,
+            group_goal.complete,
+        )
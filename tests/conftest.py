@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('GPM_SNAPSHOT_DIR', str(tmp_path / 'snapshots'))
@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from gpm_ssd.app import App
+from gpm_ssd.domain import GroupProject, GroupName
+from gpm_ssd.managers import ApiClient
+
+
+BASE_URL = 'http://localhost:8000/api/v1/'
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def api(sleeps):
+    return ApiClient(BASE_URL, max_retries=3, sleep=sleeps.append)
+
+
+def response(status_code: int, headers: dict | None = None) -> MagicMock:
+    res = MagicMock()
+    res.status_code = status_code
+    res.headers = headers or {}
+    return res
+
+
+# ==================== TEST REQUESTS ====================
+
+def test_request_builds_url_and_sets_timeout(api):
+    session = MagicMock()
+    session.get.return_value = response(200)
+
+    res = api.get(session, 'groups/', headers={'Authorization': 'Bearer x'})
+
+    assert res.status_code == 200
+    kwargs = session.get.call_args.kwargs
+    assert kwargs['url'] == f'{BASE_URL}groups/'
+    assert kwargs['headers'] == {'Authorization': 'Bearer x'}
+    assert kwargs['timeout'] == (api.connect_timeout, api.read_timeout)
+
+
+def test_configure_mounts_sized_pool():
+    api = ApiClient(BASE_URL, pool_size=32)
+    session = requests.Session()
+    api.configure(session)
+
+    adapter = session.get_adapter(BASE_URL)
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 0
+
+
+# ==================== TEST RETRIES ====================
+
+def test_idempotent_request_retries_on_503_honouring_retry_after(api, sleeps):
+    session = MagicMock()
+    session.get.side_effect = [response(503, {'Retry-After': '2'}), response(429), response(200)]
+
+    assert api.get(session, 'goals/').status_code == 200
+    assert session.get.call_count == 3
+    assert sleeps[0] == 2.0
+    assert 0 <= sleeps[1] <= api.backoff * 2
+
+
+def test_non_idempotent_request_is_not_retried(api, sleeps):
+    session = MagicMock()
+    session.post.return_value = response(503)
+
+    assert api.post(session, 'goals/', json={}).status_code == 503
+    assert session.post.call_count == 1
+    assert sleeps == []
+
+
+def test_connection_errors_are_retried_then_raised(api, sleeps):
+    session = MagicMock()
+    session.delete.side_effect = requests.ConnectionError('refused')
+
+    with pytest.raises(requests.ConnectionError):
+        api.delete(session, 'goals/1/')
+    assert session.delete.call_count == api.max_retries + 1
+    assert len(sleeps) == api.max_retries
+    assert all(0 <= delay <= api.max_backoff for delay in sleeps)
+
+
+def test_retry_after_beyond_deadline_returns_response(sleeps):
+    api = ApiClient(BASE_URL, deadline=5, sleep=sleeps.append)
+    session = MagicMock()
+    session.get.return_value = response(503, {'Retry-After': '60'})
+
+    assert api.get(session, 'goals/').status_code == 503
+    assert session.get.call_count == 1
+    assert sleeps == []
+
+
+# ==================== TEST METRICS ====================
+
+def test_every_call_is_recorded(api):
+    session = MagicMock()
+    session.get.side_effect = [response(503), response(200)]
+    session.post.side_effect = requests.Timeout('slow')
+
+    api.get(session, 'goals/')
+    with pytest.raises(requests.Timeout):
+        api.post(session, 'goals/')
+
+    get_call, post_call = api.calls()
+    assert (get_call.method, get_call.path, get_call.status, get_call.attempts) == ('GET', 'goals/', 200, 2)
+    assert (post_call.method, post_call.status, post_call.attempts) == ('POST', None, 1)
+    assert 'slow' in post_call.error
+    assert get_call.elapsed >= 0
+
+
+# ==================== TEST APP INTEGRATION ====================
+
+@patch('builtins.print')
+@patch('builtins.input', side_effect=['2', '2', '1', '0', '0'])
+def test_network_errors_do_not_crash_the_menu(mocked_input, mocked_print):
+    app = App()
+    mock_session = MagicMock()
+    mock_session.post.side_effect = requests.ConnectionError('refused')
+
+    app._App__auth.token = MagicMock()
+    app._App__auth.session = mock_session
+    app._App__gpm.add_group(GroupProject(GroupName("Test Group"), topic_id=1, id=1))
+
+    app.run()
+
+    mocked_print.assert_any_call('Network error: refused')
+    assert mocked_input.call_count == 5
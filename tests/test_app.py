@@ -1,10 +1,14 @@
-from unittest.mock import patch, MagicMock
+import os
+from unittest.mock import ANY, patch, MagicMock
 
 import pytest
 
 from gpm_ssd.__main__ import main
 from gpm_ssd.app import App
-from gpm_ssd.domain import Goal, GoalTitle, GoalDescription, Points, Topic, TopicTitle, GroupProject, GroupName
+from gpm_ssd.managers import Pager
+from gpm_ssd.domain import (
+    Goal, GoalTitle, GoalDescription, Points, Topic, TopicTitle, GroupProject, GroupName, GroupGoal
+)
 
 
 # ==================== FIXTURES ====================
@@ -104,8 +108,9 @@ def test_logout_success(mocked_input):
     app.run()
 
     mock_session.post.assert_called_once_with(
-        f"{app._App__base_url}auth/logout/",
-        headers={"Authorization": "Bearer test_token"}
+        url=f"{app._App__base_url}auth/logout/",
+        headers={"Authorization": "Bearer test_token"},
+        timeout=ANY
     )
 
 
@@ -122,8 +127,9 @@ def test_logout_failure(mocked_input):
     app.run()
 
     mock_session.post.assert_called_once_with(
-        f"{app._App__base_url}auth/logout/",
-        headers={"Authorization": "Bearer test_token"}
+        url=f"{app._App__base_url}auth/logout/",
+        headers={"Authorization": "Bearer test_token"},
+        timeout=ANY
     )
 
 
@@ -234,6 +240,25 @@ def test_sort_goals_by_points(mocked_print, mocked_input, sample_goals):
     mocked_print.assert_any_call('Goals sorted by points!')
 
 
+@patch('builtins.input', side_effect=['3', '3', '2', '2', '0', '0'])
+@patch('builtins.print')
+def test_remove_goal_after_sort_deletes_displayed_goal(mocked_print, mocked_input, sample_goals):
+    app = App()
+    mock_session = MagicMock()
+    mock_session.delete.return_value.status_code = 204
+    app._App__auth.token = MagicMock()
+    app._App__auth.token.is_staff.return_value = True
+    app._App__auth.session = mock_session
+
+    for goal in sample_goals:
+        app._App__gpm.add_goal(goal)
+
+    app.run()
+
+    assert mock_session.delete.call_args.kwargs['url'].endswith('goals/3/')
+    assert [app._App__gpm.goal_at_index(i).id for i in range(2)] == [1, 2]
+
+
 # ==================== TEST ADD TOPIC ====================
 
 @patch('builtins.print')
@@ -316,6 +341,51 @@ def test_remove_topic_can_be_cancelled(mocked_print, mocked_input):
     mocked_print.assert_any_call('Cancelled!')
 
 
+def populate_topic_with_dependents(app, sample_topics, sample_groups):
+    gpm = app._App__gpm
+    gpm.add_topics(sample_topics)
+    gpm.add_groups(sample_groups)
+    gpm.add_goals([Goal(GoalTitle("Goal 1"), GoalDescription("Description 1"), Points.create(5), id=1)])
+    gpm.add_group_goals([GroupGoal(group_id=1, goal_id=1, id=1), GroupGoal(group_id=2, goal_id=1, id=2)])
+
+
+@patch('builtins.input', side_effect=['4', '2', '1', 'y', '0', '0'])
+@patch('builtins.print')
+def test_remove_topic_previews_and_cascades(mocked_print, mocked_input, sample_topics, sample_groups):
+    app = App()
+    mock_session = MagicMock()
+    mock_session.delete.return_value.status_code = 204
+    app._App__auth.token = MagicMock()
+    app._App__auth.token.is_staff.return_value = True
+    app._App__auth.session = mock_session
+    populate_topic_with_dependents(app, sample_topics, sample_groups)
+
+    app.run()
+
+    mocked_input.assert_any_call('This removes 1 group and 1 assignment. Continue? (y/N): ')
+    assert mock_session.delete.call_args.kwargs['url'].endswith('topics/1/')
+    gpm = app._App__gpm
+    assert [group.id for group in gpm.iter_groups()] == [2]
+    assert [gg.id for gg in gpm.iter_group_goals()] == [2]
+
+
+@patch('builtins.input', side_effect=['4', '2', '1', 'n', '0', '0'])
+@patch('builtins.print')
+def test_remove_topic_declined_preview_sends_nothing(mocked_print, mocked_input, sample_topics, sample_groups):
+    app = App()
+    mock_session = MagicMock()
+    app._App__auth.token = MagicMock()
+    app._App__auth.token.is_staff.return_value = True
+    app._App__auth.session = mock_session
+    populate_topic_with_dependents(app, sample_topics, sample_groups)
+
+    app.run()
+
+    mock_session.delete.assert_not_called()
+    mocked_print.assert_any_call('Cancelled!')
+    assert app._App__gpm.number_of_groups == 2
+
+
 # ==================== TEST SORT TOPICS ====================
 
 @patch('builtins.input', side_effect=['4', '3', '0'])
@@ -399,7 +469,6 @@ def test_join_group(mocked_input, mocked_print):
     app._App__auth.session = mock_session
     
     app._App__gpm.add_group(GroupProject(GroupName("Test Group"), topic_id=1, id=1))
-    app._App__data_loader.index_to_id_groups[0] = 1
     
     app.run()
 
@@ -418,7 +487,6 @@ def test_leave_group(mocked_input, mocked_print):
     app._App__auth.session = mock_session
     
     app._App__gpm.add_group(GroupProject(GroupName("Test Group"), topic_id=1, id=1))
-    app._App__data_loader.index_to_id_groups[0] = 1
     
     app.run()
 
@@ -517,7 +585,6 @@ def test_remove_group_goal(mocked_input, mocked_print):
     
     from gpm_ssd.domain import GroupGoal
     app._App__gpm.add_group_goal(GroupGoal(group_id=1, goal_id=1, complete=False, id=1))
-    app._App__data_loader.index_to_id_group_goals[0] = 1
     
     app.run()
 
@@ -545,11 +612,14 @@ def test_toggle_group_goal(mocked_input, mocked_print):
     
     from gpm_ssd.domain import GroupGoal
     app._App__gpm.add_group_goal(GroupGoal(group_id=1, goal_id=1, complete=False, id=1))
-    app._App__data_loader.index_to_id_group_goals[0] = 1
+    app._App__gpm.add_group_goal(GroupGoal(group_id=1, goal_id=2, complete=False, id=2))
     
     app.run()
 
     mocked_print.assert_any_call('Group Goal toggled!')
+    gpm = app._App__gpm
+    assert [gpm.group_goal_at_index(i).id for i in range(gpm.number_of_group_goals())] == [1, 2]
+    assert gpm.group_goal_at_index(0).complete
     mocked_input.assert_called()
 
 
@@ -587,7 +657,6 @@ def test_remove_group_goal_http_error(mocked_input, mocked_print):
     
     from gpm_ssd.domain import GroupGoal
     app._App__gpm.add_group_goal(GroupGoal(group_id=1, goal_id=1, complete=False, id=1))
-    app._App__data_loader.index_to_id_group_goals[0] = 1
     
     app.run()
 
@@ -608,7 +677,6 @@ def test_toggle_group_goal_http_error(mocked_input, mocked_print):
     
     from gpm_ssd.domain import GroupGoal
     app._App__gpm.add_group_goal(GroupGoal(group_id=1, goal_id=1, complete=False, id=1))
-    app._App__data_loader.index_to_id_group_goals[0] = 1
     
     app.run()
 
@@ -631,6 +699,30 @@ def test_print_group_goals(mocked_input, mocked_print):
     app.run()
     
     mocked_input.assert_called()
+    mocked_print.assert_any_call('%3s %-30s %-25s %-40s %6s %-10s' % (1, 'Group 1', 'Unknown', 'Goal 1', 5, '✓'))
+
+
+@patch('builtins.print')
+@patch('builtins.input', side_effect=['5', '4', '3', '1', '4', '0', '0'])
+def test_leaderboard_follows_toggled_group_goals(mocked_input, mocked_print):
+    app = App()
+    mock_session = MagicMock()
+    mock_session.patch.return_value.status_code = 200
+    mock_session.patch.return_value.json.return_value = {'id': 1, 'group': 1, 'goal': 1, 'complete': True}
+    app._App__auth.token = MagicMock()
+    app._App__auth.token.is_staff.return_value = True
+    app._App__auth.session = mock_session
+
+    from gpm_ssd.domain import GroupGoal
+    app._App__gpm.add_group(GroupProject(GroupName("Group 1"), topic_id=1, id=1))
+    app._App__gpm.add_goal(Goal(GoalTitle("Goal 1"), GoalDescription("Desc"), Points.create(5), id=1))
+    app._App__gpm.add_group_goal(GroupGoal(group_id=1, goal_id=1, complete=False, id=1))
+
+    app.run()
+
+    fmt = '%4s %-30s %8s %8s %10s'
+    mocked_print.assert_any_call(fmt % (1, 'Group 1', 0, 5, '0/1'))
+    mocked_print.assert_any_call(fmt % (1, 'Group 1', 5, 5, '1/1'))
 
 
 # ==================== TEST SORT GROUPS ====================
@@ -664,7 +756,6 @@ def test_join_group_http_error(mocked_input, mocked_print):
     app._App__auth.session = mock_session
     
     app._App__gpm.add_group(GroupProject(GroupName("Test Group"), topic_id=1, id=1))
-    app._App__data_loader.index_to_id_groups[0] = 1
     
     app.run()
 
@@ -684,7 +775,6 @@ def test_leave_group_http_error(mocked_input, mocked_print):
     app._App__auth.session = mock_session
     
     app._App__gpm.add_group(GroupProject(GroupName("Test Group"), topic_id=1, id=1))
-    app._App__data_loader.index_to_id_groups[0] = 1
     
     app.run()
 
@@ -704,7 +794,6 @@ def test_remove_group_http_error(mocked_input, mocked_print):
     app._App__auth.session = mock_session
     
     app._App__gpm.add_group(GroupProject(GroupName("Test Group"), topic_id=1, id=1))
-    app._App__data_loader.index_to_id_groups[0] = 1
     
     app.run()
 
@@ -724,7 +813,6 @@ def test_remove_goal_http_error(mocked_input, mocked_print):
     app._App__auth.session = mock_session
     
     app._App__gpm.add_goal(Goal(GoalTitle("Goal 1"), GoalDescription("Desc"), Points.create(5), id=1))
-    app._App__data_loader.index_to_id_goals[0] = 1
     
     app.run()
 
@@ -743,13 +831,53 @@ def test_remove_topic_http_error(mocked_input, mocked_print):
     app._App__auth.token.is_staff.return_value = True
     app._App__auth.session = mock_session
     app._App__gpm.add_topic(Topic(TopicTitle("Topic 1"), id=1))
-    app._App__data_loader.index_to_id_topics[0] = 1
     
     app.run()
 
     mocked_print.assert_any_call('Error removing topic')
 
 
+# ==================== TEST PAGINATION ====================
+
+@patch('builtins.input', side_effect=['4', 'n', 'j', '3', 'n', 'p', '0', '0'])
+@patch('builtins.print')
+def test_topics_are_rendered_one_page_at_a_time(mocked_print, mocked_input):
+    app = App()
+    app._App__auth.token = MagicMock()
+    app._App__auth.token.is_staff.return_value = True
+    app._App__gpm.add_topics(Topic(TopicTitle(f"Topic {i}"), id=i) for i in range(1, 31))
+    app._App__topics_mgr.pager = Pager(10)
+
+    app.run()
+
+    printed = [call.args[0] for call in mocked_print.call_args_list if call.args]
+    rows = [line for line in printed if isinstance(line, str) and line[:3].strip().isdigit()]
+    assert [int(line.split()[0]) for line in rows] == [
+        *range(1, 11), *range(11, 21), *range(21, 31), *range(21, 31), *range(11, 21)
+    ]
+    mocked_input.assert_any_call('Page (1-3): ')
+    mocked_print.assert_any_call('Page 3/3 (rows 21-30 of 30)')
+
+
+def test_pager_follows_terminal_height_and_shrinking_tables():
+    with patch('gpm_ssd.managers.ui_helpers.shutil.get_terminal_size', return_value=os.terminal_size((80, 40))):
+        assert Pager().page_size == 22
+    with patch('gpm_ssd.managers.ui_helpers.shutil.get_terminal_size', return_value=os.terminal_size((80, 10))):
+        assert Pager().page_size == 5
+
+    pager = Pager(10)
+    assert pager.window(0) == range(0, 0)
+    pager.window(25)
+    pager.next_page()
+    pager.next_page()
+    pager.next_page()
+    assert pager.window(25) == range(20, 25)
+    assert pager.window(12) == range(10, 12)
+    pager.prev_page()
+    pager.prev_page()
+    assert pager.window(12) == range(0, 10)
+
+
 # ==================== TEST LOAD DATA ====================
 
 @patch('gpm_ssd.managers.auth_handler.getpass', return_value='test_password')
@@ -1078,4 +1206,45 @@ def test_login_already_logged_in(mocked_print, mocked_input):
     
     app.run()
     
-    mocked_input.assert_called()
\ No newline at end of file
+    mocked_input.assert_called()
+
+# ==================== TEST SYNC ====================
+
+@patch('builtins.input', side_effect=['7', '0'])
+@patch('builtins.print')
+def test_sync_requires_login(mocked_print, mocked_input):
+    app = App()
+    app.run()
+
+    mocked_print.assert_any_call('You must login first')
+
+
+@patch('builtins.input', side_effect=['7', '0'])
+@patch('builtins.print')
+def test_sync_merges_server_changes(mocked_print, mocked_input, sample_topics):
+    app = App()
+    mock_session = MagicMock()
+
+    def get_side_effect(url, **kwargs):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        if 'topics' in url:
+            mock_resp.json.return_value = [
+                {'id': 1, 'title': 'Topic 1'},
+                {'id': 3, 'title': 'Topic 3'}
+            ]
+        else:
+            mock_resp.json.return_value = []
+        return mock_resp
+
+    mock_session.get.side_effect = get_side_effect
+    app._App__auth.token = MagicMock()
+    app._App__auth.session = mock_session
+    for topic in sample_topics:
+        app._App__gpm.add_topic(topic)
+
+    app.run()
+
+    mocked_print.assert_any_call('Sync complete: 1 added, 0 updated, 1 removed')
+    assert app._App__gpm.number_of_topics == 2
+    assert app._App__gpm.topic_at_index(1).title.value == 'Topic 3'
@@ -0,0 +1,211 @@
+import base64
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from gpm_ssd.domain import Token
+from gpm_ssd.managers import ApiClient, AuthHandler, PermissionContext
+
+
+BASE_URL = 'http://localhost:8000/api/v1/'
+
+
+# ==================== FIXTURES ====================
+
+def b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+
+def jwt(token_type: str = 'access', **payload) -> str:
+    return f"{b64({'alg': 'HS256', 'typ': 'JWT'})}.{b64({'token_type': token_type, **payload})}.c2ln"
+
+
+REFRESH_1 = jwt('refresh', exp=1, jti='1')
+REFRESH_2 = jwt('refresh', exp=1, jti='2')
+
+
+def response(status_code: int, json_body: dict | None = None) -> MagicMock:
+    res = MagicMock()
+    res.status_code = status_code
+    res.headers = {}
+    res.json.return_value = json_body or {}
+    return res
+
+
+@pytest.fixture
+def api():
+    return ApiClient(BASE_URL, sleep=lambda _: None)
+
+
+@pytest.fixture
+def auth(api):
+    handler = AuthHandler(api)
+    handler.session = MagicMock()
+    handler.token = Token.from_response({'access': jwt(user_id=1, exp=1), 'refresh': REFRESH_1})
+    return handler
+
+
+# ==================== TEST TOKEN ====================
+
+def test_refreshed_token_keeps_refresh_when_not_rotated():
+    token = Token.from_response({'access': jwt(exp=1), 'refresh': REFRESH_1})
+    refreshed = token.refreshed({'access': jwt(exp=2)})
+    assert refreshed.refresh == REFRESH_1
+    assert refreshed.access_expires_at == 2
+
+
+# ==================== TEST REFRESH ====================
+
+def test_refresh_replaces_token(auth):
+    fresh = jwt(user_id=1, exp=2)
+    auth.session.post.return_value = response(200, {'access': fresh, 'refresh': REFRESH_2})
+
+    assert auth.refresh()
+    assert auth.token.access == fresh
+    assert auth.token.refresh == REFRESH_2
+    kwargs = auth.session.post.call_args.kwargs
+    assert kwargs['url'] == f'{BASE_URL}auth/token/refresh/'
+    assert kwargs['json'] == {'refresh': REFRESH_1}
+
+
+def test_refresh_failure_keeps_token(auth):
+    token = auth.token
+    auth.session.post.return_value = response(401)
+    assert not auth.refresh()
+    assert auth.token is token
+
+
+def test_401_is_retried_once_with_refreshed_token(auth):
+    stale = auth.token.access
+    fresh = jwt(user_id=1, exp=2)
+    auth.session.get.side_effect = [response(401), response(200)]
+    auth.session.post.return_value = response(200, {'access': fresh})
+
+    res = auth.api.get(auth.session, 'groups/', headers=auth.get_headers())
+
+    assert res.status_code == 200
+    headers = [call.kwargs['headers'] for call in auth.session.get.call_args_list]
+    assert headers == [{'Authorization': f'Bearer {stale}'}, {'Authorization': f'Bearer {fresh}'}]
+
+
+def test_401_without_authorization_is_not_retried(auth):
+    auth.session.get.return_value = response(401)
+    assert auth.api.get(auth.session, 'groups/').status_code == 401
+    auth.session.post.assert_not_called()
+
+
+def test_concurrent_401s_share_one_refresh(auth):
+    fresh = jwt(user_id=1, exp=2)
+    refreshing = threading.Event()
+
+    def post(**kwargs):
+        refreshing.set()
+        time.sleep(0.05)
+        return response(200, {'access': fresh})
+
+    def get(**kwargs):
+        return response(200 if kwargs['headers']['Authorization'] == f'Bearer {fresh}' else 401)
+
+    auth.session.post.side_effect = post
+    auth.session.get.side_effect = get
+    headers = auth.get_headers()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(auth.api.get(auth.session, 'groups/', headers=headers)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [res.status_code for res in results] == [200] * 8
+    assert auth.session.post.call_count == 1
+
+
+def test_refresh_racing_logout_does_not_log_back_in(auth):
+    refreshing = threading.Event()
+    release = threading.Event()
+
+    def post(**kwargs):
+        if kwargs['url'].endswith('auth/token/refresh/'):
+            refreshing.set()
+            release.wait(2)
+            return response(200, {'access': jwt(user_id=1, exp=int(time.time()) + 3600)})
+        return response(200)
+
+    auth.session.post.side_effect = post
+    refresher = threading.Thread(target=auth.refresh)
+    refresher.start()
+    assert refreshing.wait(2)
+    logout = threading.Thread(target=lambda: auth.logout(lambda: None))
+    logout.start()
+    time.sleep(0.05)
+    release.set()
+    refresher.join()
+    logout.join()
+
+    assert auth.token is None
+    assert auth.session is None
+    assert not auth.is_authenticated()
+
+
+def test_refresh_response_after_logout_is_dropped(auth):
+    session = auth.session
+
+    def post(**kwargs):
+        auth.token = None
+        auth.session = None
+        return response(200, {'access': jwt(user_id=1, exp=2)})
+
+    session.post.side_effect = post
+    assert not auth.refresh()
+    assert auth.token is None
+    assert not auth.is_authenticated()
+
+
+# ==================== TEST PERMISSIONS ====================
+
+def test_permissions_are_cached_per_token(auth):
+    permissions = auth.permissions
+    assert permissions == PermissionContext(is_authenticated=True, is_staff=False, user_id=1)
+    assert auth.permissions is permissions
+
+
+def test_permissions_follow_refreshed_token(auth):
+    assert not auth.is_staff()
+    auth.session.post.return_value = response(200, {'access': jwt(user_id=1, exp=1, is_staff=True)})
+    assert auth.refresh()
+    assert auth.is_staff()
+
+
+def test_permissions_are_anonymous_after_logout(auth):
+    assert auth.is_authenticated()
+    auth.session.post.return_value = response(200)
+    assert auth.logout(lambda: None)
+    assert auth.permissions == PermissionContext()
+    assert not auth.is_authenticated()
+
+
+# ==================== TEST SCHEDULING ====================
+
+def test_expired_token_is_not_scheduled(auth):
+    auth.session.post.return_value = response(200, {'access': jwt(user_id=1, exp=1)})
+    assert auth.refresh()
+    assert auth.session.post.call_count == 1
+    assert not [t for t in threading.enumerate() if isinstance(t, threading.Timer)]
+
+
+def test_refresh_is_scheduled_before_expiry(auth):
+    auth.refresh_margin = 3600
+    auth.session.post.side_effect = [
+        response(200, {'access': jwt(user_id=1, exp=int(time.time()) + 3600)}),
+        response(200, {'access': jwt(user_id=1, exp=1)}),
+    ]
+    assert auth.refresh()
+
+    deadline = time.monotonic() + 2
+    while auth.session.post.call_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert auth.session.post.call_count == 2
@@ -0,0 +1,399 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from gpm_ssd.domain import GPM, GroupName, GroupProject
+from gpm_ssd.managers import DataLoader, SnapshotStore, SyncReport
+
+
+BASE_URL = 'http://localhost:8000/api/v1/'
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture
+def payloads():
+    return {
+        'auth/user/': {'pk': 1},
+        'group-users/': [
+            {'id': 1, 'user': 1, 'group': 1},
+            {'id': 2, 'user': 2, 'group': 2},
+        ],
+        'groups/': [
+            {'id': 1, 'name': 'Group 1', 'topic': 1, 'link_django': '', 'link_tui': '', 'link_gui': ''},
+            {'id': 2, 'name': 'Invalid\nName', 'topic': 1, 'link_django': '', 'link_tui': '', 'link_gui': ''},
+            {'id': 3, 'name': 'Group 3', 'topic': 2, 'link_django': '', 'link_tui': '', 'link_gui': ''},
+        ],
+        'goals/': [
+            {'id': 1, 'title': 'Goal 1', 'description': 'Desc 1', 'points': 5},
+            {'id': 2, 'title': 'Goal 2', 'description': 'Desc 2', 'points': 3},
+        ],
+        'topics/': [
+            {'id': 1, 'title': 'Topic 1'},
+            {'id': 2, 'title': 'Topic 2'},
+        ],
+        'group-goals/': [
+            {'id': 1, 'group': 1, 'goal': 1, 'complete': False},
+            {'id': 2, 'group': 3, 'goal': 2, 'complete': True},
+        ],
+    }
+
+
+@pytest.fixture
+def session(payloads):
+    def get_side_effect(url, **kwargs):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = payloads[url.removeprefix(BASE_URL)]
+        return mock_resp
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = get_side_effect
+    return mock_session
+
+
+def ids(count: int, at_index) -> list:
+    return [at_index(i).id for i in range(count)]
+
+
+def snapshot(loader: DataLoader) -> tuple:
+    gpm = loader.gpm
+    return (
+        [gpm.group_at_index(i) for i in range(gpm.number_of_groups)],
+        [gpm.goal_at_index(i) for i in range(gpm.number_of_goals)],
+        [gpm.topic_at_index(i) for i in range(gpm.number_of_topics)],
+        [gpm.group_goal_at_index(i) for i in range(gpm.number_of_group_goals())],
+        loader.user_groups,
+    )
+
+
+# ==================== TEST CONCURRENT LOADING ====================
+
+def test_concurrent_load_matches_serial_load(session):
+    serial = DataLoader(BASE_URL, GPM(), max_workers=1)
+    concurrent = DataLoader(BASE_URL, GPM(), max_workers=4)
+
+    assert serial.load_all_data(session, {}) == 1
+    assert concurrent.load_all_data(session, {}) == 1
+
+    assert snapshot(concurrent) == snapshot(serial)
+    assert ids(concurrent.gpm.number_of_groups, concurrent.gpm.group_at_index) == [1, 3]
+    assert ids(concurrent.gpm.number_of_group_goals(), concurrent.gpm.group_goal_at_index) == [1, 2]
+    assert concurrent.user_groups == {1}
+
+
+def test_concurrent_load_fetches_every_collection(session):
+    loader = DataLoader(BASE_URL, GPM())
+    loader.load_all_data(session, {'Authorization': 'Bearer token'})
+
+    urls = sorted(call.kwargs['url'] for call in session.get.call_args_list)
+    assert urls == sorted(f'{BASE_URL}{path}' for path in [
+        'auth/user/', 'group-users/', 'groups/', 'goals/', 'topics/', 'group-goals/'
+    ])
+    for call in session.get.call_args_list:
+        assert call.kwargs['headers'] == {'Authorization': 'Bearer token'}
+
+
+def test_concurrent_load_propagates_network_errors(session):
+    session.get.side_effect = ConnectionError('unreachable')
+    loader = DataLoader(BASE_URL, GPM())
+
+    with pytest.raises(ConnectionError):
+        loader.load_all_data(session, {})
+
+
+# ==================== TEST SNAPSHOT WARM START ====================
+
+def test_cold_start_loads_from_server_and_saves_snapshot(session, tmp_path):
+    store = SnapshotStore(tmp_path)
+    loader = DataLoader(BASE_URL, GPM(), snapshot_store=store)
+
+    assert loader.load_for_user(session, {}, 'alice') == 1
+    assert loader.last_load.mode == 'cold'
+    assert store.load(BASE_URL, 'alice') is not None
+
+
+def test_warm_start_restores_snapshot_then_refreshes(session, payloads, tmp_path):
+    store = SnapshotStore(tmp_path)
+    cold = DataLoader(BASE_URL, GPM(), snapshot_store=store)
+    cold.load_for_user(session, {}, 'alice')
+
+    payloads['topics/'].append({'id': 3, 'title': 'Topic 3'})
+    warm = DataLoader(BASE_URL, GPM(), snapshot_store=store)
+    assert warm.load_for_user(session, {}, 'alice') == 1
+    assert warm.last_load.mode == 'warm'
+    assert snapshot(warm) == snapshot(cold)
+
+    warm.wait_for_refresh()
+    assert warm.apply_pending_refresh()
+    assert warm.gpm.number_of_topics == 3
+    assert ids(warm.gpm.number_of_topics, warm.gpm.topic_at_index) == [1, 2, 3]
+    assert warm.last_load.refreshed_after is not None
+    assert not warm.apply_pending_refresh()
+    assert len(store.load(BASE_URL, 'alice')['topics']) == 3
+
+
+def test_refresh_is_dropped_after_logout(session, tmp_path):
+    store = SnapshotStore(tmp_path)
+    DataLoader(BASE_URL, GPM(), snapshot_store=store).load_for_user(session, {}, 'alice')
+
+    loader = DataLoader(BASE_URL, GPM(), snapshot_store=store)
+    loader.load_for_user(session, {}, 'alice')
+    loader.clear_all()
+    loader.wait_for_refresh()
+
+    assert not loader.apply_pending_refresh()
+    assert loader.gpm.number_of_groups == 0
+
+
+def test_refresh_is_rebased_onto_local_changes(session, payloads, tmp_path):
+    store = SnapshotStore(tmp_path)
+    DataLoader(BASE_URL, GPM(), snapshot_store=store).load_for_user(session, {}, 'alice')
+
+    payloads['topics/'].append({'id': 3, 'title': 'Topic 3'})
+    payloads['groups/'][0]['name'] = 'Renamed on server'
+    payloads['goals/'].pop()
+    loader = DataLoader(BASE_URL, GPM(), snapshot_store=store)
+    loader.load_for_user(session, {}, 'alice')
+    loader.wait_for_refresh()
+    local = GroupProject(GroupName("Local"), topic_id=1, id=99)
+    loader.gpm.add_group(local)
+    loader.gpm.remove_group(loader.gpm.index_of_group(3))
+
+    assert loader.apply_pending_refresh()
+    assert ids(loader.gpm.number_of_groups, loader.gpm.group_at_index) == [1, 99]
+    assert loader.gpm.group_by_id(1).name.value == 'Renamed on server'
+    assert loader.gpm.group_by_id(99) is local
+    assert ids(loader.gpm.number_of_goals, loader.gpm.goal_at_index) == [1]
+    assert loader.gpm.number_of_topics == 3
+    assert not loader.gpm.events.active
+
+
+def test_sorting_during_a_pending_refresh_keeps_the_refresh(session, payloads, tmp_path):
+    store = SnapshotStore(tmp_path)
+    DataLoader(BASE_URL, GPM(), snapshot_store=store).load_for_user(session, {}, 'alice')
+
+    payloads['goals/'].append({'id': 3, 'title': 'Goal 3', 'description': 'Desc 3', 'points': 4})
+    loader = DataLoader(BASE_URL, GPM(), snapshot_store=store)
+    loader.load_for_user(session, {}, 'alice')
+    loader.gpm.sort_goals_by_points()
+    loader.wait_for_refresh()
+
+    assert loader.apply_pending_refresh()
+    assert ids(loader.gpm.number_of_goals, loader.gpm.goal_at_index) == [1, 3, 2]
+    assert loader.gpm.goal_order == 'points'
+
+
+def test_unreadable_snapshot_falls_back_to_cold_start(session, tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.save(BASE_URL, 'alice', {'groups': [{'id': 1}]})
+
+    loader = DataLoader(BASE_URL, GPM(), snapshot_store=store)
+    loader.load_for_user(session, {}, 'alice')
+
+    assert loader.last_load.mode == 'cold'
+    assert loader.gpm.number_of_groups == 2
+
+
+# ==================== TEST CONDITIONAL GET REVALIDATION ====================
+
+@pytest.fixture
+def validating_session(payloads):
+    def get_side_effect(url, headers, **kwargs):
+        path = url.removeprefix(BASE_URL)
+        etag = f'"{path}-v1"'
+        mock_resp = MagicMock()
+        if headers.get('If-None-Match') == etag:
+            mock_resp.status_code = 304
+            mock_resp.json.side_effect = AssertionError('304 has no body')
+            return mock_resp
+        mock_resp.status_code = 200
+        mock_resp.headers = {'ETag': etag} if path != 'auth/user/' else {}
+        mock_resp.content = b'x' * 100
+        mock_resp.json.return_value = payloads[path]
+        return mock_resp
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = get_side_effect
+    return mock_session
+
+
+def test_not_modified_collections_reuse_cached_entities(validating_session):
+    loader = DataLoader(BASE_URL, GPM(), max_workers=1)
+    loader.load_all_data(validating_session, {})
+    first = snapshot(loader)
+    groups_before = [loader.gpm.group_at_index(i) for i in range(loader.gpm.number_of_groups)]
+
+    loader.clear_all()
+    loader.load_all_data(validating_session, {})
+
+    assert snapshot(loader) == first
+    assert all(a is b for a, b in zip(groups_before, (loader.gpm.group_at_index(i) for i in range(2))))
+    stats = loader.revalidation_cache.stats()
+    assert stats.misses == 4
+    assert stats.hits == 4
+    assert stats.bytes_saved == 400
+    assert stats.records_reused == 2 + 2 + 2 + 2
+
+
+def test_conditional_headers_are_sent_once_validators_are_known(validating_session):
+    loader = DataLoader(BASE_URL, GPM())
+    loader.load_all_data(validating_session, {'Authorization': 'Bearer token'})
+    validating_session.get.reset_mock()
+
+    loader.load_all_data(validating_session, {'Authorization': 'Bearer token'})
+
+    sent = {call.kwargs['url'].removeprefix(BASE_URL): call.kwargs['headers']
+            for call in validating_session.get.call_args_list}
+    assert sent['goals/'] == {'Authorization': 'Bearer token', 'If-None-Match': '"goals/-v1"'}
+    assert sent['auth/user/'] == {'Authorization': 'Bearer token'}
+
+
+def test_responses_without_validators_are_not_cached(session):
+    loader = DataLoader(BASE_URL, GPM())
+    loader.load_all_data(session, {})
+    loader.load_all_data(session, {})
+
+    assert loader.revalidation_cache.stats().hits == 0
+    assert loader.revalidation_cache.conditional_headers((None, 'groups/')) == {}
+
+
+# ==================== TEST STREAMING DECODING ====================
+
+@pytest.fixture
+def streaming_session(payloads):
+    def get_side_effect(url, **kwargs):
+        body = json.dumps(payloads[url.removeprefix(BASE_URL)]).encode()
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.headers = {'Content-Length': str(len(body))}
+        mock_resp.json.return_value = json.loads(body)
+        mock_resp.iter_content.side_effect = lambda chunk_size: (
+            body[i:i + 5] for i in range(0, len(body), 5)
+        )
+        return mock_resp
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = get_side_effect
+    return mock_session
+
+
+def test_streamed_load_matches_buffered_load(streaming_session, capsys):
+    buffered = DataLoader(BASE_URL, GPM())
+    buffered.load_all_data(streaming_session, {})
+    buffered_output = capsys.readouterr().out
+
+    streamed = DataLoader(BASE_URL, GPM())
+    streamed.stream_threshold = 0
+    streamed.load_all_data(streaming_session, {})
+
+    assert snapshot(streamed) == snapshot(buffered)
+    assert capsys.readouterr().out == buffered_output
+    assert 'Warning: Failed to load group' in buffered_output
+
+
+def test_small_responses_are_not_streamed(streaming_session):
+    responses = []
+    get = streaming_session.get.side_effect
+    streaming_session.get.side_effect = lambda url, **kwargs: responses.append(get(url, **kwargs)) or responses[-1]
+
+    DataLoader(BASE_URL, GPM()).load_all_data(streaming_session, {})
+
+    assert len(responses) == 6
+    assert all(res.iter_content.call_count == 0 for res in responses)
+
+
+# ==================== TEST DELTA SYNC ====================
+
+def test_sync_applies_only_the_diff(session, payloads):
+    loader = DataLoader(BASE_URL, GPM())
+    loader.load_all_data(session, {})
+    goal_1 = loader.gpm.goal_at_index(0)
+    topics_before = [loader.gpm.topic_at_index(i) for i in range(loader.gpm.number_of_topics)]
+
+    payloads['goals/'][1]['points'] = 1
+    payloads['goals/'].append({'id': 3, 'title': 'Goal 3', 'description': 'Desc 3', 'points': 2})
+    del payloads['groups/'][0]
+
+    report = loader.sync(session, {})
+
+    assert report == SyncReport(inserted=1, updated=1, deleted=1, unchanged=6)
+    assert loader.gpm.goal_at_index(0) is goal_1
+    assert loader.gpm.goal_at_index(1).points.value == 1
+    assert loader.gpm.goal_at_index(2).id == 3
+    assert [loader.gpm.topic_at_index(i) for i in range(2)] == topics_before
+    assert all(loader.gpm.topic_at_index(i) is t for i, t in enumerate(topics_before))
+    assert ids(loader.gpm.number_of_goals, loader.gpm.goal_at_index) == [1, 2, 3]
+    assert loader.gpm.group_at_index(0).id == 3
+
+
+def test_sync_without_changes_is_a_no_op(session):
+    loader = DataLoader(BASE_URL, GPM())
+    loader.load_all_data(session, {})
+    before = snapshot(loader)
+
+    assert loader.sync(session, {}) == SyncReport(unchanged=8)
+    assert snapshot(loader) == before
+
+
+def test_sync_reuses_not_modified_collections(validating_session):
+    loader = DataLoader(BASE_URL, GPM())
+    loader.load_all_data(validating_session, {})
+    before = snapshot(loader)
+
+    assert loader.sync(validating_session, {}) == SyncReport(unchanged=8)
+    assert snapshot(loader) == before
+    assert loader.revalidation_cache.stats().hits == 4
+
+
+def evict_before_answering(loader: DataLoader, validating_session) -> list:
+    answer = validating_session.get.side_effect
+    sent = []
+
+    def get_side_effect(url, headers, **kwargs):
+        sent.append((url.removeprefix(BASE_URL), 'If-None-Match' in headers))
+        if 'If-None-Match' in headers:
+            loader.revalidation_cache.clear()
+        return answer(url=url, headers=headers, **kwargs)
+
+    validating_session.get.side_effect = get_side_effect
+    return sent
+
+
+def test_not_modified_after_eviction_refetches_the_full_list(validating_session):
+    loader = DataLoader(BASE_URL, GPM(), max_workers=1)
+    loader.load_all_data(validating_session, {})
+    first = snapshot(loader)
+    sent = evict_before_answering(loader, validating_session)
+
+    loader.clear_all()
+    loader.load_all_data(validating_session, {})
+
+    assert snapshot(loader) == first
+    assert sent[2:4] == [('groups/', True), ('groups/', False)]
+    assert loader.revalidation_cache.stats().hits == 0
+
+
+def test_sync_after_eviction_diffs_the_full_list(validating_session):
+    loader = DataLoader(BASE_URL, GPM())
+    loader.load_all_data(validating_session, {})
+    evict_before_answering(loader, validating_session)
+
+    assert loader.sync(validating_session, {}) == SyncReport(unchanged=8)
+    assert loader.gpm.number_of_goals == 2
+
+def test_sync_requests_updated_since_view_when_supported(session, payloads):
+    loader = DataLoader(BASE_URL, GPM(), updated_since_param='updated_since')
+    loader.load_all_data(session, {})
+    session.get.reset_mock()
+    payloads['topics/'] = [{'id': 2, 'title': 'Renamed topic'}]
+
+    report = loader.sync(session, {})
+
+    list_calls = [c for c in session.get.call_args_list if c.kwargs['url'].endswith(('groups/', 'topics/'))]
+    assert all('updated_since' in c.kwargs['params'] for c in list_calls)
+    assert report.updated == 1
+    assert report.deleted == 0
+    assert loader.gpm.topic_at_index(0).title.value == 'Topic 1'
+    assert loader.gpm.topic_at_index(1).title.value == 'Renamed topic'
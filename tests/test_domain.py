@@ -1,9 +1,11 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 from valid8 import ValidationError
 
 from gpm_ssd.domain import (
     GroupName, TopicTitle, GoalTitle, GoalDescription, Points, Link,
-    Topic, Goal, GroupProject, GroupGoal, UserGroup, Token, GPM
+    Topic, Goal, GroupProject, GroupGoal, UserGroup, Token, TokenClaims, GPM, RemovalImpact
 )
 
 
@@ -162,6 +164,23 @@ def test_token_is_staff_false():
     assert token.is_staff() == False
 
 
+def test_token_claims_are_parsed_once():
+    staff_token = 'eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9.eyJ0b2tlbl90eXBlIjoiYWNjZXNzIiwiZXhwIjoxNzM0MTg3MjAwLCJpc19zdGFmZiI6dHJ1ZX0.fake'
+    token = Token.from_response({
+        'access': staff_token,
+        'refresh': staff_token
+    })
+    assert token.claims == TokenClaims(token_type='access', exp=1734187200, is_staff=True)
+    assert token.claims is token.claims
+    assert token.access_expires_at == 1734187200
+
+
+def test_token_claims_ignore_malformed_optional_claims():
+    claims = TokenClaims.from_payload({'token_type': 'access', 'exp': 1, 'is_staff': 'yes', 'user_id': '7'})
+    assert claims.is_staff == False
+    assert claims.user_id is None
+
+
 # ==================== TEST ENTITIES ====================
 
 def test_topic_to_dict():
@@ -297,6 +316,89 @@ def test_user_group_from_dict():
     assert user_group.group_id == 10
 
 
+def test_entities_are_slotted():
+    group = GroupProject(GroupName("Group"), topic_id=1, id=1)
+    for value in (group, group.name, group.link_django, Points.create(3), GroupGoal(1, 1), UserGroup(1, 1), GPM()):
+        assert not hasattr(value, '__dict__')
+    with pytest.raises(FrozenInstanceError):
+        group.topic_id = 2
+
+
+# ==================== TEST BULK DECODING ====================
+
+def decode_outcome(cls, data, trust):
+    try:
+        return list(cls.from_dicts([data], trust=trust))[0]
+    except Exception as e:
+        return type(e), str(e)
+
+
+TRUSTED_CASES = [
+    (Topic, [
+        {'id': 1, 'title': 'Topic'}, {'title': 'T' * 100}, {'id': None, 'title': 'T'},
+        {'id': 1, 'title': ''}, {'id': 1, 'title': 'T' * 101}, {'id': 1, 'title': 'caf\u00e9'}, {'id': 1, 'title': 'a\tb'},
+        {'id': 0, 'title': 'T'}, {'id': True, 'title': 'T'}, {'id': '1', 'title': 'T'}, {'id': 1}, {'id': 1, 'title': 7}, [],
+    ]),
+    (Goal, [
+        {'id': 1, 'title': 'Goal', 'description': '', 'points': 5}, {'title': 'G', 'description': 'D' * 400, 'points': 1},
+        {'id': 1, 'title': 'Goal', 'description': 'D' * 401, 'points': 5}, {'id': 1, 'title': 'Goal', 'description': '', 'points': 6},
+        {'id': 1, 'title': 'Goal', 'description': '', 'points': 0}, {'id': 1, 'title': 'Goal', 'description': '', 'points': True},
+        {'id': 1, 'title': 'Goal', 'description': '', 'points': 2.0}, {'id': 1, 'title': 'Goal', 'points': 2},
+        {'id': 1, 'title': '\x7f', 'description': '', 'points': 2}, {'id': -1, 'title': 'Goal', 'description': '', 'points': 2},
+    ]),
+    (GroupProject, [
+        {'id': 1, 'name': 'Group', 'topic': 1, 'link_django': 'x', 'link_tui': '', 'link_gui': 'y'}, {'name': 'G', 'topic': 2},
+        {'id': 1, 'name': 'Group', 'topic': 0}, {'id': 1, 'name': 'Group', 'topic': None}, {'id': 1, 'name': 'Group'},
+        {'id': 1, 'name': 'Group', 'topic': 1, 'link_tui': 'x' * 201}, {'id': 1, 'name': 'Group', 'topic': 1, 'link_gui': None},
+        {'id': 1, 'name': 'Gr\noup', 'topic': 1}, {'id': 1, 'name': 'Group', 'topic': False},
+    ]),
+    (GroupGoal, [
+        {'id': 1, 'group': 1, 'goal': 2, 'complete': True}, {'group': 1, 'goal': 2}, {'id': 1, 'group': 1, 'goal': 2, 'complete': 1},
+        {'id': 1, 'group': 0, 'goal': 2}, {'id': 1, 'group': 1, 'goal': None}, {'id': 1, 'goal': 2}, {'id': 1.5, 'group': 1, 'goal': 2},
+    ]),
+]
+
+
+@pytest.mark.parametrize('cls, records', TRUSTED_CASES, ids=lambda c: getattr(c, '__name__', ''))
+def test_trusted_decoding_matches_full_validation(cls, records):
+    for data in records:
+        trusted, validated = decode_outcome(cls, data, True), decode_outcome(cls, data, False)
+        assert trusted == validated, data
+        if not isinstance(trusted, tuple):
+            assert type(trusted) is cls
+            assert hash(trusted) == hash(validated)
+
+
+def test_trusted_batch_with_an_invalid_record_falls_back_to_full_validation():
+    errors = []
+    records = [{'id': i, 'title': f'Topic {i}' if i != 5000 else ''} for i in range(1, 6001)]
+    topics = list(Topic.from_dicts(iter(records), trust=True, on_error=lambda data, e: errors.append(data['id'])))
+    assert [topic.id for topic in topics] == [i for i in range(1, 6001) if i != 5000]
+    assert errors == [5000]
+    assert topics == list(Topic.from_dicts(records, on_error=lambda data, e: None))
+
+
+def test_from_dicts_yields_in_order():
+    records = [{'id': i, 'title': f'Goal {i}', 'description': '', 'points': i % 5 + 1} for i in range(1, 6)]
+    goals = list(Goal.from_dicts(iter(records), trust=True))
+    assert [goal.id for goal in goals] == [1, 2, 3, 4, 5]
+    assert goals == list(Goal.from_dicts(records))
+
+
+def test_from_dicts_reports_and_skips_invalid_records():
+    errors = []
+    records = [{'id': 1, 'title': 'Topic'}, {'id': 2, 'title': ''}, {'id': 3, 'title': 'Other'}]
+    topics = list(Topic.from_dicts(records, on_error=lambda data, e: errors.append((data['id'], e))))
+    assert [topic.id for topic in topics] == [1, 3]
+    assert [entity_id for entity_id, _ in errors] == [2]
+    assert isinstance(errors[0][1], ValidationError)
+
+
+def test_from_dicts_raises_without_error_handler():
+    with pytest.raises(ValidationError):
+        list(GroupGoal.from_dicts([{'id': 1, 'group': 0, 'goal': 1}]))
+
+
 # ==================== TEST GPM AGGREGATE ====================
 
 def test_number_of_groups(sample_groups):
@@ -475,4 +577,207 @@ def test_clear_all():
     assert gpm.number_of_groups == 0
     assert gpm.number_of_goals == 0
     assert gpm.number_of_topics == 0
-    assert gpm.number_of_group_goals() == 0
\ No newline at end of file
+    assert gpm.number_of_group_goals() == 0
+
+def test_id_indexes_follow_mutations():
+    gpm = GPM()
+    first = GroupProject(GroupName("B"), topic_id=1, id=1)
+    second = GroupProject(GroupName("A"), topic_id=1, id=2)
+    gpm.add_group(first)
+    gpm.add_group(second)
+    gpm.add_group(GroupProject(GroupName("No id"), topic_id=1))
+    assert gpm.group_by_id(1) is first
+    assert gpm.group_by_id(3) is None
+
+    gpm.sort_groups_by_name()
+    assert gpm.group_by_id(2) is second
+
+    renamed = GroupProject(GroupName("C"), topic_id=1, id=2)
+    gpm.replace_group_by_id(2, renamed)
+    assert gpm.group_by_id(2) is renamed
+    assert gpm.index_of_group(2) == 1
+
+    gpm.remove_group(0)
+    assert gpm.group_by_id(1) is None
+    assert gpm.group_by_id(2) is renamed
+
+    gpm.clear_groups()
+    assert gpm.group_by_id(2) is None
+
+
+def test_id_indexes_cover_every_collection():
+    gpm = GPM()
+    goal = Goal(GoalTitle("Goal"), GoalDescription(""), Points.create(1), id=4)
+    topic = Topic(TopicTitle("Topic"), id=5)
+    group_goal = GroupGoal(group_id=1, goal_id=4, id=6)
+    gpm.add_goal(goal)
+    gpm.add_topic(topic)
+    gpm.add_group_goal(group_goal)
+    assert gpm.goal_by_id(4) is goal
+    assert gpm.topic_by_id(5) is topic
+    assert gpm.group_goal_by_id(6) is group_goal
+
+    copy = GPM()
+    copy.load_from(gpm)
+    gpm.clear_all()
+    assert gpm.goal_by_id(4) is None
+    assert copy.goal_by_id(4) is goal
+    assert copy.group_goal_by_id(6) is group_goal
+
+
+def test_group_goal_multimaps_follow_mutations():
+    gpm = GPM()
+    first = GroupGoal(group_id=1, goal_id=10, id=1)
+    second = GroupGoal(group_id=1, goal_id=20, id=2)
+    third = GroupGoal(group_id=2, goal_id=10, id=3)
+    for group_goal in (first, second, third):
+        gpm.add_group_goal(group_goal)
+    assert gpm.group_goals_of_group(1) == (first, second)
+    assert gpm.group_goals_of_goal(10) == (first, third)
+    assert gpm.group_goals_of_group(99) == ()
+
+    completed = GroupGoal(group_id=1, goal_id=10, complete=True, id=1)
+    gpm.replace_group_goal_by_id(1, completed)
+    assert set(gpm.group_goals_of_group(1)) == {completed, second}
+
+    gpm.remove_group_goal(1)
+    assert gpm.group_goals_of_group(1) == (completed,)
+    assert gpm.group_goals_of_goal(20) == ()
+
+    gpm.clear_group_goals()
+    assert gpm.group_goals_of_goal(10) == ()
+
+
+def test_equal_group_goals_without_id_are_kept_apart():
+    gpm = GPM()
+    gpm.add_group_goal(GroupGoal(group_id=1, goal_id=1))
+    gpm.add_group_goal(GroupGoal(group_id=1, goal_id=1))
+    assert len(gpm.group_goals_of_group(1)) == 2
+    gpm.remove_group_goal(0)
+    assert len(gpm.group_goals_of_group(1)) == 1
+
+
+def test_groups_of_topic_follow_mutations():
+    gpm = GPM()
+    gpm.add_group(GroupProject(GroupName("A"), topic_id=1, id=1))
+    gpm.add_group(GroupProject(GroupName("B"), topic_id=2, id=2))
+    moved = GroupProject(GroupName("B"), topic_id=1, id=2)
+    gpm.replace_group_by_id(2, moved)
+    assert [group.id for group in gpm.groups_of_topic(1)] == [1, 2]
+    assert gpm.groups_of_topic(2) == ()
+
+    copy = GPM()
+    copy.load_from(gpm)
+    gpm.remove_group(0)
+    assert gpm.groups_of_topic(1) == (moved,)
+    assert len(copy.groups_of_topic(1)) == 2
+
+
+def test_replace_by_id_keeps_position_and_indexes():
+    gpm = GPM()
+    for i in range(1, 4):
+        gpm.add_group_goal(GroupGoal(group_id=1, goal_id=i, id=i))
+    completed = GroupGoal(group_id=2, goal_id=2, complete=True, id=2)
+    gpm.replace_group_goal_by_id(2, completed)
+    assert [gpm.group_goal_at_index(i).id for i in range(3)] == [1, 2, 3]
+    assert gpm.group_goal_at_index(1) is completed
+    assert gpm.index_of_group_goal(2) == 1
+    assert gpm.group_goals_of_group(2) == (completed,)
+    assert [gg.id for gg in gpm.group_goals_of_group(1)] == [1, 3]
+
+    gpm.add_goal(Goal(GoalTitle("Old"), GoalDescription("D"), Points.create(1), id=7))
+    gpm.replace_goal_by_id(7, Goal(GoalTitle("New"), GoalDescription("D"), Points.create(1), id=7))
+    assert gpm.goal_by_id(7).title.value == "New"
+
+
+def test_iteration_and_slices_follow_display_order(sample_goals):
+    gpm = GPM()
+    for goal in sample_goals:
+        gpm.add_goal(goal)
+    gpm.sort_goals_by_points()
+    ordered = [gpm.goal_at_index(i) for i in range(gpm.number_of_goals)]
+    assert list(gpm.iter_goals()) == ordered
+    assert list(gpm.goals_slice(1)) == ordered[1:]
+    assert len(gpm.goals_slice(0, 2)) == 2
+    assert list(gpm.groups_slice()) == []
+    with pytest.raises(IndexError):
+        gpm.goals_slice(0, gpm.number_of_goals + 1)
+
+
+def test_bulk_add_returns_positions_and_links():
+    gpm = GPM()
+    gpm.add_group(GroupProject(GroupName("A"), topic_id=1, id=1))
+    groups = [GroupProject(GroupName(f"G{i}"), topic_id=2, id=i) for i in range(2, 5)]
+    assert gpm.add_groups(groups) == range(1, 4)
+    assert gpm.groups_of_topic(2) == tuple(groups)
+    assert gpm.index_of_group(4) == 3
+
+    group_goals = [GroupGoal(group_id=1, goal_id=i, id=i) for i in range(1, 3)]
+    assert gpm.add_group_goals(iter(group_goals)) == range(0, 2)
+    assert gpm.group_goals_of_group(1) == tuple(group_goals)
+    assert gpm.add_topics([]) == range(0, 0)
+
+
+def test_sort_orders_persist_across_mutations(sample_goals):
+    gpm = GPM()
+    gpm.add_goals(sample_goals)
+    gpm.sort_goals_by_points()
+    assert gpm.goal_order == 'points'
+
+    gpm.add_goal(Goal(GoalTitle("Goal 0"), GoalDescription(""), Points.create(4), id=4))
+    gpm.add_goals([Goal(GoalTitle("Goal 9"), GoalDescription(""), Points.create(1), id=5)])
+    assert [gpm.goal_at_index(i).id for i in range(gpm.number_of_goals)] == [1, 4, 3, 2, 5]
+
+    gpm.replace_goal_by_id(2, Goal(GoalTitle("Goal 2"), GoalDescription(""), Points.create(5), id=2))
+    assert gpm.index_of_goal(2) == 1
+
+    gpm.sort_goals('title')
+    assert [gpm.goal_at_index(i).title.value for i in range(3)] == ["Goal 0", "Goal 1", "Goal 2"]
+    gpm.sort_goals(None)
+    gpm.add_goal(Goal(GoalTitle("Goal A"), GoalDescription(""), Points.create(1), id=6))
+    assert gpm.goal_order is None
+    assert gpm.index_of_goal(6) == 5
+
+
+def test_unknown_sort_order_is_rejected():
+    with pytest.raises(ValidationError):
+        GPM().sort_groups('size')
+
+
+def cascade_fixture() -> GPM:
+    gpm = GPM()
+    gpm.add_topics([Topic(TopicTitle("T1"), id=1), Topic(TopicTitle("T2"), id=2)])
+    gpm.add_groups([GroupProject(GroupName(f"G{i}"), topic_id=1 + i % 2, id=i) for i in range(1, 5)])
+    gpm.add_goals([Goal(GoalTitle(f"Goal {i}"), GoalDescription(""), Points.create(i), id=i) for i in range(1, 3)])
+    gpm.add_group_goals([GroupGoal(group_id=group_id, goal_id=goal_id, id=group_id * 10 + goal_id)
+                         for group_id in range(1, 5) for goal_id in range(1, 3)])
+    return gpm
+
+
+def test_removal_impact_lists_dependents():
+    gpm = cascade_fixture()
+    impact = gpm.topic_removal_impact(2)
+    assert [group.id for group in impact.groups] == [1, 3]
+    assert sorted(gg.id for gg in impact.group_goals) == [11, 12, 31, 32]
+    assert impact.describe() == "This removes 2 groups and 4 assignments"
+    assert gpm.goal_removal_impact(1).describe() == "This removes 4 assignments"
+    assert gpm.group_removal_impact(9) == RemovalImpact()
+    assert not gpm.group_removal_impact(9)
+
+
+def test_cascading_removal_drops_dependents_in_one_batch():
+    gpm = cascade_fixture()
+    batches = []
+    gpm.events.subscribe(batches.append)
+    gpm.sort_groups('name')
+    gpm.remove_topic(gpm.index_of_topic(2), cascade=True)
+    assert [group.id for group in gpm.iter_groups()] == [2, 4]
+    assert [gg.id for gg in gpm.iter_group_goals()] == [21, 22, 41, 42]
+    assert gpm.group_goals_of_goal(1) == (gpm.group_goal_at_index(0), gpm.group_goal_at_index(2))
+    assert gpm.groups_of_topic(2) == ()
+    assert [len(batch) for batch in batches[1:]] == [7]
+
+    gpm.remove_goal(0, cascade=True)
+    assert [gg.goal_id for gg in gpm.iter_group_goals()] == [2, 2]
+    gpm.remove_group(0)
+    assert gpm.number_of_group_goals() == 2
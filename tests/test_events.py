@@ -0,0 +1,137 @@
+import pytest
+
+from gpm_ssd.domain import GPM, Goal, GoalTitle, GoalDescription, Points, GroupGoal, GroupName, GroupProject
+from gpm_ssd.events import (
+    GOALS, GROUPS, GROUP_GOALS, TOPICS, Cleared, EventBus, Inserted, Removed, Reordered, Replaced
+)
+
+
+# ==================== FIXTURES ====================
+
+def goal(goal_id: int, points: int = 1) -> Goal:
+    return Goal(GoalTitle(f"Goal {goal_id}"), GoalDescription("Description"), Points.create(points), id=goal_id)
+
+
+@pytest.fixture
+def recorded():
+    gpm = GPM()
+    deliveries = []
+    gpm.events.subscribe(deliveries.append)
+    return gpm, deliveries
+
+
+def flatten(deliveries: list) -> list:
+    return [event for events in deliveries for event in events]
+
+
+# ==================== TEST EVENT BUS ====================
+
+def test_bus_is_inactive_until_someone_subscribes():
+    bus = EventBus()
+    assert not bus.active
+    unsubscribe = bus.subscribe(lambda events: None)
+    assert bus.active
+    unsubscribe()
+    assert not bus.active
+
+
+def test_batch_delivers_once_when_outermost_scope_exits():
+    bus = EventBus()
+    deliveries = []
+    bus.subscribe(deliveries.append)
+    with bus.batch():
+        bus.publish(Cleared(GOALS))
+        with bus.batch():
+            bus.publish(Cleared(TOPICS))
+        assert deliveries == []
+    bus.publish(Cleared(GROUPS))
+    assert deliveries == [(Cleared(GOALS), Cleared(TOPICS)), (Cleared(GROUPS),)]
+
+
+def test_batch_delivers_even_when_interrupted():
+    bus = EventBus()
+    deliveries = []
+    bus.subscribe(deliveries.append)
+    with pytest.raises(RuntimeError):
+        with bus.batch():
+            bus.publish(Cleared(GOALS))
+            raise RuntimeError()
+    assert deliveries == [(Cleared(GOALS),)]
+
+
+# ==================== TEST GPM EVENTS ====================
+
+def test_gpm_publishes_every_mutation(recorded):
+    gpm, deliveries = recorded
+    first, second, third = goal(1, 2), goal(2, 5), goal(3, 3)
+    gpm.add_goal(first)
+    assert gpm.add_goals([second, third]) == range(1, 3)
+    updated = goal(2, 4)
+    gpm.replace_goal_by_id(2, updated)
+    gpm.replace_goal_by_id(1, goal(1, 1))
+    gpm.sort_goals_by_points()
+    gpm.remove_goal(0)
+    gpm.clear_goals()
+
+    assert deliveries[1] == (Inserted(GOALS, 1, second), Inserted(GOALS, 2, third))
+    assert flatten(deliveries) == [
+        Inserted(GOALS, 0, first),
+        Inserted(GOALS, 1, second),
+        Inserted(GOALS, 2, third),
+        Replaced(GOALS, 1, updated, second),
+        Replaced(GOALS, 0, goal(1, 1), first),
+        Reordered(GOALS),
+        Removed(GOALS, 0, updated),
+        Cleared(GOALS),
+    ]
+
+
+def test_replace_by_id_under_a_kept_order_swaps_in_place_unless_the_key_changes(recorded):
+    gpm, deliveries = recorded
+    gpm.add_goals([goal(1, 5), goal(2, 3), goal(3, 1)])
+    gpm.sort_goals_by_points()
+    deliveries.clear()
+    same_key = Goal(GoalTitle("Goal 2"), GoalDescription("Changed"), Points.create(3), id=2)
+    gpm.replace_goal_by_id(2, same_key)
+    moved = goal(3, 4)
+    gpm.replace_goal_by_id(3, moved)
+
+    assert flatten(deliveries) == [
+        Replaced(GOALS, 1, same_key, goal(2, 3)),
+        Removed(GOALS, 2, goal(3, 1)),
+        Inserted(GOALS, 1, moved),
+    ]
+    assert [gpm.goal_at_index(i).id for i in range(3)] == [1, 3, 2]
+
+def test_subscribers_see_indexes_already_updated(recorded):
+    gpm, _ = recorded
+    seen = []
+    gpm.events.subscribe(lambda events: seen.append(gpm.group_goals_of_group(events[-1].entity.group_id)))
+    group_goal = GroupGoal(group_id=1, goal_id=1, id=1)
+    gpm.add_group_goal(group_goal)
+    assert seen == [(group_goal,)]
+
+
+def test_load_from_publishes_reset(recorded):
+    gpm, deliveries = recorded
+    gpm.add_goal(goal(9))
+    other = GPM()
+    group = GroupProject(GroupName("Group"), topic_id=1, id=1)
+    other.add_group(group)
+    other.add_goal(goal(1))
+    deliveries.clear()
+
+    gpm.load_from(other)
+
+    assert deliveries == [(
+        Cleared(GROUPS), Inserted(GROUPS, 0, group),
+        Cleared(GOALS), Inserted(GOALS, 0, goal(1)),
+        Cleared(TOPICS),
+        Cleared(GROUP_GOALS),
+    )]
+
+
+def test_clear_all_is_one_delivery(recorded):
+    gpm, deliveries = recorded
+    gpm.clear_all()
+    assert deliveries == [(Cleared(GROUPS), Cleared(GOALS), Cleared(TOPICS), Cleared(GROUP_GOALS))]
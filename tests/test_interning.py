@@ -0,0 +1,92 @@
+import gc
+
+import pytest
+from valid8 import ValidationError
+
+from gpm_ssd.domain import GoalTitle, GroupName, GroupProject, Link, Points, Topic
+from gpm_ssd.interning import InternCache, InternStats, intern_stats
+
+
+class Value:
+    def __init__(self, value):
+        self.value = value
+
+
+# ==================== TEST CACHE ====================
+
+def test_equal_values_share_one_instance():
+    cache = InternCache('test', str)
+    built = []
+
+    def build(value):
+        built.append(value)
+        return Value(value)
+
+    first = cache.get('a', build)
+    assert cache.get('a', build) is first
+    assert built == ['a']
+    assert cache.stats() == InternStats(hits=1, misses=1, size=1)
+    assert cache.stats().hit_rate == 0.5
+
+
+def test_entries_are_weak():
+    cache = InternCache('test', str)
+    value = cache.get('a', Value)
+    assert cache.stats().size == 1
+    del value
+    gc.collect()
+    assert cache.stats().size == 0
+
+
+def test_cache_is_bounded():
+    cache = InternCache('test', str, maxsize=2)
+    kept = [cache.get(key, Value) for key in 'abc']
+    assert cache.stats().size == 2
+    assert cache.get('c', Value) is not kept[2]
+    assert cache.get('a', Value) is kept[0]
+
+
+def test_values_of_other_types_bypass_the_cache():
+    cache = InternCache('test', int)
+    one = cache.get(1, Value)
+    assert cache.get(True, Value) is not one
+    assert cache.get(True, Value).value is True
+    assert cache.stats().size == 1
+
+
+def test_failed_build_is_not_cached():
+    cache = InternCache('test', str)
+
+    def build(value):
+        raise ValueError(value)
+
+    with pytest.raises(ValueError):
+        cache.get('a', build)
+    assert cache.stats().size == 0
+
+
+# ==================== TEST DOMAIN ====================
+
+def test_value_objects_are_interned():
+    assert GoalTitle.of('Shared title') is GoalTitle.of('Shared title')
+    assert Points.create(3) is Points.create(3)
+    assert Link.of('') is GroupProject(GroupName('Group'), topic_id=1).link_gui
+
+
+def test_interned_value_objects_still_validate():
+    with pytest.raises(ValidationError):
+        GroupName.of('')
+    with pytest.raises(ValidationError):
+        Points.create(6)
+
+
+def test_decoded_entities_share_value_objects():
+    groups = list(GroupProject.from_dicts([{'id': i, 'name': 'Team', 'topic': 1} for i in (1, 2)], trust=True))
+    topics = [Topic.from_dict({'id': 1, 'title': 'Web'}), Topic.from_dict({'id': 2, 'title': 'Web'})]
+    assert groups[0].name is groups[1].name
+    assert groups[0].link_gui is groups[1].link_django
+    assert topics[0].title is topics[1].title
+
+
+def test_intern_stats_report_every_cache():
+    assert {'GroupName', 'TopicTitle', 'GoalTitle', 'Points', 'Link'} <= set(intern_stats())
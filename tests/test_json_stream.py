@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from gpm_ssd.managers.json_stream import iter_json_array
+
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture
+def records():
+    return [
+        {'id': 1, 'title': 'Goal 1', 'description': 'Désc, with ] and [', 'points': 5},
+        {'id': 2, 'title': 'Goal 2', 'description': '', 'points': 3},
+        123456,
+        -1.5e10,
+        'text',
+        [],
+        {},
+        True,
+        None,
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 16])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_decodes_elements_across_chunk_boundaries(records, chunk_size, indent):
+    data = json.dumps(records, indent=indent, ensure_ascii=False).encode()
+    assert list(iter_json_array(chunked(data, chunk_size))) == records
+
+
+def test_empty_array():
+    assert list(iter_json_array([b' [ ] '])) == []
+
+
+def test_elements_are_yielded_before_the_stream_ends():
+    def chunks():
+        yield b'[{"id": 1}, '
+        raise AssertionError('read ahead')
+
+    assert next(iter_json_array(chunks())) == {'id': 1}
+
+
+@pytest.mark.parametrize('data', [b'', b'{}', b'[1 2]', b'[1,', b'[1,]', b'[1.]', b'[1] x'])
+def test_malformed_arrays_are_rejected(data):
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunked(data, 2)))
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from gpm_ssd.domain import GPM, Goal, GoalTitle, GoalDescription, Points, GroupGoal
+from gpm_ssd.progress import GroupProgress, ProgressTracker
+
+
+# ==================== FIXTURES ====================
+
+def goal(goal_id: int, points: int) -> Goal:
+    return Goal(GoalTitle(f"Goal {goal_id}"), GoalDescription("Description"), Points.create(points), id=goal_id)
+
+
+def recomputed(gpm: GPM, group_id: int) -> GroupProgress:
+    earned = total = completed = assigned = 0
+    for group_goal in gpm.group_goals_of_group(group_id):
+        found = gpm.goal_by_id(group_goal.goal_id)
+        points = found.points.value if found is not None else 0
+        total += points
+        assigned += 1
+        if group_goal.complete:
+            earned += points
+            completed += 1
+    return GroupProgress(group_id, earned, total, completed, assigned)
+
+
+@pytest.fixture
+def gpm():
+    gpm = GPM()
+    gpm.add_goals(goal(i, i) for i in range(1, 4))
+    return gpm
+
+
+# ==================== TEST PROGRESS ====================
+
+def test_tracker_seeds_from_existing_data(gpm):
+    gpm.add_group_goals([GroupGoal(group_id=1, goal_id=1, complete=True, id=1),
+                         GroupGoal(group_id=1, goal_id=3, id=2)])
+    tracker = ProgressTracker(gpm)
+    assert tracker.progress_of(1) == GroupProgress(1, earned=1, total=4, completed=1, assigned=2)
+    assert tracker.progress_of(1).ratio == 0.25
+    assert tracker.progress_of(2) == GroupProgress(2)
+
+
+def test_tracker_follows_random_mutations(gpm):
+    tracker = ProgressTracker(gpm)
+    rng = random.Random(3)
+    next_id = 1
+    for _ in range(500):
+        operation = rng.random()
+        if operation < 0.4 or not gpm.number_of_group_goals():
+            gpm.add_group_goal(GroupGoal(group_id=rng.randint(1, 5), goal_id=rng.randint(1, 5),
+                                         complete=rng.random() < 0.5, id=next_id))
+            next_id += 1
+        elif operation < 0.6:
+            gpm.remove_group_goal(rng.randrange(gpm.number_of_group_goals()))
+        elif operation < 0.85:
+            current = gpm.group_goal_at_index(rng.randrange(gpm.number_of_group_goals()))
+            toggled = GroupGoal(group_id=current.group_id, goal_id=current.goal_id,
+                                complete=not current.complete, id=current.id)
+            gpm.replace_group_goal_by_id(current.id, toggled)
+        elif operation < 0.95:
+            goal_id = rng.randint(1, 5)
+            if gpm.goal_by_id(goal_id) is None:
+                gpm.add_goal(goal(goal_id, rng.randint(1, 5)))
+            else:
+                gpm.replace_goal_by_id(goal_id, goal(goal_id, rng.randint(1, 5)))
+        elif gpm.number_of_goals:
+            gpm.remove_goal(rng.randrange(gpm.number_of_goals))
+        for group_id in range(1, 6):
+            assert tracker.progress_of(group_id) == recomputed(gpm, group_id)
+
+
+def test_tracker_follows_batched_reload(gpm):
+    tracker = ProgressTracker(gpm)
+    staging = GPM()
+    staging.add_goals([goal(1, 5), goal(2, 2)])
+    staging.add_group_goals([GroupGoal(group_id=7, goal_id=1, complete=True, id=1),
+                             GroupGoal(group_id=7, goal_id=2, id=2)])
+    gpm.load_from(staging)
+    assert tracker.progress_of(7) == GroupProgress(7, earned=5, total=7, completed=1, assigned=2)
+
+    gpm.clear_all()
+    assert tracker.leaderboard() == []
+
+
+def test_leaderboard_ranks_by_earned_points(gpm):
+    tracker = ProgressTracker(gpm)
+    for group_id, goal_id in [(1, 1), (2, 3), (3, 2), (3, 1), (4, 3)]:
+        gpm.add_group_goal(GroupGoal(group_id=group_id, goal_id=goal_id, complete=True))
+    assert [progress.group_id for progress in tracker.leaderboard(3)] == [3, 2, 4]
+    assert len(tracker.leaderboard(10)) == 4
+
+
+def test_closed_tracker_stops_listening(gpm):
+    tracker = ProgressTracker(gpm)
+    tracker.close()
+    assert not gpm.events.active
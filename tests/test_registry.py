@@ -0,0 +1,217 @@
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from gpm_ssd.registry import OrderedRegistry
+
+
+@dataclass(frozen=True)
+class Entity:
+    name: str
+    id: int | None = None
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(OrderedRegistry, 'chunk_size', 4)
+    return OrderedRegistry()
+
+
+def assert_consistent(registry: OrderedRegistry, expected: list):
+    assert list(registry) == expected
+    assert len(registry) == len(expected)
+    for position, entity in enumerate(expected):
+        assert registry[position] is entity
+        if entity.id is not None:
+            assert registry.by_id(entity.id) is entity
+            assert registry.position_of(entity.id) == position
+
+
+# ==================== TEST REGISTRY ====================
+
+def test_matches_list_under_random_operations(registry):
+    rng = random.Random(7)
+    expected = []
+    next_id = 1
+    for _ in range(2000):
+        operation = rng.random()
+        if operation < 0.45 or not expected:
+            entity = Entity(f'e{next_id}', next_id)
+            next_id += 1
+            position = rng.randint(0, len(expected))
+            registry.insert(position, entity)
+            expected.insert(position, entity)
+        elif operation < 0.8:
+            position = rng.randrange(len(expected))
+            assert registry.pop(position) is expected.pop(position)
+        elif operation < 0.95:
+            position = rng.randrange(len(expected))
+            entity = Entity(f'r{next_id}', expected[position].id)
+            registry[position] = entity
+            expected[position] = entity
+        else:
+            registry.sort(key=lambda e: e.name)
+            expected.sort(key=lambda e: e.name)
+    assert_consistent(registry, expected)
+
+
+def test_removed_ids_are_forgotten(registry):
+    for i in range(1, 11):
+        registry.append(Entity(str(i), i))
+    registry.pop(0)
+    registry.pop(-1)
+    assert registry.by_id(1) is None
+    assert registry.position_of(10) is None
+    assert registry.position_of(2) == 0
+    assert registry.position_of(9) == 7
+
+
+def test_entities_without_id_are_not_indexed(registry):
+    registry.append(Entity('draft'))
+    assert len(registry) == 1
+    assert registry.by_id(None) is None
+
+
+def test_sort_keeps_ids_and_positions_together(registry):
+    for i, name in enumerate('dbeac', 1):
+        registry.append(Entity(name, i))
+    registry.sort(key=lambda e: e.name, reverse=True)
+    assert [e.name for e in registry] == list('edcba')
+    assert registry.position_of(3) == 0
+    assert registry[registry.position_of(2)].name == 'b'
+
+
+def test_out_of_range_positions_raise(registry):
+    registry.append(Entity('a', 1))
+    with pytest.raises(IndexError):
+        registry[1]
+    with pytest.raises(IndexError):
+        registry.insert(3, Entity('b', 2))
+    with pytest.raises(IndexError):
+        OrderedRegistry().pop()
+
+
+def test_reset_and_clear(registry):
+    registry.reset(Entity(str(i), i) for i in range(1, 20))
+    assert registry.position_of(19) == 18
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.by_id(1) is None
+
+
+def test_replace_by_id_swaps_in_place(registry):
+    entities = [Entity(str(i), i) for i in range(1, 10)]
+    registry.reset(entities)
+    renamed = Entity('renamed', 6)
+    assert registry.replace(6, renamed) is entities[5]
+    entities[5] = renamed
+    assert_consistent(registry, entities)
+    with pytest.raises(KeyError):
+        registry.replace(99, Entity('missing', 99))
+
+
+def test_view_walks_positions_across_chunks(registry):
+    entities = [Entity(str(i), i) for i in range(1, 30)]
+    registry.reset(entities)
+    for start, stop in [(0, 29), (3, 17), (5, 5), (8, 9), (12, 29)]:
+        view = registry.view(start, stop)
+        assert len(view) == stop - start
+        assert list(view) == entities[start:stop]
+        assert all(view[i] is entity for i, entity in enumerate(entities[start:stop]))
+    assert registry.view(3, 10)[-1] is entities[9]
+    assert registry.view(3, 10)[1:3] == entities[4:6]
+    assert list(registry.view()) == entities
+
+
+def test_view_bounds_are_checked(registry):
+    registry.reset(Entity(str(i), i) for i in range(5))
+    for start, stop in [(-1, 2), (3, 2), (0, 6)]:
+        with pytest.raises(IndexError):
+            registry.view(start, stop)
+    with pytest.raises(IndexError):
+        registry.view(1, 3)[2]
+
+
+def test_extend_appends_in_bulk(registry):
+    entities = [Entity(str(i), i) for i in range(1, 4)]
+    registry.reset(entities)
+    more = [Entity(str(i), i) for i in range(4, 20)]
+    assert registry.extend(more) == range(3, 19)
+    assert registry.extend([]) == range(19, 19)
+    assert_consistent(registry, entities + more)
+    registry.insert(5, Entity('x', 99))
+    assert registry.position_of(19) == 19
+
+
+def test_failed_extend_changes_nothing(registry):
+    registry.reset([Entity('a', 1)])
+
+    def broken():
+        yield Entity('b', 2)
+        raise ValueError('stream cut')
+
+    with pytest.raises(ValueError):
+        registry.extend(broken())
+    assert list(registry) == [Entity('a', 1)]
+    assert registry.by_id(2) is None
+
+
+def test_ordered_registry_keeps_key_order_under_random_operations(registry):
+    rng = random.Random(11)
+    key = lambda e: e.name
+    registry.order_by(key)
+    expected = []
+    for entity_id in range(1, 400):
+        operation = rng.random()
+        if operation < 0.6 or not expected:
+            entity = Entity(f'{rng.randint(0, 50):02d}', entity_id)
+            position = registry.append(entity)
+            assert registry[position] is entity
+            expected.append(entity)
+        elif operation < 0.9:
+            removed = registry.pop(rng.randrange(len(expected)))
+            expected.remove(removed)
+        else:
+            batch = [Entity(f'{rng.randint(0, 50):02d}', 1000 * entity_id + i) for i in range(rng.randint(0, 12))]
+            positions = registry.extend(batch)
+            assert [registry[position] for position in positions] == batch
+            expected.extend(batch)
+        assert [e.name for e in registry] == sorted(e.name for e in expected)
+    assert_consistent(registry, list(registry))
+
+
+def test_sort_key_is_computed_once_per_stored_entity(registry):
+    calls = []
+
+    def key(entity):
+        calls.append(entity.id)
+        return entity.name
+
+    registry.order_by(key)
+    for entity_id in range(1, 30):
+        registry.append(Entity(f'{entity_id * 7 % 13:02d}', entity_id))
+    registry.extend([Entity(f'{i % 5:02d}', 100 + i) for i in range(10)])
+    registry.pop(3)
+    registry.replace(5, Entity(registry.by_id(5).name, 5))
+    assert sorted(calls) == sorted([*range(1, 30), *range(100, 110), 5])
+    assert [e.name for e in registry] == sorted(e.name for e in registry)
+    assert_consistent(registry, list(registry))
+
+def test_ties_keep_arrival_order(registry):
+    registry.order_by(lambda e: e.name)
+    first, second = Entity('same', 1), Entity('same', 2)
+    assert registry.append(first) == 0
+    assert registry.append(second) == 1
+    assert registry.extend([Entity('same', 3), Entity('a', 4)]) == [3, 0]
+
+
+def test_positional_changes_drop_the_order(registry):
+    registry.order_by(lambda e: e.name)
+    registry.extend([Entity('b', 1), Entity('a', 2)])
+    registry.insert(0, Entity('z', 3))
+    assert registry.order is None
+    registry.append(Entity('c', 4))
+    assert [e.name for e in registry] == ['z', 'a', 'b', 'c']
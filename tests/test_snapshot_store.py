@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from gpm_ssd.managers import SnapshotStore
+
+
+BASE_URL = 'http://localhost:8000/api/v1/'
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path)
+
+
+def test_save_and_load_round_trip(store):
+    payload = {'groups': [{'id': 1, 'name': 'Group 1'}], 'user_groups': [1]}
+    store.save(BASE_URL, 'alice', payload)
+    assert store.load(BASE_URL, 'alice') == payload
+
+
+def test_load_missing_snapshot(store):
+    assert store.load(BASE_URL, 'alice') is None
+
+
+def test_snapshots_are_per_user_and_base_url(store):
+    store.save(BASE_URL, 'alice', {'owner': 'alice'})
+    assert store.load(BASE_URL, 'bob') is None
+    assert store.load('http://other/api/v1/', 'alice') is None
+    assert store.path_for(BASE_URL, 'alice') != store.path_for(BASE_URL, 'bob')
+
+
+def test_tampered_snapshot_is_rejected(store):
+    store.save(BASE_URL, 'alice', {'groups': []})
+    path = store.path_for(BASE_URL, 'alice')
+    body = json.loads(path.read_text())
+    body['payload']['groups'].append({'id': 99})
+    path.write_text(json.dumps(body))
+    assert store.load(BASE_URL, 'alice') is None
+
+
+def test_corrupted_snapshot_is_rejected(store):
+    store.save(BASE_URL, 'alice', {'groups': []})
+    store.path_for(BASE_URL, 'alice').write_text('{"version": 1, "payl')
+    assert store.load(BASE_URL, 'alice') is None
+
+
+def test_other_version_is_rejected(store):
+    store.save(BASE_URL, 'alice', {'groups': []})
+    path = store.path_for(BASE_URL, 'alice')
+    body = json.loads(path.read_text())
+    body['version'] = SnapshotStore.VERSION + 1
+    path.write_text(json.dumps(body))
+    assert store.load(BASE_URL, 'alice') is None
+
+
+def test_save_leaves_no_temporary_files(store, tmp_path):
+    store.save(BASE_URL, 'alice', {'groups': []})
+    store.save(BASE_URL, 'alice', {'groups': [1]})
+    assert [p.name for p in tmp_path.iterdir()] == [store.path_for(BASE_URL, 'alice').name]
+
+
+def test_discard(store):
+    store.save(BASE_URL, 'alice', {'groups': []})
+    store.discard(BASE_URL, 'alice')
+    store.discard(BASE_URL, 'alice')
+    assert store.load(BASE_URL, 'alice') is None
@@ -0,0 +1,180 @@
+import dataclasses
+import itertools
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol, Union
+from unittest.mock import MagicMock
+
+import pytest
+import typeguard
+from typeguard import TypeCheckError, check_type
+
+from gpm_ssd.domain import (
+    GroupName, TopicTitle, GoalTitle, GoalDescription, Points, Link,
+    Topic, Goal, GroupProject, GroupGoal, UserGroup, GPM
+)
+from valid8 import ValidationError, validate
+
+from validation.constraints import Constraint, char_class, constraint
+from validation.dataclasses import validate_dataclass, compile_validator, _validators
+from validation.regex import pattern
+
+
+# ==================== REFERENCE ====================
+
+def reference_validate_dataclass(dataclass_instance):
+    for field in dataclasses.fields(dataclass_instance):
+        check_type(
+            value=getattr(dataclass_instance, field.name),
+            expected_type=field.type,
+            forward_ref_policy=typeguard.config.forward_ref_policy,
+            typecheck_fail_callback=typeguard.config.typecheck_fail_callback,
+            collection_check_strategy=typeguard.config.collection_check_strategy
+        )
+
+
+def outcome(validate, instance):
+    try:
+        validate(instance)
+        return None
+    except TypeCheckError as e:
+        return str(e)
+
+
+class Named(Protocol):
+    name: str
+
+
+@dataclass
+class Plain:
+    pass
+
+
+ANNOTATIONS = [
+    int, str, bool, float, complex, bytes, type, object, Any, None,
+    int | None, Optional[str], Union[int, str], str | bytes | None, float | None,
+    list, list[int], list[GoalTitle], dict[str, int], tuple, tuple[int, ...], tuple[()],
+    GoalTitle, Points, Link | None, Named, Plain,
+]
+
+VALUES = [
+    0, 1, -5, True, False, 1.5, 2j, '', 'text', b'raw', bytearray(b'raw'), None,
+    [], [1, 'a'], ['a'], [GoalTitle('x')], {}, {'a': 1}, {1: 'a'}, (), (1,), (1, 'a'),
+    int, str, GoalTitle('Title'), Points.create(3), Link(''), Plain(), MagicMock(), object(),
+]
+
+
+# ==================== TEST DIFFERENTIAL ====================
+
+@pytest.mark.parametrize('annotation', ANNOTATIONS, ids=repr)
+def test_compiled_validator_matches_typeguard(annotation):
+    cls = dataclass(type('Holder', (), {'__annotations__': {'value': annotation}}))
+    validator = compile_validator(cls)
+    for value in VALUES:
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'value', value)
+        assert outcome(validator, instance) == outcome(reference_validate_dataclass, instance), value
+
+
+def test_compiled_validator_checks_every_field():
+    @dataclass
+    class Pair:
+        first: int
+        second: str | None
+        third: list[int]
+
+    validator = compile_validator(Pair)
+    for values in itertools.product([1, 'a', None, [1], ['a']], repeat=3):
+        instance = Pair(*values)
+        assert outcome(validator, instance) == outcome(reference_validate_dataclass, instance)
+
+
+def test_domain_objects_validate_as_before():
+    title = GoalTitle('Goal')
+    instances = [
+        GroupName('Group'), TopicTitle('Topic'), title, GoalDescription('Description'), Points.create(2), Link(''),
+        Topic(TopicTitle('Topic'), id=1),
+        Goal(title, GoalDescription('Description'), Points.create(2), id=1),
+        GroupProject(GroupName('Group'), topic_id=1, id=1),
+        GroupGoal(group_id=1, goal_id=1, complete=True, id=1),
+        UserGroup(user_id=1, group_id=1, id=1),
+        GPM(),
+    ]
+    replacements = [None, 0, 'text', True, title, [], [title]]
+    for instance in instances:
+        for field, replacement in itertools.product(dataclasses.fields(instance), replacements):
+            tampered = object.__new__(type(instance))
+            for f in dataclasses.fields(instance):
+                object.__setattr__(tampered, f.name, getattr(instance, f.name))
+            object.__setattr__(tampered, field.name, replacement)
+            assert outcome(validate_dataclass, tampered) == outcome(reference_validate_dataclass, tampered)
+
+
+def test_validators_are_compiled_once_per_class():
+    validate_dataclass(GoalTitle('One'))
+    validator = _validators[GoalTitle]
+    validate_dataclass(GoalTitle('Two'))
+    assert _validators[GoalTitle] is validator
+
+
+def test_rejection_raises_typeguard_error():
+    with pytest.raises(TypeCheckError):
+        GoalTitle(42)
+
+
+# ==================== TEST CONSTRAINTS ====================
+
+REGEXES = [r'^[\x20-\x7E]*$', r'[0-9A-Za-z ;.,_-]*', r'[0-9A-Za-z_-]*', r'[1-5]', r'[a-c]+', r'[^a]*', r'^[\x2D]*$']
+
+STRINGS = ['', ' ', '~', 'abc', 'A-Z_0', 'a b;c.d,e', 'caf\u00e9', '\u2028', 'tab\there', 'new\n', '\x7f', '\x00', '3', '33', '-', '^', ']']
+STRINGS += [chr(code) for code in range(256)] + [f'x{chr(code)}y' for code in range(256)]
+
+
+@pytest.mark.parametrize('regex', REGEXES)
+def test_char_class_predicate_matches_regex(regex):
+    compiled = Constraint('value', regex=regex)
+    for value in STRINGS:
+        assert compiled.accepts(value) == pattern(regex)(value), repr(value)
+
+
+def test_char_class_only_translates_simple_classes():
+    assert char_class(r'^[\x20-\x7E]*$') == ''.join(map(chr, range(0x20, 0x7F)))
+    assert char_class(r'[0-9_-]*') == '-0123456789_'
+    assert char_class(r'[1-5]') is None
+    assert char_class(r'[^a]*') is None
+    assert char_class(r'^[\x2D]*$') is None
+
+
+def outcome_of(check, value):
+    try:
+        check(value)
+        return None
+    except ValidationError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize('rules', [
+    dict(min_len=1, max_len=5, regex=r'^[\x20-\x7E]*$'),
+    dict(min_len=0, max_len=3),
+    dict(min_value=1, max_value=5),
+    dict(min_value=1),
+    dict(regex=r'[1-5]'),
+])
+def test_constraint_raises_same_errors_as_valid8(rules):
+    values = ['', 'ab', 'abcdef', 'a\tb', 0, 1, 5, 6, -1, True, False, 2.5, None, '3']
+    valid8_rules = {key: value for key, value in rules.items() if key != 'regex'}
+    if 'regex' in rules:
+        valid8_rules['custom'] = pattern(rules['regex'])
+    compiled = constraint('value', **rules)
+    for value in values:
+        try:
+            expected = outcome_of(lambda v: validate('value', v, **valid8_rules), value)
+        except TypeError:
+            with pytest.raises(TypeError):
+                compiled(value)
+            continue
+        assert outcome_of(compiled, value) == expected, repr(value)
+
+
+def test_constraints_and_patterns_are_compiled_once():
+    assert constraint('value', min_len=1, max_len=2) is constraint('value', max_len=2, min_len=1)
+    assert pattern(r'[a-z]*') is pattern(r'[a-z]*')
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from gpm_ssd.domain import (
+    GPM, Goal, GoalTitle, GoalDescription, Points, GroupGoal, GroupName, GroupProject, Topic, TopicTitle
+)
+from gpm_ssd.views import UNKNOWN, GroupGoalRow, GroupGoalRows
+
+
+# ==================== FIXTURES ====================
+
+def group(group_id: int, topic_id: int = 1, name: str | None = None) -> GroupProject:
+    return GroupProject(GroupName(name or f"Group {group_id}"), topic_id=topic_id, id=group_id)
+
+
+def goal(goal_id: int, points: int = 1, title: str | None = None) -> Goal:
+    return Goal(GoalTitle(title or f"Goal {goal_id}"), GoalDescription(""), Points.create(points), id=goal_id)
+
+
+def resolved(gpm: GPM) -> list[tuple]:
+    rows = []
+    for group_goal in gpm.iter_group_goals():
+        found_group = gpm.group_by_id(group_goal.group_id)
+        found_goal = gpm.goal_by_id(group_goal.goal_id)
+        topic = gpm.topic_by_id(found_group.topic_id) if found_group is not None else None
+        rows.append((
+            found_group.name.value if found_group else UNKNOWN,
+            topic.title.value if topic else UNKNOWN,
+            found_goal.title.value if found_goal else UNKNOWN,
+            found_goal.points.value if found_goal else 0,
+            group_goal.complete,
+        ))
+    return rows
+
+
+def materialised(view: GroupGoalRows) -> list[tuple]:
+    return [(row.group_name, row.topic_title, row.goal_title, row.points, row.complete) for row in view.rows()]
+
+
+@pytest.fixture
+def gpm():
+    gpm = GPM()
+    gpm.add_topics([Topic(TopicTitle("Topic 1"), id=1), Topic(TopicTitle("Topic 2"), id=2)])
+    gpm.add_groups([group(1), group(2, topic_id=2)])
+    gpm.add_goals([goal(1, 3), goal(2, 5)])
+    return gpm
+
+
+# ==================== TEST GROUP GOAL ROWS ====================
+
+def test_rows_are_resolved_up_front(gpm):
+    gpm.add_group_goal(GroupGoal(group_id=2, goal_id=2, complete=True, id=1))
+    view = GroupGoalRows(gpm)
+    assert list(view.rows()) == [GroupGoalRow(gpm.group_goal_at_index(0), "Group 2", "Topic 2", "Goal 2", 5, True)]
+    assert len(view) == 1
+
+
+def test_rows_follow_random_mutations(gpm):
+    view = GroupGoalRows(gpm)
+    rng = random.Random(5)
+    next_id = 1
+    for _ in range(400):
+        operation = rng.random()
+        if operation < 0.35 or not gpm.number_of_group_goals():
+            gpm.add_group_goal(GroupGoal(group_id=rng.randint(1, 3), goal_id=rng.randint(1, 3),
+                                         complete=rng.random() < 0.5, id=next_id))
+            next_id += 1
+        elif operation < 0.5:
+            gpm.remove_group_goal(rng.randrange(gpm.number_of_group_goals()))
+        elif operation < 0.6:
+            current = gpm.group_goal_at_index(rng.randrange(gpm.number_of_group_goals()))
+            gpm.replace_group_goal_by_id(current.id, GroupGoal(group_id=current.group_id, goal_id=current.goal_id,
+                                                               complete=not current.complete, id=current.id))
+        elif operation < 0.75:
+            group_id = rng.randint(1, 3)
+            renamed = group(group_id, topic_id=rng.randint(1, 3), name=f"Group {rng.random():.3f}")
+            if gpm.group_by_id(group_id) is None:
+                gpm.add_group(renamed)
+            else:
+                gpm.replace_group_by_id(group_id, renamed)
+        elif operation < 0.85:
+            goal_id = rng.randint(1, 3)
+            updated = goal(goal_id, rng.randint(1, 5), title=f"Goal {rng.random():.3f}")
+            if gpm.goal_by_id(goal_id) is None:
+                gpm.add_goal(updated)
+            else:
+                gpm.replace_goal_by_id(goal_id, updated)
+        elif operation < 0.92:
+            topic_id = rng.randint(1, 3)
+            retitled = Topic(TopicTitle(f"Topic {rng.random():.3f}"), id=topic_id)
+            if gpm.topic_by_id(topic_id) is None:
+                gpm.add_topic(retitled)
+            else:
+                gpm.replace_topic_by_id(topic_id, retitled)
+        elif operation < 0.96 and gpm.number_of_groups:
+            gpm.remove_group(rng.randrange(gpm.number_of_groups))
+        elif gpm.number_of_goals:
+            gpm.sort_goals('title')
+            gpm.remove_goal(rng.randrange(gpm.number_of_goals))
+        assert materialised(view) == resolved(gpm)
+
+
+def test_rows_follow_reload_and_clear(gpm):
+    view = GroupGoalRows(gpm)
+    staging = GPM()
+    staging.add_groups([group(5, topic_id=9)])
+    staging.add_group_goals([GroupGoal(group_id=5, goal_id=1, id=1)])
+    gpm.load_from(staging)
+    assert materialised(view) == [("Group 5", UNKNOWN, UNKNOWN, 0, False)]
+
+    gpm.clear_all()
+    assert materialised(view) == []
+    assert len(view) == 0
@@ -0,0 +1,93 @@
+import math
+import re
+from typing import Any, Callable
+
+from valid8 import validate
+
+from validation.regex import pattern
+
+
+class Constraint:
+    def __init__(self, name: str, min_len: int | None = None, max_len: int | None = None,
+                 min_value: int | None = None, max_value: int | None = None, regex: str | None = None):
+        self.name = name
+        self.__rules: dict[str, Any] = {key: value for key, value in (
+            ('min_len', min_len), ('max_len', max_len), ('min_value', min_value), ('max_value', max_value),
+        ) if value is not None}
+        if regex is not None:
+            self.__rules['custom'] = pattern(regex)
+        self.__accepts = _compile(min_len, max_len, min_value, max_value, regex)
+
+    def __call__(self, value) -> None:
+        # valid8 only runs on rejection, to raise exactly the error it always has.
+        if not self.__accepts(value):
+            validate(self.name, value, **self.__rules)
+
+    def accepts(self, value) -> bool:
+        return self.__accepts(value)
+
+
+_registry: dict[tuple, Constraint] = {}
+
+
+def constraint(name: str, **rules) -> Constraint:
+    key = (name, *sorted(rules.items()))
+    compiled = _registry.get(key)
+    if compiled is None:
+        compiled = _registry[key] = Constraint(name, **rules)
+    return compiled
+
+
+def _compile(min_len, max_len, min_value, max_value, regex) -> Callable[[Any], bool]:
+    checks = []
+    if min_len is not None or max_len is not None or regex is not None:
+        checks.append(_text(0 if min_len is None else min_len, math.inf if max_len is None else max_len, regex))
+    if min_value is not None or max_value is not None:
+        checks.append(_number(-math.inf if min_value is None else min_value, math.inf if max_value is None else max_value))
+    if not checks:
+        return lambda value: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: all(check(value) for check in checks)
+
+
+def _text(min_len, max_len, regex) -> Callable[[Any], bool]:
+    charset = None if regex is None else char_class(regex)
+    if regex is None:
+        return lambda value: type(value) is str and min_len <= len(value) <= max_len
+    if charset is not None:
+        # every character in the class: stripping them all leaves nothing behind
+        return lambda value: type(value) is str and min_len <= len(value) <= max_len and not value.strip(charset)
+    fullmatch = re.compile(regex).fullmatch
+    return lambda value: type(value) is str and min_len <= len(value) <= max_len and fullmatch(value) is not None
+
+
+def _number(min_value, max_value) -> Callable[[Any], bool]:
+    return lambda value: type(value) is int and min_value <= value <= max_value
+
+
+_CHAR_CLASS = re.compile(r'\^?\[([^\]^][^\]]*)\]\*\$?')
+_HEX_ESCAPE = re.compile(r'\\x([0-9A-Fa-f]{2})')
+
+
+def char_class(regex: str) -> str | None:
+    """The characters matched by a regex of the form ``^[...]*$``, or None for anything else."""
+    match = _CHAR_CLASS.fullmatch(regex)
+    if match is None:
+        return None
+    escaped = [chr(int(code, 16)) for code in _HEX_ESCAPE.findall(match[1])]
+    body = _HEX_ESCAPE.sub(lambda m: chr(int(m[1], 16)), match[1])
+    if '\\' in body or any(c in '-\\]^' for c in escaped):
+        return None
+    chars = set()
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == '-':
+            if body[i] > body[i + 2]:
+                return None
+            chars.update(map(chr, range(ord(body[i]), ord(body[i + 2]) + 1)))
+            i += 3
+        else:
+            chars.add(body[i])
+            i += 1
+    return ''.join(sorted(chars))
@@ -1,15 +1,66 @@
 import dataclasses
+import types
+import typing
+from typing import Any, Callable
 
 import typeguard
 from typeguard import check_type
 
 
+_validators: dict[type, Callable[[Any], None]] = {}
+
+
 def validate_dataclass(dataclass_instance):
-    for field in dataclasses.fields(dataclass_instance):
-        check_type(
-            value=getattr(dataclass_instance, field.name),
-            expected_type=field.type,
-            forward_ref_policy=typeguard.config.forward_ref_policy,
-            typecheck_fail_callback=typeguard.config.typecheck_fail_callback,
-            collection_check_strategy=typeguard.config.collection_check_strategy
-        )
+    cls = type(dataclass_instance)
+    validator = _validators.get(cls)
+    if validator is None:
+        validator = _validators[cls] = compile_validator(cls)
+    validator(dataclass_instance)
+
+
+def compile_validator(cls: type) -> Callable[[Any], None]:
+    namespace: dict[str, Any] = {'check': _check_field}
+    lines = ['def validate(instance):']
+    for i, field in enumerate(dataclasses.fields(cls)):
+        namespace[f'type_{i}'] = field.type
+        value = f'instance.{field.name}'
+        fast_types = _fast_types(field.type)
+        if fast_types is None:
+            lines.append(f'    check({value}, type_{i})')
+        elif fast_types != (object,):
+            namespace[f'fast_{i}'] = fast_types
+            lines.append(f'    if not isinstance({value}, fast_{i}): check({value}, type_{i})')
+    lines.append('    return None')
+    exec('\n'.join(lines), namespace)
+    validator = namespace['validate']
+    validator.__qualname__ = f'validate_{cls.__qualname__}'
+    return validator
+
+
+def _check_field(value, expected_type):
+    check_type(
+        value=value,
+        expected_type=expected_type,
+        forward_ref_policy=typeguard.config.forward_ref_policy,
+        typecheck_fail_callback=typeguard.config.typecheck_fail_callback,
+        collection_check_strategy=typeguard.config.collection_check_strategy
+    )
+
+
+def _fast_types(annotation) -> tuple[type, ...] | None:
+    # Types whose instances typeguard accepts on a plain isinstance test; anything else
+    # (generics, protocols, tuples, mappings, forward references) always goes to typeguard.
+    if annotation is Any:
+        return (object,)
+    if annotation is None or annotation is types.NoneType:
+        return (types.NoneType,)
+    if isinstance(annotation, types.UnionType) or typing.get_origin(annotation) is typing.Union:
+        members = [_fast_types(arg) for arg in typing.get_args(annotation)]
+        if any(member is None for member in members):
+            return None
+        return tuple(t for member in members for t in member)
+    if (typing.get_origin(annotation) is None and isinstance(annotation, type)
+            and not issubclass(annotation, (tuple, dict))
+            and not getattr(annotation, '_is_protocol', False)):
+        return (annotation,)
+    return None